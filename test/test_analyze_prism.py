@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試拼寫展開分析
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from analyze_prism import compare, top_codes, trace_rules, trie_nodes  # noqa: E402
+from rime_algebra import Projection  # noqa: E402
+
+
+def test_trace_rules():
+    algebra = Projection(["derive/1/6/", "derive/6/5/", "xform/ao/au/", "erase/^x.*$/"])
+    steps, prism = trace_rules(algebra, ["gao1", "kim6", "xa1"])
+    assert [(s["fired"], s["spellings_after"], s["pairs_after"]) for s in steps] == [
+        (2, 5, 5),
+        (3, 8, 8),
+        (3, 8, 8),
+        (3, 5, 5),
+    ]
+    assert steps[0]["fan_out"] == 5 / 3
+    assert sorted(prism) == ["gau1", "gau5", "gau6", "kim5", "kim6"]
+    assert top_codes(prism, ["gao1", "gao1 kim6", "xa1"], 2) == [("gao1 kim6", 6), ("gao1", 3)]
+
+
+def test_trie_nodes():
+    assert trie_nodes(["gau1", "gau5", "g"]) == 5
+    assert trie_nodes([("gau1", "kim6"), ("gau1",)]) == 2
+
+
+def test_compare():
+    baseline = {"prism_bytes": 1000, "table_bytes": 1000, "total_bytes": 2000}
+    result = {"prism_bytes": 1200, "table_bytes": 1000, "total_bytes": 2200}
+    assert compare(result, baseline, 0.1) == ["prism_bytes: 1,000 → 1,200（120%）"]
+    assert compare(result, baseline, 0.2) == []
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試字典轉換效能測試工具
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from benchmark_convert_tlpa_to_bp import DEFAULT_BASELINE, compare, main  # noqa: E402
+
+
+def test_compare():
+    baseline = {"a": {"lines_per_sec": 100.0}, "b": {"calls_per_sec": 100.0}}
+    results = {"a": {"lines_per_sec": 85.0}, "b": {"calls_per_sec": 70.0}, "c": {"calls_per_sec": 1.0}}
+    assert compare(results, baseline, tolerance=0.2) == ["b: calls_per_sec 100 → 70（70%）"]
+
+
+def test_committed_baseline():
+    with open(DEFAULT_BASELINE, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    assert {"convert_call_table", "convert_call_rules", "main_real_dict", "main_synthetic_100000"} <= set(baseline)
+
+
+def test_main_smoke(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["--sizes", "1000", "--repeat", "1000", "--baseline", str(baseline)]
+    assert main(args + ["--save-baseline"]) == 0
+    assert set(json.loads(baseline.read_text(encoding="utf-8"))) == {
+        "convert_call_table",
+        "convert_call_cache",
+        "convert_call_rules",
+        "main_real_dict",
+        "main_synthetic_1000",
+    }
+    # 容許值為 1 時吞吐量不論高低皆不視為退步，只驗證比較流程
+    assert main(args + ["--tolerance", "1"]) == 0
+    assert "未超出基準容許範圍" in capsys.readouterr().out
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試 BP 編碼文法檢查
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from bp_im_chat import find_invalid_codes, is_valid_code  # noqa: E402
+
+JI_KHOO = (
+    "---\nname: bp_ji_khoo\ncolumns:\n  - text\n  - code\n  - weight\n...\n"
+    "寒\tgnua2\t0.6\n"
+    "# 註解\n"
+    "毋\tm6\t0.6\r\n"
+    "\n"
+    "少\tsur3\t0.7\n"
+    "正\tznia1\n"
+    "八\tbat4\t0.8\n"
+    "ㆫ uu1\t0.9\n"
+)
+
+
+def test_is_valid_code():
+    for code in ("gnua2", "ggnua2", "m6", "ng1", "yi1", "wun2", "zian1 ho3", "zian1'ho3"):
+        assert is_valid_code(code), code
+    for code in ("gnua", "bat4", "sur3", "ynia1", "zian1  ho3", "zian1 ", "tsing1#泉", ""):
+        assert not is_valid_code(code), code
+
+
+def test_find_invalid_codes(tmp_path):
+    path = tmp_path / "bp_ji_khoo.dict.yaml"
+    path.write_bytes(JI_KHOO.encode("utf-8"))
+    count, invalid = find_invalid_codes(str(path))
+    assert count == 6
+    assert invalid == [(12, "sur3"), (14, "bat4"), (15, "0.9")]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試 bp_ji_khoo 二進位索引的編譯與查詢
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from bp_ji_khoo_index import BPJiKhooIndex, compile_index  # noqa: E402
+
+JI_KHOO = """\
+---
+name: bp_ji_khoo
+columns:
+  - text # 漢字
+  - code # 拼音
+  - weight # 常用度
+  - stem # 用法舉例
+  - create # 建立時間
+...
+工\tgong1\t0.05\tNA\t2025-02-11
+公\tgong1\t1\tNA\t2025-02-11
+正\tznia1\t0.5\tNA\t2025-02-11
+正\tzing5\t0.8\tNA\t2025-02-11
+# 註解
+光\tgong1\t0.8
+"""
+
+
+def test_compile_and_lookup(tmp_path):
+    dict_path = tmp_path / "bp_ji_khoo.dict.yaml"
+    index_path = tmp_path / "bp_ji_khoo.bpidx"
+    dict_path.write_text(JI_KHOO, encoding="utf-8")
+    assert compile_index(str(dict_path), str(index_path)) == 5
+
+    with BPJiKhooIndex(str(index_path)) as index:
+        assert [e.text for e in index.lookup("gong1")] == ["公", "光", "工"]
+        assert [e.code for e in index.by_text("正")] == ["zing5", "znia1"]
+        assert [e.code for e in index.prefix("z")] == ["zing5", "znia1"]
+        assert index.lookup("gong") == []
+        assert index.lookup("gong1")[1].stem == ""
+
+
+def test_bad_index_closes_file(tmp_path, monkeypatch):
+    import builtins
+
+    path = tmp_path / "bad.bpidx"
+    opened = []
+    real_open = builtins.open
+
+    def tracking_open(*args, **kwargs):
+        f = real_open(*args, **kwargs)
+        opened.append(f)
+        return f
+
+    monkeypatch.setattr(builtins, "open", tracking_open)
+    for data in (b"XXXX" + b"\0" * 64, b"BPJK", b""):
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            BPJiKhooIndex(str(path))
+    assert opened and all(f.closed for f in opened)
@@ -3,60 +3,42 @@
 """
 測試 BP 處理邏輯
 驗證零聲母 BP 格式是否能正確被包裝和處理
+
+候選字註解直接以 rime_algebra 執行方案檔（bp_phing_im.schema.yaml）及 bp_libs.yaml 的
+comment_format 規則產生，不再另行仿寫規則。
 """
 
-import re
-
-def simulate_bp_processing(input_text):
-    """模擬 bp_libs.yaml 的處理流程"""
-    print(f"輸入: {input_text}")
-    
-    # 步驟1：拆解聲母+韻母+聲調（模擬第314行）
-    # 有聲母處理
-    result = re.sub(r'^((?:bb|ln|ggn|gg|zz|[bpmtdlgkzcsjh]).*\d)$', r'〔〉Ø\1〕', input_text)
-    if result != input_text:
-        print(f"有聲母處理: {result}")
-        input_text = result
-    
-    # 步驟2：零聲母 BP 格式處理（模擬第318行，我們新加的規則）
-    result = re.sub(r'^([yw].*\d)$', r'〔〉\1〕', input_text)
-    if result != input_text:
-        print(f"零聲母BP處理: {result}")
-        input_text = result
-    
-    # 步驟3：清除零聲母標記Ø（模擬第324行）
-    result = re.sub(r'〔〉Ø', '〔〉', input_text)
-    if result != input_text:
-        print(f"清除Ø標記: {result}")
-        input_text = result
-    
-    # 步驟4：處理鼻化韻母（模擬第330行）
-    result = re.sub(r'n([iu]?(ai|ao|oo|[aiue]))', r'ⁿ\1', input_text)
-    if result != input_text:
-        print(f"鼻化韻母處理: {result}")
-        input_text = result
-    
-    # 步驟5：其他零聲母保持原樣（移除〔〉標記）
-    result = re.sub(r'〔〉', '〔', input_text)
-    if result != input_text:
-        print(f"移除〉標記: {result}")
-        input_text = result
-    
-    print(f"最終結果: {input_text}")
-    print("-" * 50)
-    return input_text
-
-# 測試案例
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+pytest.importorskip("yaml")
+
+from rime_algebra import load_schema  # noqa: E402
+
+SCHEMA = Path(__file__).resolve().parent.parent / "bp_phing_im.schema.yaml"
+
+# 測試案例：(BP 編碼, 候選字註解)
 test_cases = [
-    "yong2",     # 楊 - 零聲母複合韻母
-    "yi1",       # 伊 - 零聲母單純韻母  
-    "wu6",       # 有 - 零聲母單純韻母
-    "yin1",      # 因 - 零聲母+鼻尾音
-    "wun2",      # 溫 - 零聲母+鼻尾音
-    "kong1",     # 公 - 有聲母
-    "thinn1",    # 聽 - 有聲母+鼻化韻母
+    ("yong2", "〔yong2〕 【ㄧㆲˊ】"),  # 楊 - 零聲母複合韻母
+    ("yi1", "〔yi1〕 【ㄧ】"),  # 伊 - 零聲母單純韻母
+    ("wu6", "〔wu6〕 【ㄨ˫】"),  # 有 - 零聲母單純韻母
+    ("yin1", "〔yin1〕 【ㄧㄣ】"),  # 因 - 零聲母+鼻尾音
+    ("wun2", "〔wun2〕 【ㄨㄣˊ】"),  # 溫 - 零聲母+鼻尾音
+    ("gong1", "〔gong1〕 【ㄍㆲ】"),  # 公 - 有聲母
+    ("tni1", "〔tⁿi1〕 【ㄊㄥㄧ】"),  # 聽 - 有聲母+鼻化韻母
+    ("zian1'ho3", "〔zian1〕 【ㄐㄧㄢ】  〔ho3〕 【ㄏㄜˋ】"),  # 連續輸入
 ]
 
-print("=== BP 處理邏輯測試 ===")
-for case in test_cases:
-    simulate_bp_processing(case)
\ No newline at end of file
+
+@pytest.fixture(scope="module")
+def comment_format():
+    return load_schema(str(SCHEMA))["comment_format"]
+
+
+@pytest.mark.parametrize("code, expected", test_cases)
+def test_bp_processing(comment_format, code, expected):
+    assert comment_format.apply(code) == expected
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試候選字註解對照表
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from build_comment_piau import build_piau, regroup_pairs, render_comment, verify, write_lua  # noqa: E402
+from rime_algebra import Projection  # noqa: E402
+
+# 簡化的 comment_format：每個音節標成 〔拼音〕 【注音】，音節之間以兩個空白分隔
+COMMENT_FORMAT = Projection(
+    [
+        "xform/'/ /",
+        "xform/\\b([a-z]+\\d)\\b/〔$1〕 【$1】/",
+        "xform/】\\s+〔/】  〔/",
+        "xlit/gh/ㄍㄏ/",
+        "xform/【(ㄍ|ㄏ)([a-z]+)/【$1》$2/",
+        "xform/》o/ㆦ/",
+        "xform/》a/ㄚ/",
+    ]
+)
+
+
+def test_render_comment():
+    piau = build_piau(COMMENT_FORMAT, ["go1", "ha2", "bad"])
+    assert piau == {
+        "go1": ("〔ㄍo1〕 【ㄍㆦ1】", ["ㄍo1"], ["ㄍㆦ1"]),
+        "ha2": ("〔ㄏa2〕 【ㄏㄚ2】", ["ㄏa2"], ["ㄏㄚ2"]),
+    }
+    assert render_comment(piau, "go1") == "〔ㄍo1〕 【ㄍㆦ1】"
+    assert render_comment(piau, "go1'ha2") == "〔ㄍo1〕 〔ㄏa2〕  【ㄍㆦ1】 【ㄏㄚ2】"
+    assert render_comment(piau, "go1 bad") is None
+    for code in ("go1", "go1 ha2", "ha2'go1'go1"):
+        assert render_comment(piau, code) == regroup_pairs(COMMENT_FORMAT.apply(code))
+    assert verify(COMMENT_FORMAT, piau, ["go1", "ha2"], samples=20) == (22, [])
+
+
+def test_write_lua(tmp_path):
+    path = tmp_path / "lua" / "demo_comment_piau.lua"
+    write_lua(str(path), {"go1": ('〔go1〕 "\\', ["go1"], [])}, "demo.schema.yaml", 3)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[2:] == ["return {", '  ["go1"] = { "〔go1〕 \\"\\\\", { "go1" }, {  } },', "}"]
+
+
+# 以 Lua 直譯器執行 rime.lua + comment_piau_filter，模擬 Rime 的 Candidate、yield 及候選字清單
+LUA_HARNESS = """
+local function make_cand(text, comment)
+  local c = { type = "table", start = 0, _end = 3, text = text, comment = comment, preedit = "p", quality = 1 }
+  function c:get_genuine() return self end
+  return c
+end
+function Candidate(type, start, _end, text, comment) return make_cand(text, comment) end
+
+return function(schema_id, comments)
+  local out = {}
+  yield = function(cand) table.insert(out, cand.comment) end
+  local env = { engine = { schema = { schema_id = schema_id } } }
+  local input = {}
+  function input:iter()
+    local i = 0
+    return function()
+      i = i + 1
+      if comments[i] ~= nil then return make_cand("字", comments[i]) end
+    end
+  end
+  comment_piau_filter.init(env)
+  comment_piau_filter.func(input, env)
+  return out
+end
+"""
+
+
+def test_comment_piau_filter_lua(tmp_path):
+    # librime-lua 使用 Lua 5.4
+    lua54 = pytest.importorskip("lupa.lua54")
+    root = Path(__file__).resolve().parent.parent
+    piau = build_piau(COMMENT_FORMAT, ["go1", "ha2"])
+    write_lua(str(tmp_path / "demo_comment_piau.lua"), piau, "demo.schema.yaml", 7)
+
+    lua = lua54.LuaRuntime(unpack_returned_tuples=True)
+    lua.execute(f"package.path = {str(tmp_path / '?.lua')!r} .. ';' .. package.path")
+    source = (root / "rime.lua").read_text(encoding="utf-8") + "\n"
+    source += (root / "tools" / "comment_piau_filter.lua").read_text(encoding="utf-8")
+    lua.execute(source)
+    run = lua.execute(LUA_HARNESS)
+
+    formatted = COMMENT_FORMAT.apply("go1 ha2")
+    comments = ["go1", "go1'ha2", "ha2 go1 go1", "go1 bad", formatted, ""]
+    expected = [render_comment(piau, c) or regroup_pairs(c) for c in comments]
+    assert expected[3:] == ["go1 bad", regroup_pairs(formatted), ""]
+    assert list(run("demo", lua.table(*comments)).values()) == expected
+    # 沒有對照表時全部退回 regroup_pairs_safe
+    assert list(run("missing", lua.table(*comments)).values()) == [regroup_pairs(c) for c in comments]
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試字典檔重複及衝突檢查
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from check_ji_khoo import analyze  # noqa: E402
+
+JI_KHOO = (
+    "---\nname: bp_ji_khoo\ncolumns:\n  - text\n  - code\n  - weight\n  - stem\n  - create\n...\n"
+    "公\tgong1\t1\tNA\t2025\n"
+    "公\tgong1\t1\tNA\t2025\n"
+    "正\tznia1\t0.5\tNA\t2025\n"
+    "正\tznia1\t0.6\tNA\t2025\n"
+    "ㆫ uu1\t0.9\tNA\t2025\n"
+    "少\tsiao5\t0.7\t少歲\t\t2025\n"
+)
+
+
+def test_analyze(tmp_path):
+    path = tmp_path / "bp_ji_khoo.dict.yaml"
+    path.write_text(JI_KHOO, encoding="utf-8")
+    result = analyze(str(path))
+
+    assert result["duplicates"] == [("公\tgong1\t1\tNA\t2025", [10, 11])]
+    assert [(t, c) for t, c, _ in result["weight_conflicts"]] == [("正", "znia1")]
+    assert [line_no for line_no, _, _ in result["schema_errors"]] == [14, 15]
+    assert result["stats"]["entries"] == 6
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試【台語音標（TLPA）】→【閩拼（BP）】轉換器
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import io  # noqa: E402
+
+from convert_tlpa_to_bp_for_rime_dict import (  # noqa: E402
+    StageTimer,
+    TLPAToBPConverter,
+    convert_TLPA_phrase_to_BP,
+    convert_TLPA_to_BP,
+    convert_many,
+    main,
+    tng_uann_ji_khoo,
+    tng_uann_ji_khoo_incremental,
+    tng_uann_ji_khoo_timed,
+)
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+
+
+# 測試案例：(TLPA, BP)
+TNG_UANN_LE = [
+    ("tsiann1", "znia1"),   # 正
+    ("kong1", "gong1"),     # 公
+    ("siok8", "siok8"),     # 俗
+    ("i1", "yi1"),          # 伊
+    ("iong5", "yong2"),     # 楊
+    ("u7", "wu6"),          # 有
+    ("uan1", "wan1"),       # 彎
+    ("m7", "m6"),           # 毋
+    ("ng5", "ng2"),         # 黃
+    ("thinn1", "tni1"),     # 聽
+]
+
+
+def test_convert_TLPA_to_BP():
+    for TLPA, BP in TNG_UANN_LE:
+        assert convert_TLPA_to_BP(TLPA) == BP, TLPA
+
+
+def test_invalid_code_passes_through():
+    assert convert_TLPA_to_BP("abc") == "abc"
+    assert convert_TLPA_to_BP("NA") == "NA"
+
+
+def test_convert_TLPA_phrase_to_BP():
+    assert convert_TLPA_phrase_to_BP("tsiann1 ho2") == "znia1 ho3"
+    assert convert_TLPA_phrase_to_BP("tsiann1'ho2") == "znia1'ho3"
+    assert convert_TLPA_phrase_to_BP("kong1") == "gong1"
+
+
+def test_converter_cache():
+    converter = TLPAToBPConverter(cache_size=2)
+    assert converter.convert("kong1") == "gong1"
+    assert converter.convert("kong1") == "gong1"
+    assert (converter.hits, converter.misses) == (1, 1)
+
+    converter.convert("i1")
+    converter.convert("u7")  # 超過上限，最久未用的 kong1 被淘汰
+    converter.convert("kong1")
+    assert converter.cache_info() == {
+        "hits": 1, "misses": 4, "size": 2, "maxsize": 2,
+        "table_hits": 0, "table_size": 0,
+    }
+
+
+def test_convert_many():
+    codes = ["kong1", "i1", "kong1", None, "i1"]
+    assert list(convert_many(codes)) == ["gong1", "yi1", "gong1", None, "yi1"]
+
+    table, indices = convert_many(codes, return_indices=True)
+    assert list(table) == ["gong1", "yi1", None]
+    assert list(indices) == [0, 1, 0, 2, 1]
+
+
+def test_tng_uann_ji_khoo():
+    lines = [
+        "---\n",
+        "name: tl_ji_khoo_peh_ue\n",
+        "...\n",
+        "# 註解\n",
+        "正\ttsiann1\t0.5\n",
+        "\n",
+        "公\tkong1\n",
+    ]
+    assert list(tng_uann_ji_khoo(iter(lines))) == [
+        "---\n",
+        "name: bp_ji_khoo\n",
+        "...\n",
+        "# 註解\n",
+        "正\tznia1\t0.5\n",
+        "\n",
+        "公\tgong1\n",
+    ]
+
+
+def test_parallel_output_matches_serial(tmp_path):
+    infile = str(TOOLS_DIR / "tl_ji_khoo_peh_ue.dict.yaml")
+    serial = tmp_path / "serial.dict.yaml"
+    parallel = tmp_path / "parallel.dict.yaml"
+    main(infile, str(serial))
+    main(infile, str(parallel), jobs=2)
+    assert serial.read_bytes() == parallel.read_bytes()
+
+
+def test_incremental_rebuild(tmp_path):
+    infile = tmp_path / "tl.dict.yaml"
+    outfile = tmp_path / "bp.dict.yaml"
+    infile.write_text("name: tl\n...\n正\ttsiann1\t0.5\n公\tkong1\t0.8\n", encoding="utf-8")
+    assert tng_uann_ji_khoo_incremental(str(infile), str(outfile)) == (0, 4)
+    assert tng_uann_ji_khoo_incremental(str(infile), str(outfile)) == (4, 0)
+
+    infile.write_text("name: tl\n...\n正\ttsiann1\t0.6\n公\tkong1\t0.8\n", encoding="utf-8")
+    assert tng_uann_ji_khoo_incremental(str(infile), str(outfile)) == (3, 1)
+    assert outfile.read_text(encoding="utf-8") == (
+        "name: bp_ji_khoo\n...\n正\tznia1\t0.6\n公\tgong1\t0.8\n"
+    )
+
+
+def test_im_chat_piau_is_up_to_date():
+    import build_im_chat_piau
+
+    assert build_im_chat_piau.main(str(TOOLS_DIR / "tlpa_bp_im_chat_piau.py"), check=True) == 0
+
+
+def test_im_chat_piau_matches_rules():
+    import build_im_chat_piau
+
+    converter = TLPAToBPConverter(im_chat_piau=build_im_chat_piau.kiong_ki_im_chat())
+    rules = TLPAToBPConverter()
+    for TLPA in ("tsiann1", "iong5", "m7", "ng5", "uainnh8", "khoo0", "kong10"):
+        assert converter.convert(TLPA) == rules.convert(TLPA), TLPA
+
+
+def test_im_chat_piau_hash_covers_rule_methods():
+    from convert_tlpa_to_bp_for_rime_dict import tng_uann_piau_hash
+    from tlpa_bp_im_chat_piau import KUI_TSIK_HASH
+
+    class KaiKuiTsikConverter(TLPAToBPConverter):
+        @staticmethod
+        def tng_ling_siann_bu(BP_un_bu: str) -> str:
+            return BP_un_bu
+
+    assert KUI_TSIK_HASH == tng_uann_piau_hash()
+    assert tng_uann_piau_hash(TLPAToBPConverter) == tng_uann_piau_hash()
+    # 只改轉換規則方法、不動對照表，舊的音節對照表也要失效
+    assert tng_uann_piau_hash(KaiKuiTsikConverter) != KUI_TSIK_HASH
+
+
+def test_timed_pipeline_matches_untimed():
+    lines = ["name: tl\n", "...\n", "正\ttsiann1\t0.5\n", "公\tkong1\t0.8\n"]
+    timer = StageTimer()
+    converter = TLPAToBPConverter()
+    fout = io.StringIO()
+    with timer.instrument(converter):
+        tng_uann_ji_khoo_timed(lines, fout, timer, converter.convert_phrase)
+    # 離開 with 區塊後還原為原本的方法
+    assert "tng_siann_bu" not in vars(converter)
+
+    assert fout.getvalue() == "".join(tng_uann_ji_khoo(lines))
+    assert timer.calls["header"] == 2
+    assert timer.calls["entry_parse"] == 2
+    assert timer.calls["initial"] == 2
+    assert timer.calls["write"] == 4
+
+
+def test_main_timings_measures_rules(tmp_path, capsys):
+    infile = tmp_path / "tl.dict.yaml"
+    infile.write_text("name: tl\n...\n正\ttsiann1\t0.5\n公\tkong1\t0.8\n好\tho2\n", encoding="utf-8")
+    main(str(infile), str(tmp_path / "bp.dict.yaml"), timings=True)
+    # 不經音節表，每個不同的音節都走一次轉換規則
+    line = next(line for line in capsys.readouterr().out.splitlines() if "聲母比對" in line)
+    assert line.split()[-1] == "3"
+
+
+def test_mod_convert_timings_restores_module(tmp_path):
+    import mod_convert_TLPA_to_BP as mod
+
+    originals = [mod.tng_siann_bu, mod.tng_un_bu, mod.tng_ling_siann_bu, mod.tng_tiau]
+    infile = tmp_path / "tl.dict.yaml"
+    infile.write_text("name: tl\n...\n正\ttsiann1\n", encoding="utf-8")
+    for _ in range(2):
+        mod.main(str(infile), str(tmp_path / "bp.dict.yaml"), timings=True)
+    assert [mod.tng_siann_bu, mod.tng_un_bu, mod.tng_ling_siann_bu, mod.tng_tiau] == originals
+    assert (tmp_path / "bp.dict.yaml").read_text(encoding="utf-8").endswith("正\tziann1\n")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試字典檔雜湊比對工具
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from diff_ji_khoo import diff_files  # noqa: E402
+
+THAU_BO = "---\nname: ji_khoo\ncolumns:\n  - text\n  - code\n  - weight\n  - stem\n  - create\n...\n"
+
+
+def test_diff_tlpa_against_bp(tmp_path):
+    tlpa = tmp_path / "tl.dict.yaml"
+    bp = tmp_path / "bp.dict.yaml"
+    tlpa.write_text(
+        THAU_BO
+        + "公\tkong1\t1\tNA\t2025\n"
+        + "正\ttsiann1\t0.5\tNA\t2025\n"
+        + "日\tjit8\t0.8\tNA\t2025\n",
+        encoding="utf-8",
+    )
+    bp.write_text(
+        THAU_BO
+        + "正\tzian1\t0.5\tNA\t2025\n"   # 與轉換結果 znia1 不一致
+        + "公\tgong1\t1\tNA\t2025\n"
+        + "伊\tyi1\t0.6\tNA\t2025\n",
+        encoding="utf-8",
+    )
+    result = diff_files(str(tlpa), str(bp), tlpa=True)
+    assert result["missing"] == [("日", "zzit8", "0.8", "2025")]
+    assert result["added"] == [("伊", "yi1", "0.6", "2025")]
+    assert result["reread"] == [("正", "znia1", "zian1", "0.5", "2025")]
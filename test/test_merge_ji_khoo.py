@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試依 import_tables: 合併字典檔
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from merge_ji_khoo import merge_tables  # noqa: E402
+
+MAIN = (
+    "---\nname: tl_ji_khoo\ncolumns:\n  - text\n  - code\n  - weight\n  - stem\n"
+    "import_tables:\n  - tl_ji_khoo_zu_ting\n  # - tl_ji_khoo_pi_tsu\n  - tl_ji_khoo_bo_tsai\n...\n"
+    "玫\tmui5\t0.6\tNA\n"
+    "正\ttsiann1\t0.5\tNA\n"
+)
+ZU_TING = (
+    "---\nname: tl_ji_khoo_zu_ting\ncolumns:\n  - code\n  - text\n...\n"
+    "mui5\t玫\n"
+    "ji7\t字\n"
+)
+
+
+def test_merge_tables(tmp_path):
+    main = tmp_path / "tl_ji_khoo.dict.yaml"
+    main.write_text(MAIN, encoding="utf-8")
+    (tmp_path / "tl_ji_khoo_zu_ting.dict.yaml").write_text(ZU_TING, encoding="utf-8")
+
+    header, entries, report = merge_tables(str(main), tlpa=True)
+
+    assert "import_tables:\n" not in header
+    assert header[1] == "name: bp_ji_khoo\n"
+    assert header[-1] == "...\n"
+    # 主字典優先；匯入字典的欄位依名稱對應
+    assert entries == [
+        ["玫", "bbnui2", "0.6", "NA"],
+        ["正", "znia1", "0.5", "NA"],
+        ["字", "zzi6"],
+    ]
+    assert [(s["name"], s["found"], s["kept"]) for s in report["sources"]] == [
+        ("tl_ji_khoo", True, 2),
+        ("tl_ji_khoo_zu_ting", True, 1),
+        ("tl_ji_khoo_bo_tsai", False, 0),
+    ]
+    assert report["overridden"] == [
+        {"text": "玫", "code": "bbnui2", "source": "tl_ji_khoo_zu_ting", "line": 7, "kept_from": "tl_ji_khoo"}
+    ]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試拼寫運算規則的最佳化
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from optimize_rules import Stage, locate_rules, optimize, verify  # noqa: E402
+
+
+def test_optimize_algebra():
+    rules = [
+        "derive/1/6/",
+        "derive/iek/ik/",  # 從未作用
+        "xform/ao/au/",
+        "derive/ao/o/",  # ao 已被前一條改寫
+        "derive/1/6/",  # 重複
+        "xform/a/A/",
+        "xlit/uA/Ux/",
+    ]
+    stage = Stage("algebra", ["gao1", "kim6"])
+    result = optimize(stage, rules)
+    assert result["never_fired"] == [(2, "derive/iek/ik/")]
+    assert [(i, reason) for i, _, reason in result["shadowed"]] == [
+        (4, "原始資料可比對到，但已被前面的規則改寫"),
+        (5, "作用於 1 筆但結果不變"),
+    ]
+    assert result["fused"] == [([6, 7], "xlit/auA/xUx/")]
+    assert result["rules"] == ["derive/1/6/", "xform/ao/au/", "xlit/auA/xUx/"]
+    assert verify(stage, rules, result["rules"])
+
+
+def test_optimize_strings():
+    rules = ["xform/:/ /", "xform/\\[/ /", "xform/(a)1/$1ˉ/", "xform/(o)1/$1ˉ/"]
+    stage = Stage("comment_format", ["ka1", "ko1:ka1", "[ko1"])
+    result = optimize(stage, rules)
+    # 取代字串含群組參照的 xform 不合併
+    assert result["rules"] == ["xform/(?::)|(?:\\[)/ /", "xform/(a)1/$1ˉ/", "xform/(o)1/$1ˉ/"]
+    assert verify(stage, rules, result["rules"])
+
+
+def test_locate_rules(tmp_path):
+    schema = tmp_path / "demo.schema.yaml"
+    schema.write_text(
+        "speller:\n  algebra:\n    - derive/ei/e/  # 註解\n    # - derive/ou/oo/\n    - 'xform/ao/au/'\n    - derive/ei/e/\n",
+        encoding="utf-8",
+    )
+    assert locate_rules(["derive/ei/e/", "xform/ao/au/", "derive/ei/e/", "derive/ou/oo/"], [str(schema)]) == [
+        "demo.schema.yaml:3",
+        "demo.schema.yaml:5",
+        "demo.schema.yaml:6",
+        None,
+    ]
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試正規表達式效能分析
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from profile_regex import Regex, adversarial, growth_exponent, pattern_units, profile_section  # noqa: E402
+
+
+def test_growth_exponent():
+    assert abs(growth_exponent([(8, 1.0), (16, 2.0), (32, 4.0)]) - 1.0) < 1e-9
+    assert abs(growth_exponent([(8, 1.0), (16, 4.0), (32, 16.0)]) - 2.0) < 1e-9
+    assert growth_exponent([(8, 1.0)]) is None
+
+
+def test_pattern_units():
+    assert pattern_units("〔([^〕]*)n[iu]?") == ["〔".encode(), b"n", b"i", b"a", b"1", b" "]
+    assert pattern_units("(?<=\\d)(?P<x>ng|\\x41)\\b{2,3}$") == [b"n", b"g", b"A", b"a", b"1", b" "]
+    assert pattern_units("\\\\(?:\\.|[\\]z])") == [b"\\", b".", b"]", b"a", b"1", b" "]
+
+
+def test_adversarial():
+    # 巢狀重複：比對失敗時回溯次數隨長度指數成長
+    result = adversarial(Regex.from_rule("xform/^(a+)+$/x/"), budget=0.01)
+    assert result["catastrophic"]
+    assert result["input"] == "'a'×n+'!'"
+
+    # 是否為線性取決於執行時的耗時量測，負載高的機器上不穩定，只檢查量測結果的形式
+    result = adversarial(Regex.from_rule("xform/〔([^〕]*)〕/$1/"), budget=0.01)
+    assert "×n" in result["input"]
+    assert result["points"][0][0] == 8
+
+
+def test_profile_section():
+    section = {
+        "origin": "demo comment_format",
+        "name": "comment_format",
+        "rules": ["xform/'/ /", "xlit/ab/AB/", "xform/\\b([a-z]+\\d)\\b/〔$1〕/"],
+        "inputs": ["ka1", "ko1'ka1"],
+        "long": {},
+        "places": [None] * 3,
+    }
+    results = profile_section(section, budget=0.01, adversarial_cache={})
+    # xlit 沒有正規表達式，不列入
+    assert [r["index"] for r in results] == [1, 3]
+    assert abs(sum(r["share"] for r in results) - 1.0) < 1e-9
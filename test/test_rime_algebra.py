@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試 Rime 拼寫運算引擎
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from rime_algebra import (  # noqa: E402
+    ABBREVIATION,
+    NORMAL,
+    AlgebraError,
+    Calculation,
+    Projection,
+    build_prism,
+    tng_uann_ti_tai,
+)
+
+
+def test_tng_uann_ti_tai():
+    assert tng_uann_ti_tai("i$1$2") == r"i\g<1>\g<2>"
+    assert tng_uann_ti_tai("${1}&") == r"\g<1>&"
+    assert tng_uann_ti_tai("$&$$") == r"\g<0>$"
+
+
+def test_calculation():
+    assert Calculation("xform/ao/au/").apply("gao1") == "gau1"
+    assert Calculation("xform/ao/au/").apply("ga1") is None
+    assert Calculation("derive/^y(ong|ok)(\\d)$/i$1$2/").apply("yong2") == "iong2"
+    assert Calculation("xlit|16532780&|;-_\\/[]7.|").apply("gong1") == "gong;"
+    assert Calculation("xform ([a])([iu])([17285634]) $1$3$2").apply("gai5") == "ga5i"
+    assert Calculation("erase/^x.*$/").apply("xyz") == ""
+    # 與 librime 相同，\b 只認 ASCII 字元
+    assert Calculation("xform/\\b(m\\d)\\b/<$1>/").apply("Øm6") == "Ø<m6>"
+    with pytest.raises(AlgebraError):
+        Calculation("xlit|abc|de|")
+    with pytest.raises(AlgebraError):
+        Calculation("xform/(/x/")
+
+
+def test_build_prism():
+    algebra = Projection(
+        [
+            "derive/ao/au/",
+            "xform/^bbn/m/",
+            "abbrev/^([a-z]).+$/$1/",
+            "erase/^x.*$/",
+            "derive/^([a-z]+)\\d$/$1/",
+        ]
+    )
+    prism = build_prism(algebra, ["gao1", "bbna2", "xa1"])
+    assert prism == {
+        "gao1": {"gao1": NORMAL},
+        "gau1": {"gao1": NORMAL},
+        "gao": {"gao1": NORMAL},
+        "gau": {"gao1": NORMAL},
+        "g": {"gao1": ABBREVIATION},
+        "ma2": {"bbna2": NORMAL},
+        "ma": {"bbna2": NORMAL},
+        "m": {"bbna2": ABBREVIATION},
+    }
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試 Rime 設定檔組合語法的展開及解析快取
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("yaml")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from rime_config import ConfigCache, ConfigError, ConfigResolver, resolve_config  # noqa: E402
+
+LIBS = """\
+hau_suan_ji_tuann:
+  __append:
+    - xform/a/b/
+    - xform/c/d/
+menu:
+  page_size: 5
+  alternative_select_keys: "123456789"
+speller_base:
+  alphabet: ab
+  delimiter: " '"
+"""
+
+SCHEMA = """\
+schema:
+  schema_id: demo
+menu:
+  __include: libs:/menu
+  page_size: 9
+translator:
+  comment_format:
+    __patch:
+      - libs:/hau_suan_ji_tuann
+      - missing:/node?
+  preedit_format:
+    - xform/x/y/
+    - __include: /schema/schema_id
+speller:
+  __include: libs:/speller_base
+  algebra:
+    __include: /translator/preedit_format
+  alphabet/+: z
+  __patch:
+    alphabet/+: q
+    algebra/@next: erase/^q$/
+"""
+
+
+def write(path: Path, text: str) -> str:
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_resolve_config(tmp_path):
+    write(tmp_path / "libs.yaml", LIBS)
+    schema = write(tmp_path / "demo.schema.yaml", SCHEMA)
+    write(tmp_path / "demo.custom.yaml", "patch:\n  menu/page_size: 7\n")
+
+    config = resolve_config(schema, cache_path=None)
+    assert config["menu"] == {"page_size": 7, "alternative_select_keys": "123456789"}
+    assert config["translator"]["comment_format"] == ["xform/a/b/", "xform/c/d/"]
+    assert config["translator"]["preedit_format"] == ["xform/x/y/", "demo"]
+    assert config["speller"] == {
+        "alphabet": "abzq",
+        "delimiter": " '",
+        "algebra": ["xform/x/y/", "demo", "erase/^q$/"],
+    }
+
+    assert resolve_config(schema, cache_path=None, custom=False)["menu"]["page_size"] == 9
+
+
+def test_resolve_errors(tmp_path):
+    loop = write(tmp_path / "loop.yaml", "a:\n  __include: /b\nb:\n  __include: /a\n")
+    with pytest.raises(ConfigError, match="循環參照"):
+        resolve_config(loop, cache_path=None)
+    missing = write(tmp_path / "missing.yaml", "a:\n  __include: nowhere:/x\n")
+    with pytest.raises(ConfigError, match="nowhere.yaml"):
+        resolve_config(missing, cache_path=None)
+
+
+def test_config_cache(tmp_path):
+    write(tmp_path / "libs.yaml", LIBS)
+    schema = write(tmp_path / "demo.schema.yaml", SCHEMA)
+    cache_path = str(tmp_path / "cache.pickle")
+    expected = resolve_config(schema, cache_path=cache_path)
+
+    cache = ConfigCache(cache_path)
+    assert ConfigResolver(cache=cache).resolve_file(schema) == expected
+    assert (cache.hits, cache.misses) == (2, 0)
+
+    # 只改修改時間、內容不變：以雜湊確認後仍使用快取
+    st = os.stat(schema)
+    os.utime(schema, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    cache = ConfigCache(cache_path)
+    ConfigResolver(cache=cache).resolve_file(schema)
+    assert (cache.hits, cache.misses) == (2, 0)
+
+    write(tmp_path / "libs.yaml", LIBS.replace("page_size: 5", "page_size: 6"))
+    cache = ConfigCache(cache_path)
+    ConfigResolver(cache=cache).resolve_file(schema)
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試 Rime 字典檔讀取工具
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from rime_dict import MappedRimeDict, RimeDict  # noqa: E402
+
+JI_KHOO = (
+    "# Rime dictionary\n"
+    "---\n"
+    "name: bp_ji_khoo\n"
+    "columns:\n"
+    "  - text # 漢字\n"
+    "  - code # 拼音\n"
+    "  - weight # 常用度\n"
+    "...\n"
+    "公\tgong1\t1\n"
+    "\n"
+    "# 註解\n"
+    "正\tznia1\t0.5\r\n"
+    "ㆫ uu1\t0.9\n"
+)
+
+
+def test_mapped_matches_text_reader(tmp_path):
+    path = tmp_path / "bp_ji_khoo.dict.yaml"
+    path.write_bytes(JI_KHOO.encode("utf-8"))
+
+    with RimeDict(str(path)) as ji_khoo:
+        assert ji_khoo.columns == ["text", "code", "weight"]
+        rows = [row for _, row in ji_khoo.rows()]
+
+    with MappedRimeDict(str(path)) as ji_khoo:
+        assert ji_khoo.columns == ["text", "code", "weight"]
+        records = [[str(f, "utf-8") for f in record] for record in ji_khoo.records()]
+        assert records == rows
+        assert list(ji_khoo.fields("code")) == [("gong1",), ("znia1",), ("0.9",)]
+        assert list(ji_khoo.fields("weight")) == [("1",), ("0.5",), (None,)]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試離線候選字查詢引擎
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from rime_algebra import Projection, build_prism  # noqa: E402
+from rime_engine import (  # noqa: E402
+    DEFAULT_BASELINE,
+    CandidateEngine,
+    compare_rankings,
+    latency_summary,
+    main,
+    ranking,
+)
+
+# 聲調 1 的按鍵為 ;、聲調 3 的按鍵為 \；另可只打聲母（簡拼）
+ALGEBRA = Projection(
+    [
+        "abbrev/^([a-z]).+$/$1/",
+        "xlit|13|;\\|",
+    ]
+)
+
+ENTRIES = [
+    ("煎", "zian1", 0.1),
+    ("箋", "zian1", 0.01),
+    ("剪", "zian3", 0.8),
+    ("好", "ho3", 0.9),
+    ("賀", "ho3", 0.95),
+    ("戰好", "zian1 ho3", 0.5),
+]
+
+
+def make_engine() -> CandidateEngine:
+    prism = build_prism(ALGEBRA, ["zian1", "zian3", "ho3"])
+    return CandidateEngine(prism, ENTRIES)
+
+
+def test_lookup_keys():
+    engine = make_engine()
+    # 比對到的輸入長者在前（剪 只比對到簡拼 z），其次依 weight
+    assert [c.text for c in engine.lookup("zian;")] == ["煎", "箋", "剪"]
+    assert [c.text for c in engine.lookup("zian;'ho\\")] == ["戰好", "煎", "箋", "剪"]
+    assert [c.text for c in engine.lookup("zian;ho\\", limit=2)] == ["戰好", "煎"]
+    # 全為簡拼：比對長度相同時依 weight，拼寫類型記為 abbrev
+    result = engine.lookup("zh")
+    assert [c.text for c in result] == ["戰好", "剪", "煎", "箋"]
+    assert result[0].length == 2 and result[0].spelling_type == 2
+
+
+def test_lookup_code():
+    engine = make_engine()
+    assert engine.is_code("zian1'ho3")
+    assert not engine.is_code("zian;'ho\\")
+    assert engine.code_to_keys("zian1 ho3") == "zian;'ho\\"
+    assert engine.lookup("zian1'ho3") == engine.lookup("zian;'ho\\")
+    assert engine.lookup("xyz") == []
+    # 結尾或連續的分隔符號不視為音節
+    assert engine.code_to_keys("zian1'ho3'") == "zian;'ho\\"
+    assert engine.lookup("zian1'ho3'") == engine.lookup("zian;'ho\\")
+    assert engine.lookup("zian1''") == engine.lookup("zian;")
+
+
+def test_rankings():
+    engine = make_engine()
+    current = {"zian;": ranking(engine.lookup("zian;", limit=2))}
+    assert current == {"zian;": ["煎\tzian1", "箋\tzian1"]}
+    assert compare_rankings(current, {"zian;": ["箋\tzian1", "煎\tzian1"], "ho\\": []}) == ["zian;"]
+    # 只比對前 top 名
+    assert compare_rankings(current, {"zian;": ["煎\tzian1", "剪\tzian3"]}, top=1) == []
+    summary = latency_summary([0.001, 0.002, 0.003])
+    assert summary["count"] == 3 and summary["p50_us"] == 2000.0
+
+
+def test_committed_baseline(capsys):
+    # 以隨專案提交的基準檔比對真實方案及字典的候選字排序
+    assert main(["--baseline", DEFAULT_BASELINE]) == 0
+    assert main(["--baseline", DEFAULT_BASELINE, "--top", "5"]) == 0
+    assert "排序不同 0 筆" in capsys.readouterr().out
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試連續輸入的音節切分
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from segment_im_chat import Segmenter, evaluate  # noqa: E402
+
+IM_CHAT = ["zi", "zian", "an", "ho", "la", "lang", "ng"]
+FREQ = {"zian1": 5.0, "zi1": 1.0, "an1": 1.0, "ho3": 3.0, "lang2": 4.0, "la2": 1.0, "ng2": 0.5}
+
+
+def make_segmenter() -> Segmenter:
+    return Segmenter(FREQ, im_chat=IM_CHAT, tiau_ho="123")
+
+
+def test_segment():
+    segmenter = make_segmenter()
+    results = segmenter.segment("zian1ho3lang2", top_k=3)
+    assert [r.im_chat for r in results] == [
+        ("zian1", "ho3", "lang2"),
+        ("zi", "an1", "ho3", "lang2"),
+        ("zian1", "ho3", "la", "ng2"),
+    ]
+    assert results[0].score > results[1].score > results[2].score
+    # 不帶聲調
+    assert segmenter.segment("zianholang", top_k=1)[0].im_chat == ("zian", "ho", "lang")
+    # 分隔符號為強制的切分點
+    assert segmenter.segment("zi'an1ho3lang2", top_k=1)[0].im_chat == ("zi", "an1", "ho3", "lang2")
+    assert segmenter.segment("zian1x") == []
+    assert segmenter.segment("") == []
+
+
+def test_evaluate():
+    stats = evaluate(make_segmenter(), [("zian1", "ho3"), ("lang2", "ho3", "zian1")], top_k=2)
+    assert stats["tone"] == {"top1": 1.0, "top2": 1.0}
+    assert stats["keys_saved"] == 3 / (len("zian1'ho3") + len("lang2'ho3'zian1"))
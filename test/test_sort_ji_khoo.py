@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試字典檔外部合併排序
+"""
+
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import sort_ji_khoo  # noqa: E402
+
+HEADER = "---\nname: bp_ji_khoo\ncolumns:\n  - text\n  - code\n  - weight\n...\n"
+ENTRIES = [
+    "正\tznia1\t0.5\n",
+    "公\tgong1\t1\n",
+    "# 註解\n",
+    "工\tgong1\t2\n",
+    "\n",
+    "攻\tgong1\t1\n",
+    "阿\ta1\t0.1\n",
+]
+
+
+def _sort(by: str, run_size: int) -> tuple[str, int]:
+    fout = io.StringIO()
+    skipped = sort_ji_khoo.sort_ji_khoo(io.StringIO(HEADER + "".join(ENTRIES)), fout, by, run_size)
+    return fout.getvalue(), skipped
+
+
+def test_sort_by_code():
+    out, skipped = _sort("code", 1000)
+    assert skipped == 2
+    assert out == HEADER + "阿\ta1\t0.1\n工\tgong1\t2\n公\tgong1\t1\n攻\tgong1\t1\n正\tznia1\t0.5\n"
+
+
+def test_sort_by_weight():
+    out, _ = _sort("weight", 1000)
+    assert out == HEADER + "工\tgong1\t2\n公\tgong1\t1\n攻\tgong1\t1\n正\tznia1\t0.5\n阿\ta1\t0.1\n"
+
+
+def test_external_runs_match_in_memory(monkeypatch):
+    # run_size 為 1 時每行一個 run，且 MAX_FAN_IN 調小以觸發分批合併
+    monkeypatch.setattr(sort_ji_khoo, "MAX_FAN_IN", 2)
+    for by in sort_ji_khoo.SORT_KEYS:
+        assert _sort(by, 1) == _sort(by, 1000)
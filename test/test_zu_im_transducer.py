@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+測試注音按鍵轉換器
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from rime_algebra import Projection, main_spellings  # noqa: E402
+from zu_im_transducer import KeyTransducer, code_line, drills, keys_line, verify  # noqa: E402
+
+# 簡化的注音鍵盤：聲母 z→y、h→c、l→x，韻母 a→8、o→k、n→p、ng→/，聲調 1→:、2→6、3→4
+ALGEBRA = Projection(
+    [
+        "derive/^([a-z]+)\\d$/$1/",  # 衍生拼寫不影響正式拼寫
+        "xform/ng(?=\\d)/G/",
+        "xform/n(?=\\d)/N/",
+        "xlit|zhlaoNG123|ycx8kp/:64|",
+    ]
+)
+PREEDIT = Projection(["xlit|ycx8kp/|ㄗㄏㄌㄚㄜㄣㆭ|", "xform/://", "xform/6/ˊ/", "xform/4/ˋ/"])
+IM_CHAT = ["za1", "zan1", "ho3", "lang2", "lan2", "la2", "ba1"]
+
+
+def make_transducer() -> KeyTransducer:
+    keys_of = main_spellings(ALGEBRA, IM_CHAT)
+    display = {s: PREEDIT.apply(k) for s, k in keys_of.items()}
+    return KeyTransducer(keys_of, display, alphabet="ycx8kp/:64", finals=":64", freq={"lan2": 2.0})
+
+
+def test_main_spellings():
+    assert main_spellings(ALGEBRA, ["zan1", "lang2"]) == {"zan1": "y8p:", "lang2": "x8/6"}
+
+
+def test_transducer():
+    t = make_transducer()
+    # b 不在鍵盤上，不收錄
+    assert t.skipped == [("ba1", "b8:")]
+    assert t.code_to_keys("zan1 ho3'lang2") == ("y8p:'ck4'x8/6", [])
+    assert t.code_to_keys("zan1 ba1") == ("y8p:", ["ba1"])
+    # 按鍵可不加分隔符號，逐鍵確定地切分
+    parsed, errors = t.keys_to_code("y8p:ck4x8/6")
+    assert parsed == [("zan1", "ㄗㄚㄣ"), ("ho3", "ㄏㄜˋ"), ("lang2", "ㄌㄚㆭˊ")]
+    assert errors == []
+    assert t.keys_to_code("y8q:x86y8") == ([("la2", "ㄌㄚˊ")], [0, 7])
+    assert t.keys_to_zu_im("y8:'x86") == "ㄗㄚ ㄌㄚˊ"
+    assert verify(t, PREEDIT, samples=50) == (56, [])
+
+
+def test_drills():
+    t = make_transducer()
+    entries = [("藍", "la2", 0.1), ("好", "ho3", 0.9), ("八", "ba1", 1.0), ("好", "ho3", 0.5)]
+    assert drills(t, entries, 5) == ["好\tho3\tㄏㄜˋ\tck4", "藍\tla2\tㄌㄚˊ\tx86"]
+
+
+def test_ambiguous_keys():
+    # lna2 與 la2 的按鍵相同，取頻率較高的 la2
+    keys_of = {"la2": "x86", "lna2": "x86", "ho3": "ck4"}
+    display = {"la2": "ㄌㄚˊ", "lna2": "ㄌㄋㄚˊ", "ho3": "ㄏㄜˋ"}
+    t = KeyTransducer(keys_of, display, alphabet="ycx8kp/:64", finals=":64", freq={"la2": 2.0})
+    assert t.ambiguous == {"x86": ["la2", "lna2"]}
+    assert t.keys_to_code("x86ck4") == ([("la2", "ㄌㄚˊ"), ("ho3", "ㄏㄜˋ")], [])
+    # 轉換結果另加一欄標示
+    assert keys_line(t, "x86ck4") == ("la2 ho3\tㄌㄚˊ ㄏㄜˋ\t按鍵對應多個音節：x86（la2/lna2）", False, True)
+    assert code_line(t, "lna2'ho3") == ("x86'ck4\tㄌㄋㄚˊ ㄏㄜˋ\t按鍵對應多個音節：x86（la2/lna2）", False, True)
+    assert code_line(t, "ho3") == ("ck4\tㄏㄜˋ", False, False)
+    # 按鍵練習略過含這類按鍵的詞條
+    entries = [("藍", "lna2", 1.0), ("好", "ho3", 0.9), ("拉好", "la2 ho3", 0.8)]
+    assert drills(t, entries, 5) == ["好\tho3\tㄏㄜˋ\tck4"]
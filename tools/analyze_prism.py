@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+analyze_prism.py
+
+分析方案 speller/algebra 的拼寫展開（blow-up），並估計重新部署的成本。
+
+每條 derive 規則（如變調規則 derive/1/6/）都會讓每個音節多出拼寫，拼寫數隨規則數成倍成長。
+本工具以 rime_algebra.py 離線執行拼寫運算，報告：
+    - 每條規則作用的拼寫數、運算前後的拼寫數及「拼寫 → 音節」對照數，與展開倍數
+    - prism 的總大小：拼寫數、對照數、字首樹節點數
+    - 拼寫最多的音節，及可拼出組合最多的編碼（各音節拼寫數相乘）
+    - 以 librime 的檔案結構估計 prism.bin、table.bin 的大小
+    - 部署成本：與「不含 derive、abbrev、fuzz 規則」的情況相比的倍數；
+      提供基準檔時與基準比較，基準檔若記錄了實測的部署秒數，據以換算本次的部署時間
+
+部署時間的估計假設：部署時間與所產生的檔案大小大致成正比。
+大小估計只計主要結構，與實際檔案可能相差一成上下，適合用於比較修改前後，而非絕對值。
+
+用法：
+    python analyze_prism.py [schema_file] [--dict DICT] [--top N] [--baseline FILE] [--save-baseline]
+
+參數：
+    schema_file (可選): 方案檔路徑，預設值：專案根目錄下的 bp_phing_im.schema.yaml
+    --dict            : 字典檔，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    --top             : 列出拼寫最多的音節及編碼各幾個（預設：10）
+    --baseline        : 基準檔路徑；檔案存在時與之比較
+    --save-baseline   : 將本次結果存成基準
+    --deploy-seconds  : 與 --save-baseline 併用，記錄本次方案實測的部署秒數
+    --tolerance       : 估計大小可容許的成長比例（預設：0.1），超過時結束代碼為 1
+    --json            : 另將本次結果寫入此 JSON 檔
+
+範例：
+    # 合併新的 derive 規則前，先存下基準（部署秒數由 Weasel 實測）
+    python analyze_prism.py ../bp_hong_im.schema.yaml --baseline hong_im.json --save-baseline --deploy-seconds 12
+    # 修改方案後與基準比較
+    python analyze_prism.py ../bp_hong_im.schema.yaml --baseline hong_im.json
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import sys
+import time
+
+from rime_algebra import (
+    NORMAL,
+    IM_CHAT_KAN_KEH,
+    AlgebraError,
+    Projection,
+    load_schema_rules,
+    spellings_of,
+)
+from rime_config import ConfigError
+from rime_dict import MappedRimeDict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCHEMA = os.path.join(PROJECT_ROOT, "bp_phing_im.schema.yaml")
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+
+# librime 檔案結構的大小（位元組），用於估計 prism.bin、table.bin
+DARTS_UNIT = 4  # prism 字首樹（double array）每個節點
+SPELLING_LIST = 8  # 每個拼寫的描述子清單（筆數、位移）
+SPELLING_DESCRIPTOR = 16  # 每筆「拼寫 → 音節」描述子（音節編號、類型、可信度、提示）
+STRING_PTR = 4  # 字串位移
+TABLE_ENTRY = 8  # 每筆詞條（文字位移、權重）
+TABLE_INDEX_NODE = 16  # 詞條索引樹每個節點（音節編號、詞條清單、下一層）
+
+
+def _pairs(script: dict[str, dict[str, int]]) -> int:
+    return sum(len(sources) for sources in script.values())
+
+
+def trace_rules(algebra: Projection, im_chat: list[str]) -> tuple[list[dict], dict[str, dict[str, int]]]:
+    """逐條規則執行拼寫運算，回傳 (每條規則的統計, prism)。"""
+    script = {s: {s: NORMAL} for s in im_chat}
+    spellings, pairs = len(script), _pairs(script)
+    steps = []
+    for i, (calc, fired, script) in enumerate(algebra.steps(script), 1):
+        after_spellings, after_pairs = len(script), _pairs(script)
+        steps.append(
+            {
+                "index": i,
+                "rule": calc.source,
+                "kind": calc.kind,
+                "fired": fired,
+                "spellings_before": spellings,
+                "spellings_after": after_spellings,
+                "pairs_before": pairs,
+                "pairs_after": after_pairs,
+                "fan_out": after_pairs / pairs if pairs else 0.0,
+            }
+        )
+        spellings, pairs = after_spellings, after_pairs
+    return steps, script
+
+
+def trie_nodes(words) -> int:
+    """字串集合組成字首樹後的節點數（不含根節點），即不重複的非空字首數。"""
+    prefixes: set[str] = set()
+    for word in words:
+        for end in range(len(word), 0, -1):
+            prefix = word[:end]
+            if prefix in prefixes:
+                break
+            prefixes.add(prefix)
+    return len(prefixes)
+
+
+def read_codes(dict_path: str) -> tuple[int, int, dict[str, int]]:
+    """回傳 (詞條數, 詞條文字的 UTF-8 位元組總數, {編碼: 詞條數})。"""
+    count = 0
+    text_bytes = 0
+    codes: dict[str, int] = {}
+    with MappedRimeDict(dict_path) as ji_khoo:
+        for text, code in ji_khoo.fields("text", "code"):
+            if not code:
+                continue
+            count += 1
+            text_bytes += len(text.encode("utf-8")) + 1
+            codes[code] = codes.get(code, 0) + 1
+    return count, text_bytes, codes
+
+
+def estimate_sizes(prism: dict[str, dict[str, int]], im_chat: list[str], entries: int, text_bytes: int,
+                   codes: dict[str, int]) -> dict:
+    """以 librime 的檔案結構估計 prism.bin、table.bin 的大小（位元組）。"""
+    nodes = trie_nodes(prism)
+    pairs = _pairs(prism)
+    prism_bytes = nodes * DARTS_UNIT + len(prism) * SPELLING_LIST + pairs * SPELLING_DESCRIPTOR
+    # 詞條索引樹：每個編碼的每個音節字首為一個節點
+    index_nodes = trie_nodes(tuple(IM_CHAT_KAN_KEH.split(code)) for code in codes)
+    syllabary_bytes = sum(len(s.encode("utf-8")) + 1 + STRING_PTR for s in im_chat)
+    table_bytes = syllabary_bytes + entries * TABLE_ENTRY + text_bytes + index_nodes * TABLE_INDEX_NODE
+    return {
+        "trie_nodes": nodes,
+        "index_nodes": index_nodes,
+        "prism_bytes": prism_bytes,
+        "table_bytes": table_bytes,
+        "total_bytes": prism_bytes + table_bytes,
+    }
+
+
+def top_im_chat(prism: dict[str, dict[str, int]], n: int) -> list[tuple[str, int]]:
+    """拼寫最多的 n 個音節：[(音節, 拼寫數), ...]。"""
+    counts = {s: len(spellings) for s, spellings in spellings_of(prism).items()}
+    return heapq.nlargest(n, counts.items(), key=lambda item: (item[1], item[0]))
+
+
+def top_codes(prism: dict[str, dict[str, int]], codes, n: int) -> list[tuple[str, int]]:
+    """可拼出組合最多的 n 個編碼：[(編碼, 各音節拼寫數相乘), ...]。"""
+    counts = {s: len(spellings) for s, spellings in spellings_of(prism).items()}
+    combos = (
+        (code, math.prod(counts.get(s, 0) for s in IM_CHAT_KAN_KEH.split(code) if s)) for code in codes
+    )
+    return heapq.nlargest(n, combos, key=lambda item: (item[1], item[0]))
+
+
+def analyze(schema_path: str, dict_path: str, top: int = 10) -> dict:
+    """分析方案的拼寫展開，回傳可存成 JSON 的結果。"""
+    rules = load_schema_rules(schema_path)["algebra"]
+    algebra = Projection(rules)
+    entries, text_bytes, codes = read_codes(dict_path)
+    im_chat = sorted({s for code in codes for s in IM_CHAT_KAN_KEH.split(code) if s})
+
+    t0 = time.perf_counter()
+    steps, prism = trace_rules(algebra, im_chat)
+    seconds = time.perf_counter() - t0
+    sizes = estimate_sizes(prism, im_chat, entries, text_bytes, codes)
+
+    # 不含衍生規則時的 prism，作為展開倍數的比較基礎
+    plain = Projection(rule for rule in rules if not rule.startswith(("derive", "abbrev", "fuzz")))
+    _, plain_prism = trace_rules(plain, im_chat)
+    plain_sizes = estimate_sizes(plain_prism, im_chat, entries, text_bytes, codes)
+
+    return {
+        "schema": os.path.basename(schema_path),
+        "rules": len(algebra),
+        "entries": entries,
+        "codes": len(codes),
+        "im_chat": len(im_chat),
+        "spellings": len(prism),
+        "pairs": _pairs(prism),
+        "algebra_seconds": seconds,
+        **sizes,
+        "plain_total_bytes": plain_sizes["total_bytes"],
+        "blow_up": sizes["total_bytes"] / plain_sizes["total_bytes"],
+        "steps": steps,
+        "top_im_chat": top_im_chat(prism, top),
+        "top_codes": top_codes(prism, codes, top),
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """與基準比較估計大小，回傳超出容許成長的項目說明；未超出則回傳空 list。"""
+    regressions = []
+    for key in ("prism_bytes", "table_bytes", "total_bytes"):
+        before, now = baseline.get(key), result[key]
+        if before and now / before > 1 + tolerance:
+            regressions.append(f"{key}: {before:,} → {now:,}（{now / before:.0%}）")
+    return regressions
+
+
+def _kb(n: int) -> str:
+    return f"{n / 1024:,.1f} KB"
+
+
+def print_report(result: dict, baseline: dict | None):
+    print(f"方案：{result['schema']}，algebra 規則 {result['rules']} 條")
+    print(f"字典：詞條 {result['entries']:,} 筆、編碼 {result['codes']:,} 個、音節 {result['im_chat']:,} 個")
+    print()
+    print(f"{'#':>3} {'規則':<36}{'作用':>8}{'拼寫':>9}{'對照':>9}{'倍數':>7}")
+    print("-" * 72)
+    for step in result["steps"]:
+        rule = step["rule"] if len(step["rule"]) <= 34 else step["rule"][:33] + "…"
+        print(
+            f"{step['index']:>3} {rule:<36}{step['fired']:>8,}{step['spellings_after']:>9,}"
+            f"{step['pairs_after']:>9,}{step['fan_out']:>7.2f}"
+        )
+    print()
+    print(f"prism：拼寫 {result['spellings']:,} 個、對照 {result['pairs']:,} 筆、字首樹節點 {result['trie_nodes']:,} 個")
+    print(f"拼寫運算耗時 {result['algebra_seconds']:.3f} 秒（Python）")
+    print(
+        f"估計大小：prism.bin {_kb(result['prism_bytes'])}、table.bin {_kb(result['table_bytes'])}、"
+        f"合計 {_kb(result['total_bytes'])}"
+    )
+    print(f"衍生規則使部署成本成為原本的 {result['blow_up']:.2f} 倍（不含 derive、abbrev、fuzz 時合計 "
+          f"{_kb(result['plain_total_bytes'])}）")
+
+    if baseline:
+        ratio = result["total_bytes"] / baseline["total_bytes"]
+        print(f"與基準相比：估計大小為基準的 {ratio:.0%}")
+        if baseline.get("deploy_seconds"):
+            print(f"估計部署時間：{baseline['deploy_seconds'] * ratio:.1f} 秒（基準實測 {baseline['deploy_seconds']:.1f} 秒）")
+
+    print("\n拼寫最多的音節：")
+    print("    " + "、".join(f"{s}（{n}）" for s, n in result["top_im_chat"]))
+    print("可拼出組合最多的編碼：")
+    print("    " + "、".join(f"{code}（{n:,}）" for code, n in result["top_codes"]))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="分析拼寫展開並估計部署成本")
+    parser.add_argument("schema_file", nargs="?", default=DEFAULT_SCHEMA, help="方案檔路徑")
+    parser.add_argument("--dict", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--top", type=int, default=10, help="列出拼寫最多的音節及編碼各幾個（預設：10）")
+    parser.add_argument("--baseline", help="基準檔路徑")
+    parser.add_argument("--save-baseline", action="store_true", help="將本次結果存成基準")
+    parser.add_argument("--deploy-seconds", type=float, help="本次方案實測的部署秒數（存入基準）")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="估計大小可容許的成長比例（預設：0.1）")
+    parser.add_argument("--json", help="另將本次結果寫入此 JSON 檔")
+    args = parser.parse_args(argv)
+
+    for path in (args.schema_file, args.dict):
+        if not os.path.exists(path):
+            print(f"錯誤：輸入檔案不存在 - {path}")
+            return 1
+
+    try:
+        result = analyze(args.schema_file, args.dict, args.top)
+    except (AlgebraError, ConfigError) as e:
+        print(f"錯誤：{e}")
+        return 1
+
+    baseline = None
+    if args.baseline and not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(result, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        if not args.baseline:
+            print("錯誤：--save-baseline 須指定 --baseline")
+            return 1
+        if args.deploy_seconds is not None:
+            result["deploy_seconds"] = args.deploy_seconds
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n基準已寫入 {args.baseline}")
+        return 0
+
+    if baseline:
+        regressions = compare(result, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ 部署成本超出基準：")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print("\n✅ 未超出基準容許範圍")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_convert_tlpa_to_bp.py
+
+【台語音標 → 閩拼】字典轉換效能測試工具。
+
+測試項目：
+    - convert_TLPA_to_BP() 單次呼叫耗時（音節表、快取、轉換規則三種路徑）
+    - main() 轉換真實字典檔 tools/tl_ji_khoo_peh_ue.dict.yaml
+    - main() 轉換合成字典檔（預設 10 萬、100 萬、1000 萬行），
+      詞條依真實字典檔的音節分布隨機抽樣產生
+
+每個項目在獨立的子行程中執行，分別記錄耗時、每秒處理行數及記憶體峰值（peak RSS）。
+可將結果存成基準檔（JSON），之後與基準比較，吞吐量下降超過容許值時結束代碼為 1。
+預設基準檔為 tools/benchmark_baseline.json（隨專案提交，以 --sizes 100000 1000000 產生）；
+基準中沒有的項目（如 1000 萬行）不比較。更換測試機器時請以 --save-baseline 重新產生。
+
+用法：
+    python benchmark_convert_tlpa_to_bp.py [--sizes N ...] [--baseline FILE] [--save-baseline]
+
+範例：
+    # 只測 10 萬行的合成字典，並存成基準
+    python benchmark_convert_tlpa_to_bp.py --sizes 100000 --save-baseline
+
+    # 與基準比較，吞吐量下降超過 20% 即視為退步
+    python benchmark_convert_tlpa_to_bp.py --sizes 100000 --tolerance 0.2
+
+    # 重新產生隨專案提交的基準檔
+    python benchmark_convert_tlpa_to_bp.py --sizes 100000 1000000 --save-baseline
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows 無 resource 模組，不記錄記憶體峰值
+    resource = None
+
+import convert_tlpa_to_bp_for_rime_dict as tng_uann
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 真實字典檔
+JI_KHOO_FILE = os.path.join(TOOLS_DIR, "tl_ji_khoo_peh_ue.dict.yaml")
+
+# 預設基準檔（隨專案提交）
+DEFAULT_BASELINE = os.path.join(TOOLS_DIR, "benchmark_baseline.json")
+
+# 合成字典檔預設行數
+DEFAULT_SIZES = [100_000, 1_000_000, 10_000_000]
+
+
+def peak_rss_mb() -> float | None:
+    """目前行程的記憶體峰值（MB）；不支援的平台回傳 None。"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 為單位，macOS 以 byte 為單位
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def thak_su_tiau(path: str) -> tuple[list[str], list[str]]:
+    """讀取字典檔，回傳（標頭區各行, 詞條區各行）。"""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = iter(f)
+        thau_bo = list(tng_uann.thak_thau_bo(lines, ji_khoo_name=None))
+        su_tiau = [line for line in lines if line.strip() and not line.startswith("#")]
+    return thau_bo, su_tiau
+
+
+def build_synthetic(path: str, lines: int, seed: int = 0):
+    """
+    依真實字典檔的音節分布產生 lines 行的合成字典檔。
+    漢字、權重、建立時間亦自真實詞條中抽樣，以貼近實際的行長度。
+    """
+    thau_bo, su_tiau = thak_su_tiau(JI_KHOO_FILE)
+    rows = [line.rstrip("\n").split("\t") for line in su_tiau]
+    rows = [r for r in rows if len(r) >= 2]
+    hun_po = Counter(r[1] for r in rows)
+    codes, weights = list(hun_po), list(hun_po.values())
+
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.writelines(thau_bo)
+        pun = 10_000
+        for start in range(0, lines, pun):
+            n = min(pun, lines - start)
+            sampled_codes = rng.choices(codes, weights, k=n)
+            sampled_rows = rng.choices(rows, k=n)
+            f.writelines(
+                "\t".join([row[0], code, *row[2:]]) + "\n"
+                for code, row in zip(sampled_codes, sampled_rows)
+            )
+
+
+def _bench_convert_call(repeat: int) -> dict:
+    """（子行程）測試 convert_TLPA_to_BP 單次呼叫耗時。"""
+    _, su_tiau = thak_su_tiau(JI_KHOO_FILE)
+    codes = [line.split("\t")[1] for line in su_tiau if "\t" in line]
+    codes = (codes * (repeat // len(codes) + 1))[:repeat]
+
+    result = {}
+    cases = {
+        "table": tng_uann.TLPAToBPConverter(im_chat_piau=tng_uann.IM_CHAT_PIAU),
+        "cache": tng_uann.TLPAToBPConverter(),
+        "rules": None,
+    }
+    for name, converter in cases.items():
+        convert = converter.convert if converter else tng_uann.TLPAToBPConverter().tng_uann
+        t0 = time.perf_counter()
+        for code in codes:
+            convert(code)
+        elapsed = time.perf_counter() - t0
+        result[f"convert_call_{name}"] = {
+            "seconds": elapsed,
+            "ns_per_call": elapsed / len(codes) * 1e9,
+            "calls_per_sec": len(codes) / elapsed,
+        }
+    return result
+
+
+def _bench_main(infile: str, jobs: int) -> dict:
+    """（子行程）以 main() 轉換 infile，回傳耗時、行數及記憶體峰值。"""
+    with open(infile, "rb") as f:
+        lines = sum(1 for _ in f)
+    with tempfile.TemporaryDirectory() as tmp:
+        outfile = os.path.join(tmp, "bp.dict.yaml")
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w", encoding="utf-8")
+        try:
+            t0 = time.perf_counter()
+            tng_uann.main(infile, outfile, jobs=jobs)
+            elapsed = time.perf_counter() - t0
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+    return {
+        "lines": lines,
+        "seconds": elapsed,
+        "lines_per_sec": lines / elapsed,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_isolated(func, *args):
+    """在全新的子行程中執行 func，使記憶體峰值互不影響。"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(func, *args).result()
+
+
+def run_benchmarks(sizes: list[int], jobs: int = 1, repeat: int = 1_000_000) -> dict:
+    results = run_isolated(_bench_convert_call, repeat)
+    results["main_real_dict"] = run_isolated(_bench_main, JI_KHOO_FILE, jobs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"synthetic_{size}.dict.yaml")
+            build_synthetic(path, size)
+            results[f"main_synthetic_{size}"] = run_isolated(_bench_main, path, jobs)
+            os.unlink(path)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """與基準比較吞吐量，回傳退步項目的說明；未退步則回傳空 list。"""
+    regressions = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        key = "lines_per_sec" if "lines_per_sec" in now else "calls_per_sec"
+        ratio = now[key] / before[key]
+        if ratio < 1 - tolerance:
+            regressions.append(f"{name}: {key} {before[key]:,.0f} → {now[key]:,.0f}（{ratio:.0%}）")
+    return regressions
+
+
+def print_report(results: dict, baseline: dict | None):
+    print(f"{'項目':<28}{'耗時(s)':>10}{'吞吐量':>18}{'peak RSS(MB)':>14}{'對基準':>9}")
+    print("-" * 79)
+    for name, r in results.items():
+        if "lines_per_sec" in r:
+            rate, unit = r["lines_per_sec"], "lines/s"
+        else:
+            rate, unit = r["calls_per_sec"], "calls/s"
+        rss = r.get("peak_rss_mb")
+        rss_text = f"{rss:,.1f}" if rss is not None else "N/A"
+        before = (baseline or {}).get(name)
+        if before:
+            key = "lines_per_sec" if "lines_per_sec" in r else "calls_per_sec"
+            vs = f"{r[key] / before[key]:.0%}"
+        else:
+            vs = "-"
+        print(f"{name:<28}{r['seconds']:>10.3f}{rate:>11,.0f} {unit:<7}{rss_text:>13}{vs:>9}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="字典轉換效能測試")
+    parser.add_argument(
+        "--sizes", type=int, nargs="*", default=DEFAULT_SIZES,
+        help="合成字典檔的行數（預設：100000 1000000 10000000）",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="main() 使用的行程數（預設：1）")
+    parser.add_argument("--repeat", type=int, default=1_000_000, help="單次呼叫測試的呼叫次數")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基準檔路徑")
+    parser.add_argument("--save-baseline", action="store_true", help="將本次結果存成基準")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="吞吐量可容許的下降比例（預設：0.2）")
+    parser.add_argument("--json", help="另將本次結果寫入此 JSON 檔")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, jobs=args.jobs, repeat=args.repeat)
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(results, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n基準已寫入 {args.baseline}")
+        return 0
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ 效能退步：")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print("\n✅ 未超出基準容許範圍")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
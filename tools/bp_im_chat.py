@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bp_im_chat.py
+
+【閩拼（BP）】合法音節文法，及據以檢查字典檔 code 欄的工具。
+
+合法音節由轉換規則推導：以 build_im_chat_piau.py 的 TLPA 聲母、韻母一覽表窮舉所有組合，
+經轉換規則得到的 BP 無調號音節（含零聲母的 y、w），再接上 BP 聲調（1、2、3、5、6、7、8 及輕聲 0）。
+這些音節先組成字首樹（trie），再編譯成單一個錨定的正規表達式：
+樹上同一節點的各分支首字都不同，比對時不需回溯，效果等同 DFA。
+
+檢查字典檔時，整個詞條區以 mmap 交給同一個正規表達式一次掃描，
+只有 code 欄不合法的詞條才回到 Python 處理，每秒可檢查數百萬筆詞條。
+
+用法：
+    python bp_im_chat.py [dict_file] [--limit N]
+
+參數：
+    dict_file (可選): 字典檔路徑，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+結束代碼：
+    0 表示所有編碼皆合法，1 表示有不合法的編碼
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+from build_im_chat_piau import kiong_ki_im_chat
+from convert_tlpa_to_bp_for_rime_dict import BP_TIAU_HO_PIAU
+from rime_dict import MappedRimeDict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+
+# BP 合法的無調號音節
+BP_IM_CHAT = frozenset(kiong_ki_im_chat().values())
+
+# BP 聲調：轉換規則的輸出調號，及輕聲 0
+BP_TIAU_HO = "".join(sorted({"0", *BP_TIAU_HO_PIAU.values()}))
+
+# 多音節編碼的音節分隔符號
+BP_KAN_KEH = " '"
+
+
+def trie_regex(words) -> str:
+    """將字串集合組成字首樹，輸出等價且不需回溯的正規表達式（不含錨點）。"""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        optional = "" in node
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1:
+            body = branches[0]
+            if optional:
+                return f"(?:{body})?" if len(body) > 1 else f"{body}?"
+            return body
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if optional else body
+
+    return render(trie)
+
+
+def im_chat_regex() -> str:
+    """單一 BP 音節（含聲調）的正規表達式。"""
+    return f"{trie_regex(BP_IM_CHAT)}[{BP_TIAU_HO}]"
+
+
+def code_regex() -> str:
+    """BP 編碼（一或多個音節，以空白或 ' 分隔）的正規表達式（不含錨點）。"""
+    im_chat = im_chat_regex()
+    return f"{im_chat}(?:[{BP_KAN_KEH}]{im_chat})*"
+
+
+# 單一編碼的完整比對
+BP_CODE_PIAU_KIAT = re.compile(f"(?:{code_regex()})\\Z")
+
+
+def is_valid_code(code: str) -> bool:
+    """code 是否為合法的 BP 編碼。"""
+    return BP_CODE_PIAU_KIAT.match(code) is not None
+
+
+def invalid_line_regex(code_i: int) -> bytes:
+    """
+    比對「code 欄不合法」的詞條行（bytes，供 MappedRimeDict.scan() 使用）：
+    略過註解行，跳過 code 欄之前的 code_i 個欄位，code 欄不符文法時擷取為 code 群組。
+    沒有 code 欄的詞條（如 tab 誤打成空白）不在此列，由 check_ji_khoo.py 檢查。
+    """
+    skip = "[^\t\n]*\t" * code_i
+    pattern = f"(?!#){skip}(?!(?:{code_regex()})(?:\t|\r?$))(?P<code>[^\t\r\n]*)"
+    return pattern.encode("ascii")
+
+
+def find_invalid_codes(path: str) -> tuple[int, list[tuple[int, str]]]:
+    """掃描字典檔，回傳 (詞條數, [(行號, 不合法的編碼), ...])。"""
+    with MappedRimeDict(path) as ji_khoo:
+        code_i = ji_khoo.column_index("code")
+        if code_i is None:
+            raise KeyError("字典檔未宣告欄位：code")
+        pattern = invalid_line_regex(code_i)
+        invalid = [(line_no, m.group("code").decode("utf-8")) for line_no, m in ji_khoo.scan(pattern)]
+        count = ji_khoo.count_entries()
+    return count, invalid
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="檢查字典檔 code 欄是否為合法的 BP 編碼")
+    parser.add_argument("dict_file", nargs="?", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--limit", type=int, default=20, help="最多列出幾筆（預設：20）")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.dict_file):
+        print(f"錯誤：輸入檔案不存在 - {args.dict_file}")
+        return 2
+
+    t0 = time.perf_counter()
+    count, invalid = find_invalid_codes(args.dict_file)
+    elapsed = time.perf_counter() - t0
+
+    print(f"字典檔：{args.dict_file}")
+    print(f"詞條 {count} 筆，不合法的編碼 {len(invalid)} 筆（{elapsed:.3f} 秒）")
+    for line_no, code in invalid[: args.limit]:
+        print(f"    第 {line_no} 行：{code!r}")
+    if len(invalid) > args.limit:
+        print(f"    …（其餘 {len(invalid) - args.limit} 筆略）")
+    if invalid:
+        common = Counter(code for _, code in invalid).most_common(5)
+        print("最常見：" + "、".join(f"{code}（{n}）" for code, n in common))
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
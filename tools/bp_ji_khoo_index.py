@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bp_ji_khoo_index.py
+
+將 Rime 字典檔（預設 bp_ji_khoo.dict.yaml）編譯成精簡的二進位索引檔（*.bpidx），
+查詢時以 mmap 開啟，可依編碼、編碼前綴或漢字查詢詞條，不必再解析 YAML。
+
+用法：
+    python bp_ji_khoo_index.py build [dict_file] [index_file]
+    python bp_ji_khoo_index.py code   <code>   [--index index_file]
+    python bp_ji_khoo_index.py prefix <prefix> [--index index_file]
+    python bp_ji_khoo_index.py text   <漢字>   [--index index_file]
+
+預設值：
+    dict_file  : 專案根目錄下的 bp_ji_khoo.dict.yaml
+    index_file : 專案根目錄下的 bp_ji_khoo.bpidx
+
+索引檔格式（所有整數為 little-endian uint32，位置皆 4 位元組對齊）：
+    檔頭      : MAGIC "BPJK"、版本、詞條數 n、字串數 m，以及下列各區的起點
+    字串池    : 所有欄位值去重後（interning）的 UTF-8 位元組，及 m+1 個起點位移
+    詞條表    : text、code、stem、create 各 n 個字串編號，weight 為 n 個 float32（array('f')）
+    編碼索引  : 依 (code, -weight) 排序的 n 個詞條編號，供二分搜尋編碼及前綴
+    漢字索引  : 依 (text, -weight) 排序的 n 個詞條編號
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+from rime_dict import RimeDict, open_output, parse_weight
+
+MAGIC = b"BPJK"
+VERSION = 1
+
+# 檔頭：MAGIC、版本、n、m、字串位移區、字串區、字串區長度、詞條表、編碼索引、漢字索引
+HEADER = struct.Struct("<4s9I")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+DEFAULT_INDEX = os.path.join(PROJECT_ROOT, "bp_ji_khoo.bpidx")
+
+
+class Entry(NamedTuple):
+    text: str
+    code: str
+    weight: float
+    stem: str
+    create: str
+
+
+def _u32(values) -> bytes:
+    arr = array("I", values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _f32(values) -> bytes:
+    arr = array("f", values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % 4)
+
+
+def compile_index(dict_path: str, index_path: str) -> int:
+    """編譯 dict_path 為二進位索引並寫入 index_path（原子性更名），回傳詞條數。"""
+    pool: dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        sid = pool.get(s)
+        if sid is None:
+            sid = pool[s] = len(pool)
+        return sid
+
+    texts, codes, stems, creates = array("I"), array("I"), array("I"), array("I")
+    weights = array("f")
+    def field(row: list[str], i: int | None) -> str:
+        return row[i] if i is not None and i < len(row) else ""
+
+    with RimeDict(dict_path) as ji_khoo:
+        text_i, code_i, weight_i, stem_i, create_i = (ji_khoo.column_index(name) for name in Entry._fields)
+        for _, row in ji_khoo.rows():
+            texts.append(intern(field(row, text_i)))
+            codes.append(intern(field(row, code_i)))
+            stems.append(intern(field(row, stem_i)))
+            creates.append(intern(field(row, create_i)))
+            weights.append(parse_weight(field(row, weight_i)))
+
+    strings = [s.encode("utf-8") for s in pool]
+    offsets = [0]
+    for b in strings:
+        offsets.append(offsets[-1] + len(b))
+    blob = b"".join(strings)
+
+    n = len(codes)
+    code_order = sorted(range(n), key=lambda i: (strings[codes[i]], -weights[i]))
+    text_order = sorted(range(n), key=lambda i: (strings[texts[i]], -weights[i]))
+
+    sections = [
+        _u32(offsets),
+        _pad(blob),
+        _u32(texts) + _u32(codes) + _u32(stems) + _u32(creates) + _f32(weights),
+        _u32(code_order),
+        _u32(text_order),
+    ]
+    starts = []
+    pos = HEADER.size
+    for data in sections:
+        starts.append(pos)
+        pos += len(data)
+    header = HEADER.pack(
+        MAGIC, VERSION, n, len(strings),
+        starts[0], starts[1], len(blob), starts[2], starts[3], starts[4],
+    )
+
+    with open_output(index_path, binary=True) as f:
+        f.write(header)
+        for data in sections:
+            f.write(data)
+    return n
+
+
+class BPJiKhooIndex:
+    """
+    以 mmap 開啟二進位索引檔，提供依編碼、編碼前綴及漢字的查詢。
+    各區直接以 memoryview 對應到 mmap，不複製資料；只有查到的詞條才解碼成字串。
+    """
+
+    def __init__(self, path: str):
+        self._f = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._f.close()
+            raise
+        try:
+            if len(self._mm) < HEADER.size:
+                raise ValueError(f"不是 bp_ji_khoo 索引檔（或版本不符）：{path}")
+            (magic, version, n, m, off_offsets, off_blob, blob_len,
+             off_entries, off_code, off_text) = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"不是 bp_ji_khoo 索引檔（或版本不符）：{path}")
+            if sys.byteorder != "little":
+                raise ValueError("索引檔為 little-endian 格式，不支援目前的平台")
+        except BaseException:
+            self._mm.close()
+            self._f.close()
+            raise
+
+        view = memoryview(self._mm)
+        self.n = n
+        self._offsets = view[off_offsets : off_offsets + 4 * (m + 1)].cast("I")
+        self._blob = view[off_blob : off_blob + blob_len]
+        e = off_entries
+        self._texts = view[e : e + 4 * n].cast("I")
+        self._codes = view[e + 4 * n : e + 8 * n].cast("I")
+        self._stems = view[e + 8 * n : e + 12 * n].cast("I")
+        self._creates = view[e + 12 * n : e + 16 * n].cast("I")
+        self._weights = view[e + 16 * n : e + 20 * n].cast("f")
+        self._code_order = view[off_code : off_code + 4 * n].cast("I")
+        self._text_order = view[off_text : off_text + 4 * n].cast("I")
+
+    def _bytes(self, sid: int) -> bytes:
+        return bytes(self._blob[self._offsets[sid] : self._offsets[sid + 1]])
+
+    def _str(self, sid: int) -> str:
+        return self._bytes(sid).decode("utf-8")
+
+    def entry(self, i: int) -> Entry:
+        """第 i 筆詞條（依字典檔原順序）。"""
+        return Entry(
+            self._str(self._texts[i]),
+            self._str(self._codes[i]),
+            self._weights[i],
+            self._str(self._stems[i]),
+            self._str(self._creates[i]),
+        )
+
+    def _range(self, order, column, key: bytes, prefix: bool) -> range:
+        def sort_key(k: int) -> bytes:
+            return self._bytes(column[order[k]])
+
+        lo = bisect_left(range(self.n), key, key=sort_key)
+        if prefix:
+            # 前綴比對：大於所有以 key 起頭字串的最小值
+            hi = bisect_left(range(lo, self.n), key + b"\xff", key=sort_key) + lo
+        else:
+            hi = bisect_right(range(lo, self.n), key, key=sort_key) + lo
+        return range(lo, hi)
+
+    def lookup(self, code: str) -> list[Entry]:
+        """編碼完全相同的詞條，依 weight 由大到小。"""
+        order = self._code_order
+        return [self.entry(order[k]) for k in self._range(order, self._codes, code.encode("utf-8"), False)]
+
+    def prefix(self, prefix: str, limit: int | None = None) -> list[Entry]:
+        """編碼以 prefix 起頭的詞條，依編碼排序、同編碼依 weight 由大到小。"""
+        order = self._code_order
+        hits = self._range(order, self._codes, prefix.encode("utf-8"), True)
+        if limit is not None:
+            hits = hits[:limit]
+        return [self.entry(order[k]) for k in hits]
+
+    def by_text(self, text: str) -> list[Entry]:
+        """漢字（text 欄）完全相同的詞條，依 weight 由大到小。"""
+        order = self._text_order
+        return [self.entry(order[k]) for k in self._range(order, self._texts, text.encode("utf-8"), False)]
+
+    def close(self):
+        # 釋放所有 memoryview 後才能關閉 mmap
+        for name in ("_offsets", "_blob", "_texts", "_codes", "_stems", "_creates",
+                     "_weights", "_code_order", "_text_order"):
+            getattr(self, name).release()
+        self._mm.close()
+        self._f.close()
+
+    def __enter__(self) -> "BPJiKhooIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _print_entries(entries: list[Entry]):
+    if not entries:
+        print("（查無詞條）")
+    for e in entries:
+        print(f"{e.text}\t{e.code}\t{e.weight:g}\t{e.stem}\t{e.create}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="bp_ji_khoo 二進位索引：編譯與查詢")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="將字典檔編譯成索引檔")
+    build.add_argument("dict_file", nargs="?", default=DEFAULT_DICT)
+    build.add_argument("index_file", nargs="?", default=DEFAULT_INDEX)
+
+    for name, help_text in (("code", "依編碼查詢"), ("prefix", "依編碼前綴查詢"), ("text", "依漢字查詢")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("key")
+        p.add_argument("--index", default=DEFAULT_INDEX, help="索引檔路徑")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        if not os.path.exists(args.dict_file):
+            print(f"錯誤：輸入檔案不存在 - {args.dict_file}")
+            return 1
+        n = compile_index(args.dict_file, args.index_file)
+        print(f"已編譯 {n} 筆詞條，索引已寫入 {args.index_file}")
+        return 0
+
+    with BPJiKhooIndex(args.index) as index:
+        if args.command == "code":
+            _print_entries(index.lookup(args.key))
+        elif args.command == "prefix":
+            _print_entries(index.prefix(args.key))
+        else:
+            _print_entries(index.by_text(args.key))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
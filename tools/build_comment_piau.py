@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+build_comment_piau.py
+
+預先算好候選字清單的註解，產生供 comment_piau_filter（tools/comment_piau_filter.lua）讀取的註解對照表。
+
+原本每個候選字都要經過 translator/comment_format 的一百多條 xform 規則，
+再由 reformat_comment_filter 以 Lua 樣式重排，連續輸入時在較慢的電腦上會讓候選字視窗延遲。
+comment_format 的規則逐音節作用，多音節編碼的註解即為各音節註解以兩個空白連接，
+因此只須對字典音節表的每個音節離線執行一次規則（rime_algebra.py），
+輸出 Lua 模組 lua/<方案代號>_comment_piau.lua：
+    return {
+      ["gong1"] = { "〔gong1〕 【ㄍㆲ】", { "gong1" }, { "ㄍㆲ" } },
+      ...
+    }
+各項依序為：該音節的註解，註解中各 〔…〕、【…】 的內容（供重排成「左拼音、右注音」的雙欄格式）。
+Rime 會略過字典檔中未宣告的欄位，無法由 Lua 讀取，故以 Lua 模組存放而非字典欄位。
+
+產生對照表後，以字典中所有編碼及隨機組合的多音節編碼，
+比對「對照表 + comment_piau_filter」與「comment_format + reformat_comment_filter」的結果是否相同。
+
+comment_piau_filter 尚未併入發佈的 rime.lua，啟用方式：
+    1. 將 tools/comment_piau_filter.lua 附加到 rime.lua，並將產生的 lua/<方案代號>_comment_piau.lua 列入發佈清單
+    2. 方案檔 translator/filters 中的 lua_filter@reformat_comment_filter 改為 lua_filter@comment_piau_filter
+    3. 移除 translator/comment_format 的 __patch（之後產生對照表時以 --rules 指定規則來源）
+comment_piau_filter 找不到對照表或遇到已格式化的註解時，會退回 reformat_comment_filter 的重排，
+故步驟 3 之前即可先換上。
+
+用法：
+    python build_comment_piau.py [schema_file ...] [--dict DICT] [--rules REF] [--outdir DIR] [--samples N]
+
+參數：
+    schema_file (可選): 方案檔路徑，可指定多個，預設值：專案根目錄下的 bp_phing_im.schema.yaml
+    --dict            : 字典檔，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    --rules           : 註解規則的參照（如 bp_libs:/hau_suan_ji_tuann），預設取方案的 translator/comment_format
+    --outdir          : 對照表輸出目錄，預設值：專案根目錄下的 lua/
+    --samples         : 隨機多音節編碼的比對筆數（預設：10000）
+
+範例：
+    python build_comment_piau.py ../bp_phing_im.schema.yaml ../bp_hong_im.schema.yaml
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+from rime_algebra import IM_CHAT_KAN_KEH, AlgebraError, Projection, im_chat_piau, load_schema_rules
+from rime_config import ConfigCache, ConfigError, ConfigResolver, get_node
+from rime_dict import MappedRimeDict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCHEMA = os.path.join(PROJECT_ROOT, "bp_phing_im.schema.yaml")
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+DEFAULT_OUTDIR = os.path.join(PROJECT_ROOT, "lua")
+
+# 對照表模組名稱：<方案代號>_comment_piau
+MODULE_SUFFIX = "_comment_piau"
+
+# 與 rime.lua 相同的最小擷取：〔(.-)〕、【(.-)】
+_PHING_IM = re.compile("〔(.*?)〕")
+_ZU_IM = re.compile("【(.*?)】")
+
+# 多音節註解之間的分隔（comment_format 的 xform/】\s+〔/】  〔/）
+CHU_KAI_KAN_KEH = "  "
+
+
+def regroup_pairs(s: str) -> str:
+    """與 rime.lua 的 regroup_pairs_safe 相同：多音節時重排成「左拼音、右注音」的雙欄格式。"""
+    phing_im, zu_im = _PHING_IM.findall(s), _ZU_IM.findall(s)
+    if len(phing_im) >= 2 and len(phing_im) == len(zu_im):
+        return "〔" + "〕 〔".join(phing_im) + "〕  【" + "】 【".join(zu_im) + "】"
+    return s
+
+
+def build_piau(comment_format: Projection, im_chat) -> dict[str, tuple[str, list[str], list[str]]]:
+    """{音節: (註解, [〔〕內容...], [【】內容...])}；規則未改變的音節（不合法的編碼）不列入。"""
+    piau = {}
+    for s in im_chat:
+        comment = comment_format.apply(s)
+        if comment != s:
+            piau[s] = (comment, _PHING_IM.findall(comment), _ZU_IM.findall(comment))
+    return piau
+
+
+def render_comment(piau: dict, code: str) -> str | None:
+    """與 comment_piau_filter 相同：以對照表組出編碼的註解；有音節不在表中時回傳 None。"""
+    comments, phing_im, zu_im = [], [], []
+    for s in IM_CHAT_KAN_KEH.split(code):
+        if not s:
+            continue
+        item = piau.get(s)
+        if item is None:
+            return None
+        comments.append(item[0])
+        phing_im.extend(item[1])
+        zu_im.extend(item[2])
+    if not comments:
+        return None
+    if len(phing_im) >= 2 and len(phing_im) == len(zu_im):
+        return "〔" + "〕 〔".join(phing_im) + "〕  【" + "】 【".join(zu_im) + "】"
+    return CHU_KAI_KAN_KEH.join(comments)
+
+
+def verify(comment_format: Projection, piau: dict, codes, samples: int, seed: int = 0) -> tuple[int, list[str]]:
+    """比對字典編碼及隨機多音節編碼，回傳 (比對筆數, 結果不同的編碼)。"""
+    codes = list(codes)
+    im_chat = sorted(piau)
+    rng = random.Random(seed)
+    for _ in range(samples if im_chat else 0):
+        codes.append("'".join(rng.choices(im_chat, k=rng.randint(2, 4))))
+    mismatched = []
+    for code in codes:
+        rendered = render_comment(piau, code)
+        if rendered is not None and rendered != regroup_pairs(comment_format.apply(code)):
+            mismatched.append(code)
+    return len(codes), mismatched
+
+
+def _lua_string(s: str) -> str:
+    return '"' + s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r") + '"'
+
+
+def write_lua(path: str, piau: dict, source: str, rule_count: int):
+    """將對照表寫成 Lua 模組（依音節排序，內容不變時輸出亦不變）。"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("-- 本檔由 tools/build_comment_piau.py 產生，請勿手動修改\n")
+        f.write(f"-- 來源：{source}（comment_format {rule_count} 條規則，音節 {len(piau)} 個）\n")
+        f.write("return {\n")
+        for s in sorted(piau):
+            comment, phing_im, zu_im = piau[s]
+            f.write(
+                f"  [{_lua_string(s)}] = {{ {_lua_string(comment)}, "
+                f"{{ {', '.join(map(_lua_string, phing_im))} }}, "
+                f"{{ {', '.join(map(_lua_string, zu_im))} }} }},\n"
+            )
+        f.write("}\n")
+
+
+def load_rules(schema_path: str, ref: str | None) -> list[str]:
+    """方案的 comment_format 規則；指定 ref 時改取該參照（如 bp_libs:/hau_suan_ji_tuann）的規則。"""
+    if not ref:
+        return load_schema_rules(schema_path)["comment_format"]
+    resolver = ConfigResolver(cache=ConfigCache())
+    resolver.resolve_file(schema_path, custom=False)
+    node = resolver.resolve_reference(ref, os.path.abspath(schema_path))
+    if isinstance(node, dict):
+        node = get_node(node, "__append")
+    return [str(rule) for rule in node or []]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="預先算好候選字註解，產生 comment_piau_filter 的對照表")
+    parser.add_argument("schema_file", nargs="*", default=[DEFAULT_SCHEMA], help="方案檔路徑")
+    parser.add_argument("--dict", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--rules", help="註解規則的參照，如 bp_libs:/hau_suan_ji_tuann")
+    parser.add_argument("--outdir", default=DEFAULT_OUTDIR, help="對照表輸出目錄")
+    parser.add_argument("--samples", type=int, default=10000, help="隨機多音節編碼的比對筆數（預設：10000）")
+    args = parser.parse_args(argv)
+
+    for path in (*args.schema_file, args.dict):
+        if not os.path.exists(path):
+            print(f"錯誤：輸入檔案不存在 - {path}")
+            return 1
+
+    with MappedRimeDict(args.dict) as ji_khoo:
+        codes = sorted({code for (code,) in ji_khoo.fields("code") if code})
+    im_chat = im_chat_piau(args.dict)
+
+    failed = False
+    for schema_path in args.schema_file:
+        t0 = time.perf_counter()
+        try:
+            rules = load_rules(schema_path, args.rules)
+            comment_format = Projection(rules)
+        except (AlgebraError, ConfigError) as e:
+            print(f"錯誤：{schema_path}：{e}")
+            return 1
+        if not rules:
+            print(f"略過 {schema_path}：沒有 comment_format 規則（可用 --rules 指定）")
+            continue
+
+        piau = build_piau(comment_format, im_chat)
+        t1 = time.perf_counter()
+        checked, mismatched = verify(comment_format, piau, codes, args.samples)
+        t2 = time.perf_counter()
+
+        schema_id = os.path.basename(schema_path).split(".")[0]
+        out = os.path.join(args.outdir, f"{schema_id}{MODULE_SUFFIX}.lua")
+        write_lua(out, piau, args.rules or os.path.basename(schema_path), len(rules))
+
+        print(f"{schema_id}：規則 {len(rules)} 條，音節 {len(im_chat)} 個中 {len(piau)} 個有註解（{t1 - t0:.3f} 秒）")
+        print(f"    比對 {checked} 個編碼，結果不同 {len(mismatched)} 個（{t2 - t1:.3f} 秒）")
+        for code in mismatched[:10]:
+            print(f"    {code!r}")
+        skipped = len(im_chat) - len(piau)
+        if skipped:
+            print(f"    {skipped} 個音節規則不適用（不合法的編碼，可用 bp_im_chat.py 檢查），維持原註解")
+        print(f"    已寫入 {out}")
+        failed = failed or bool(mismatched)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+build_im_chat_piau.py
+
+窮舉【台語音標（TLPA）】所有「聲母 × 韻母」組合，逐一以轉換規則轉成【閩拼（BP）】，
+產生靜態的音節對照表模組 tlpa_bp_im_chat_piau.py。
+
+convert_tlpa_to_bp_for_rime_dict.py 載入時會讀取此表，並展開成含聲調 0–9 的完整音節表，
+已知音節只需一次 dict 查詢；表中沒有的音節才走轉換規則。
+產生的檔案同時也是完整的轉換對照文件，修改轉換規則後可直接以 git diff 檢視影響。
+
+用法：
+    python build_im_chat_piau.py [output_file]
+    python build_im_chat_piau.py --check
+
+參數：
+    output_file (可選): 輸出檔案路徑
+                       預設值：本工具同目錄下的 tlpa_bp_im_chat_piau.py
+    --check           : 只檢查既有的對照表是否與目前規則一致；不一致時結束代碼為 1
+"""
+
+import argparse
+import os
+import sys
+
+from convert_tlpa_to_bp_for_rime_dict import (
+    SIANN_BU_TNG_UANN_PIAU,
+    TLPAToBPConverter,
+    tng_uann_piau_hash,
+)
+from rime_dict import open_output
+
+# TLPA 韻母一覽表（含入聲韻尾 -h、-p、-t、-k 及鼻化韻）
+TLPA_UN_BU_IT_LAM_PIAU = [
+    # 單元音
+    "a", "i", "u", "e", "o", "oo", "ir", "ee", "er",
+    # 複合元音
+    "ai", "au", "ia", "iu", "io", "ua", "ui", "ue", "uee", "iau", "uai", "ere",
+    # 鼻音韻尾
+    "am", "an", "ang", "im", "in", "ing", "un", "ong", "om", "erng",
+    "iam", "ian", "iang", "iong", "uan", "uang",
+    # 鼻化韻
+    "ann", "inn", "enn", "onn", "oonn", "unn", "ainn", "aunn",
+    "iann", "iunn", "ionn", "uann", "uinn", "uainn", "iaunn",
+    # 韻化聲母
+    "m", "ng",
+    # 入聲：-h
+    "ah", "ih", "uh", "eh", "oh", "ooh", "irh", "eeh", "erh",
+    "auh", "iah", "iuh", "ioh", "uah", "uih", "ueh", "ueeh", "iauh", "ereh",
+    "annh", "innh", "ennh", "onnh", "ainnh", "aunnh",
+    "iannh", "iunnh", "uannh", "uinnh", "uainnh", "iaunnh",
+    "mh", "ngh",
+    # 入聲：-p、-t、-k
+    "ap", "at", "ak", "ip", "it", "ik", "ut", "ok", "op", "erk",
+    "iap", "iat", "iak", "iok", "uat",
+]
+
+# 聲母一覽表：空字串為零聲母
+TLPA_SIANN_BU_IT_LAM_PIAU = [""] + list(SIANN_BU_TNG_UANN_PIAU)
+
+# 預設輸出檔
+DEFAULT_OUTFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tlpa_bp_im_chat_piau.py")
+
+MODULE_HEADER = '''"""
+tlpa_bp_im_chat_piau.py
+
+【台語音標（TLPA）】→【閩拼（BP）】音節對照表（不含聲調）。
+
+本檔由 build_im_chat_piau.py 自動產生，請勿手動修改；
+修改 convert_tlpa_to_bp_for_rime_dict.py 的轉換規則後，請重新執行該工具。
+"""
+
+# 產生本表時，轉換規則對照表的雜湊值
+KUI_TSIK_HASH = "{hash}"
+
+IM_CHAT_PIAU = {{
+'''
+
+
+def kiong_ki_im_chat() -> dict[str, str]:
+    """窮舉所有「聲母 × 韻母」組合，回傳 {TLPA 無調號音節: BP 無調號音節}。"""
+    converter = TLPAToBPConverter(cache_size=0)
+    im_chat_piau: dict[str, str] = {}
+    for siann in TLPA_SIANN_BU_IT_LAM_PIAU:
+        for un in TLPA_UN_BU_IT_LAM_PIAU:
+            mo_tiau = siann + un
+            if mo_tiau not in im_chat_piau:
+                im_chat_piau[mo_tiau] = converter.tng_uann_mo_tiau(mo_tiau)
+    return im_chat_piau
+
+
+def render_module(im_chat_piau: dict[str, str]) -> str:
+    """將音節對照表輸出成 Python 模組原始碼。"""
+    lines = [MODULE_HEADER.format(hash=tng_uann_piau_hash())]
+    lines.extend(f'    "{TLPA}": "{BP}",\n' for TLPA, BP in im_chat_piau.items())
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main(outfile: str = DEFAULT_OUTFILE, check: bool = False) -> int:
+    source = render_module(kiong_ki_im_chat())
+
+    if check:
+        try:
+            with open(outfile, "r", encoding="utf-8") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f"❌ {outfile} 與目前的轉換規則不符，請重新執行 build_im_chat_piau.py")
+            return 1
+        print(f"✅ {outfile} 與目前的轉換規則一致")
+        return 0
+
+    with open_output(outfile) as fout:
+        fout.write(source)
+    print(f"音節對照表已寫入 {outfile}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="產生【台語音標 → 閩拼】音節對照表模組")
+    parser.add_argument("outfile", nargs="?", default=DEFAULT_OUTFILE, help="輸出檔案")
+    parser.add_argument("--check", action="store_true", help="只檢查既有的對照表是否為最新")
+    args = parser.parse_args()
+    sys.exit(main(args.outfile, check=args.check))
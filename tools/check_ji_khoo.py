@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+check_ji_khoo.py
+
+單次掃描 Rime 字典檔，以 text、code、(text, code) 三個雜湊索引檢查：
+    - 完全重複：所有欄位都相同的詞條
+    - 權重衝突：同一漢字、同一讀音（text, code）出現多筆且 weight 不同
+    - 格式不符：不符合標頭 columns: 宣告的詞條，例如
+        - 欄位數多於宣告（多了 tab）
+        - 缺少 code 欄
+        - text 欄含空白（常見為 tab 誤打成空白，如「ㆫ uu1」）
+        - code 欄含英文小寫字母、數字、空白及 ' 以外的字元
+        - weight 欄不是數值
+
+重複詞條會使編譯後的字典變大、候選清單出現重複字，宜在部署前清除。
+
+用法：
+    python check_ji_khoo.py [dict_file] [--limit N] [--json FILE]
+
+參數：
+    dict_file (可選): 字典檔路徑，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+結束代碼：
+    0 表示未發現問題，1 表示有問題
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+
+from rime_dict import RimeDict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+
+# code 欄可用字元：英文小寫字母、數字（聲調），多音節以空白或 ' 分隔
+CODE_PIAU_KIAT = re.compile(r"^[a-z0-9]+(?:[ '][a-z0-9]+)*$")
+
+WEIGHT_PIAU_KIAT = re.compile(r"^-?\d+(?:\.\d+)?%?$")
+
+KHANG_PEH = re.compile(r"\s")
+
+
+def check_row(row: list[str], columns: list[str], col: dict[str, int | None]) -> list[str]:
+    """檢查一筆詞條是否符合 columns: 宣告，回傳問題說明（符合時回傳空 list）。"""
+    problems = []
+    if len(row) > len(columns):
+        problems.append(f"欄位數 {len(row)} 多於宣告的 {len(columns)} 欄")
+
+    text_i, code_i, weight_i = col["text"], col["code"], col["weight"]
+    if text_i is not None and text_i < len(row) and KHANG_PEH.search(row[text_i]):
+        problems.append(f"text 欄含空白：{row[text_i]!r}")
+    if code_i is not None:
+        if code_i >= len(row) or not row[code_i]:
+            problems.append("缺少 code 欄")
+        elif not CODE_PIAU_KIAT.match(row[code_i]):
+            problems.append(f"code 欄格式不符：{row[code_i]!r}")
+    if weight_i is not None and weight_i < len(row) and row[weight_i]:
+        if not WEIGHT_PIAU_KIAT.match(row[weight_i]):
+            problems.append(f"weight 欄不是數值：{row[weight_i]!r}")
+    return problems
+
+
+def analyze(path: str) -> dict:
+    """
+    單次掃描字典檔，回傳檢查結果：
+    - duplicates: [(詞條內容, [行號, ...]), ...]
+    - weight_conflicts: [(text, code, [(weight, 行號), ...]), ...]
+    - schema_errors: [(行號, 原始內容, [問題, ...]), ...]
+    - stats: 詞條數、不重複漢字／編碼／(漢字, 編碼) 數、同音字最多的編碼
+    """
+    rows_index: dict[tuple, list[int]] = defaultdict(list)
+    text_code_index: dict[tuple, list[tuple[str, int]]] = defaultdict(list)
+    text_index: Counter = Counter()
+    code_index: Counter = Counter()
+    schema_errors = []
+    count = 0
+    # 已確認格式正確的 code、weight 值；重複出現時不必再以正規表達式檢查
+    good_codes: set[str] = set()
+    good_weights: set[str] = set()
+
+    with RimeDict(path) as ji_khoo:
+        columns = ji_khoo.columns
+        col = {name: ji_khoo.column_index(name) for name in ("text", "code", "weight")}
+        text_i, code_i, weight_i = col["text"], col["code"], col["weight"]
+
+        for line_no, row in ji_khoo.rows():
+            count += 1
+            rows_index[tuple(row)].append(line_no)
+
+            text = row[text_i] if text_i is not None and text_i < len(row) else ""
+            code = row[code_i] if code_i is not None and code_i < len(row) else ""
+            weight = row[weight_i] if weight_i is not None and weight_i < len(row) else ""
+
+            if (
+                len(row) > len(columns)
+                or code not in good_codes
+                or weight not in good_weights
+                or KHANG_PEH.search(text)
+            ):
+                problems = check_row(row, columns, col)
+                if problems:
+                    schema_errors.append((line_no, "\t".join(row), problems))
+                else:
+                    good_codes.add(code)
+                    good_weights.add(weight)
+            text_index[text] += 1
+            code_index[code] += 1
+            text_code_index[(text, code)].append((weight, line_no))
+
+    duplicates = [
+        ("\t".join(row), line_nos) for row, line_nos in rows_index.items() if len(line_nos) > 1
+    ]
+    weight_conflicts = [
+        (text, code, entries)
+        for (text, code), entries in text_code_index.items()
+        if len({weight for weight, _ in entries}) > 1
+    ]
+    return {
+        "duplicates": duplicates,
+        "weight_conflicts": weight_conflicts,
+        "schema_errors": schema_errors,
+        "stats": {
+            "entries": count,
+            "distinct_texts": len(text_index),
+            "distinct_codes": len(code_index),
+            "distinct_text_codes": len(text_code_index),
+            "most_homophones": code_index.most_common(10),
+        },
+    }
+
+
+def print_report(path: str, result: dict, limit: int):
+    stats = result["stats"]
+    print(f"字典檔：{path}")
+    print(
+        f"詞條 {stats['entries']} 筆；不重複漢字 {stats['distinct_texts']}、"
+        f"編碼 {stats['distinct_codes']}、(漢字, 編碼) {stats['distinct_text_codes']}"
+    )
+    print("同音字最多的編碼：" + "、".join(f"{code}（{n}）" for code, n in stats["most_homophones"]))
+    print()
+
+    def section(title: str, items: list, render):
+        print(f"{title}：{len(items)} 組")
+        for item in items[:limit]:
+            print("    " + render(item))
+        if len(items) > limit:
+            print(f"    …（其餘 {len(items) - limit} 組略）")
+
+    section("完全重複", result["duplicates"], lambda d: f"第 {', '.join(map(str, d[1]))} 行：{d[0]}")
+    section(
+        "權重衝突",
+        result["weight_conflicts"],
+        lambda c: f"{c[0]}\t{c[1]}：" + "、".join(f"{w or '（空白）'}（第 {n} 行）" for w, n in c[2]),
+    )
+    section("格式不符", result["schema_errors"], lambda e: f"第 {e[0]} 行：{e[1]!r} — {'；'.join(e[2])}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="檢查字典檔的重複詞條、權重衝突及格式問題")
+    parser.add_argument("dict_file", nargs="?", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--limit", type=int, default=20, help="每類最多列出幾組（預設：20）")
+    parser.add_argument("--json", help="另將完整結果寫入此 JSON 檔")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.dict_file):
+        print(f"錯誤：輸入檔案不存在 - {args.dict_file}")
+        return 2
+
+    result = analyze(args.dict_file)
+    print_report(args.dict_file, result, args.limit)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    has_problem = result["duplicates"] or result["weight_conflicts"] or result["schema_errors"]
+    return 1 if has_problem else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
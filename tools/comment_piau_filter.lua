@@ -0,0 +1,61 @@
+--------------------------------------------------------------------------
+-- comment_piau_filter：以預先算好的註解對照表產生候選註解
+--------------------------------------------------------------------------
+-- 對照表由 tools/build_comment_piau.py 離線執行 comment_format 規則產生：lua/<方案代號>_comment_piau.lua
+-- 每個音節一項：{ 註解, { 〔〕內容... }, { 【】內容... } }
+-- 候選註解為原始編碼（如 zian1 ho3）時，逐音節查表後組合，結果與
+-- 「comment_format + reformat_comment_filter」相同，但不必每個候選字都執行一百多條規則。
+-- 找不到對照表、有音節不在表中，或註解已經過 comment_format 時，退回 regroup_pairs_safe 重排。
+--
+-- 本檔尚未隨 rime.lua 發佈（目前沒有方案啟用，lua/ 下的對照表亦未提交）。
+-- 本檔沿用 rime.lua 的 regroup_pairs_safe 與 Rime 提供的 Candidate、yield，
+-- 測試（test/test_build_comment_piau.py）將 rime.lua 與本檔一併載入 Lua 直譯器執行。
+-- 啟用方式：
+--   1. 將本檔內容附加到 rime.lua 的 reformat_comment_filter 之後
+--   2. 以 tools/build_comment_piau.py 產生 lua/<方案代號>_comment_piau.lua，並列入發佈清單
+--   3. 方案的 translator/filters 改用 lua_filter@comment_piau_filter，並移除 translator/comment_format
+--------------------------------------------------------------------------
+
+local function render_comment(piau, code)
+  if code == "" then return nil end
+  local comments, tlpa, zu_im = {}, {}, {}
+  for s in code:gmatch("[^%s']+") do
+    local item = piau[s]
+    if not item then return nil end
+    table.insert(comments, item[1])
+    for _, t in ipairs(item[2]) do table.insert(tlpa, t) end
+    for _, z in ipairs(item[3]) do table.insert(zu_im, z) end
+  end
+  if #comments == 0 then return nil end
+  if #tlpa >= 2 and #tlpa == #zu_im then
+    return "〔" .. table.concat(tlpa, "〕 〔") .. "〕"
+           .. "  "
+           .. "【" .. table.concat(zu_im, "】 【") .. "】"
+  end
+  return table.concat(comments, "  ")
+end
+
+comment_piau_filter = {
+  init = function(env)
+    local ok, piau = pcall(require, env.engine.schema.schema_id .. "_comment_piau")
+    env.piau = ok and type(piau) == "table" and piau or nil
+  end,
+
+  func = function(input, env)
+    local piau = env.piau
+    for cand in input:iter() do
+      local old = cand.comment or ""
+      local new = (piau and render_comment(piau, old)) or regroup_pairs_safe(old)
+
+      if new ~= old then
+        local c = cand:get_genuine()
+        local nc = Candidate(c.type, c.start, c._end, c.text, new)
+        nc.preedit  = cand.preedit
+        nc.quality  = cand.quality
+        yield(nc)
+      else
+        yield(cand)
+      end
+    end
+  end,
+}
@@ -4,13 +4,21 @@ convert_tlpa_to_bp_for_rime_dict.py
 將【台語音標（TLPA+）】轉換成【台語注音二式（bp）】。
 
 用法：
-    python convert_tlpa_to_bp_for_rime_dict.py [input_file] [output_file]
+    python convert_tlpa_to_bp_for_rime_dict.py [-j N] [input_file] [output_file]
 
 參數：
     input_file  (可選): 輸入檔案路徑
                        預設值：專案根目錄下的 tl_ji_khoo_peh_ue.dict.yaml
     output_file (可選): 輸出檔案路徑
                        預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    檔名為 "-" 時代表標準輸入／標準輸出。
+    -j N, --jobs N    (可選): 以 N 個行程平行轉換詞條區，輸出與單一行程完全相同
+    -i, --incremental (可選): 增量轉換，只重新轉換上次轉換後新增或修改的詞條；
+                              每行的雜湊值記錄在 <output_file>.manifest.json
+    --timings         (可選): 列出各階段耗時（標頭解析、詞條解析、聲母比對、韻母對應、
+                              零聲母 y/w 處理、聲調轉換、寫出）；此模式不使用預先產生的
+                              音節表，音節都經轉換規則（及快取）轉換
+    --profile FILE    (可選): 以 cProfile 剖析，pstats 寫入 FILE，JSON 摘要寫入 FILE.json
 
 範例：
     # 使用預設檔案
@@ -21,10 +29,41 @@ convert_tlpa_to_bp_for_rime_dict.py
 
     # 指定輸入和輸出檔案
     python convert_tlpa_to_bp_for_rime_dict.py input.dict.yaml output.dict.yaml
+
+    # 以 "-" 代表標準輸入／標準輸出，可與其他工具串接
+    cat input.dict.yaml | python convert_tlpa_to_bp_for_rime_dict.py - - > output.dict.yaml
+
+    # 以 8 個行程轉換大型字典檔
+    python convert_tlpa_to_bp_for_rime_dict.py --jobs 8 input.dict.yaml output.dict.yaml
+
+    # 增量轉換（編修字典後重複執行）
+    python convert_tlpa_to_bp_for_rime_dict.py --incremental
 """
 
+import argparse
+import cProfile
+import hashlib
+import inspect
+import io
+import json
+import os
+import pstats
 import re
 import sys
+import time
+import warnings
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import BinaryIO, TextIO
+
+from rime_dict import open_input, open_output
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 為選用套件；未安裝時 convert_many() 回傳 list
+    np = None
 
 # RIME 字典名稱
 JI_KHOO_NAME = "bp_ji_khoo"
@@ -154,6 +193,229 @@ BP_TIAU_HO_PIAU = {
 }
 
 
+# 音節格式：聲母+韻母+聲調=英文字母+數字
+IM_CHAT_PIAU_KIAT = re.compile(r"^([a-z]+)(\d+)$")
+
+# 多音節詞條的音節分隔符號：空白或 '
+IM_CHAT_KAN_KEH = re.compile(r"([ ']+)")
+
+# 轉換結果快取之預設上限（筆數）
+KHOAI_CHHU_SIONG_HAN = 4096
+
+# 平行轉換時，每段詞條的大小上限（位元組）
+TUANN_SIONG_HAN = 8 * 1024 * 1024
+
+# 增量轉換清單檔格式版本
+MANIFEST_VERSION = 1
+
+# 預先產生之音節對照表所涵蓋的聲調
+IM_CHAT_PIAU_TIAU = "0123456789"
+
+
+def tng_uann_piau_hash(converter_cls: type | None = None) -> str:
+    """
+    轉換規則的雜湊值，用以判斷預先產生的音節對照表是否過期。
+    涵蓋聲母、韻母、聲調對照表，以及轉換器（預設為 TLPAToBPConverter，含其父類別）的原始碼，
+    對照表或任何轉換規則方法一改，舊的音節對照表即失效。
+    """
+    converter_cls = converter_cls or TLPAToBPConverter
+    source = [
+        inspect.getsource(cls) for cls in converter_cls.__mro__ if cls.__module__ != "builtins"
+    ]
+    data = json.dumps(
+        [SIANN_BU_TNG_UANN_PIAU, UN_BU_TNG_UANN_PIAU, sorted(VOWELS),
+         TLPA_TIAU_HO_PIAU, BP_TIAU_HO_PIAU, IM_CHAT_PIAU_KIAT.pattern, source],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+class TLPAToBPConverter:
+    """
+    【台語音標（TLPA）】→【閩拼（BP）】音節轉換器。
+
+    建構時將聲母、韻母、聲調對照表預先編譯成查表結構：
+    - 聲母依長度分組，比對時由長到短各做一次 dict 查詢，不必每次重新排序。
+    - 聲調直接合併成「TLPA 調號 → BP 調號」一張表。
+
+    若提供 im_chat_piau（不含聲調的「TLPA 音節 → BP 音節」對照表，見 build_im_chat_piau.py），
+    建構時會展開成含聲調 0–9 的完整音節表，已知音節只需一次 dict 查詢；
+    表中沒有的音節才查快取、走轉換規則。
+
+    轉換結果另以有上限的 LRU 快取保存；字典檔中重複出現的音節只需轉換一次。
+    hits / misses 記錄快取命中與未命中次數，table_hits 記錄音節表命中次數。
+    """
+
+    def __init__(
+        self,
+        cache_size: int = KHOAI_CHHU_SIONG_HAN,
+        im_chat_piau: dict[str, str] | None = None,
+    ):
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.table_hits = 0
+        self._cache: OrderedDict[str, str] = OrderedDict()
+
+        # 聲母：{長度: {TLPA 聲母: BP 聲母}}，長度由大到小
+        lui_piat: dict[int, dict[str, str]] = {}
+        for key, value in SIANN_BU_TNG_UANN_PIAU.items():
+            lui_piat.setdefault(len(key), {})[key] = value
+        self._siann_bu = [(n, lui_piat[n]) for n in sorted(lui_piat, reverse=True)]
+
+        self._un_bu = dict(UN_BU_TNG_UANN_PIAU)
+
+        # 聲調：TLPA 調號 → 調名 → BP 調號
+        self._tiau = {
+            tiau: BP_TIAU_HO_PIAU.get(tiau_mia, tiau_mia)
+            for tiau, tiau_mia in TLPA_TIAU_HO_PIAU.items()
+        }
+
+        # 完整音節表：TLPA 音節（含聲調）→ BP 音節
+        self._im_chat_piau: dict[str, str] = {}
+        for mo_tiau, BP_mo_tiau in (im_chat_piau or {}).items():
+            for tiau in IM_CHAT_PIAU_TIAU:
+                self._im_chat_piau[mo_tiau + tiau] = BP_mo_tiau + self.tng_tiau(tiau)
+
+    def convert(self, TLPA_piau_im: str) -> str:
+        """轉換單一音節；先查音節表，再查快取，都未命中才走轉換規則。"""
+        BP_piau_im = self._im_chat_piau.get(TLPA_piau_im)
+        if BP_piau_im is not None:
+            self.table_hits += 1
+            return BP_piau_im
+
+        cache = self._cache
+        if TLPA_piau_im in cache:
+            self.hits += 1
+            cache.move_to_end(TLPA_piau_im)
+            return cache[TLPA_piau_im]
+
+        self.misses += 1
+        BP_piau_im = self.tng_uann(TLPA_piau_im)
+        cache[TLPA_piau_im] = BP_piau_im
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return BP_piau_im
+
+    __call__ = convert
+
+    def convert_phrase(self, TLPA_su: str) -> str:
+        """
+        轉換多音節詞條（如 "tsiann1 ho2"、"tsiann1'ho2"）：
+        以空白及 ' 切分音節，逐一經快取轉換後，保留原分隔符號重新組合。
+        單一音節則直接轉換。
+        """
+        if " " not in TLPA_su and "'" not in TLPA_su:
+            return self.convert(TLPA_su)
+        parts = IM_CHAT_KAN_KEH.split(TLPA_su)
+        # 偶數位置為音節，奇數位置為分隔符號
+        for i in range(0, len(parts), 2):
+            if parts[i]:
+                parts[i] = self.convert(parts[i])
+        return "".join(parts)
+
+    def cache_info(self) -> dict:
+        """回傳快取統計：命中、未命中、目前筆數及上限，以及音節表命中次數與筆數。"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": self.cache_size,
+            "table_hits": self.table_hits,
+            "table_size": len(self._im_chat_piau),
+        }
+
+    def cache_clear(self):
+        """清除快取及統計數字。"""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.table_hits = 0
+
+    def tng_uann(self, TLPA_piau_im: str) -> str:
+        """不經快取，直接依轉換規則轉換單一音節。"""
+        m = IM_CHAT_PIAU_KIAT.match(TLPA_piau_im)
+        if not m:
+            # 如果不符合「全英文字母+數字」格式，就原樣回傳
+            return TLPA_piau_im
+
+        # 提取：【無調號標音】（聲母+韻母）和【聲調】
+        mo_tiau_piau_im, tiau = m.group(1), m.group(2)
+        return f"{self.tng_uann_mo_tiau(mo_tiau_piau_im)}{self.tng_tiau(tiau)}"
+
+    def tng_uann_mo_tiau(self, mo_tiau_piau_im: str) -> str:
+        """依轉換規則轉換【無調號標音】（聲母+韻母），回傳 BP 聲母+韻母。"""
+        siann, un = self.tng_siann_bu(mo_tiau_piau_im)
+        un = self.tng_un_bu(un)
+        siann, un = self.tng_ling_siann_bu(siann, un)
+        return f"{siann}{un}"
+
+    def tng_siann_bu(self, mo_tiau_piau_im: str) -> tuple[str, str]:
+        """1. 轉聲母：從長到短比對 prefix，回傳（聲母, 剩餘韻母）。"""
+        # 特殊處理：韻化聲母 m、ng（後面直接接聲調，不轉換）
+        # 毋 [m7] 保持為 m，不轉換成 bbn；黃 [ng5] 保持為 ng，不轉換成 ggn
+        if mo_tiau_piau_im in ("m", "ng"):
+            return "", mo_tiau_piau_im
+
+        for n, piau in self._siann_bu:
+            siann = piau.get(mo_tiau_piau_im[:n])
+            if siann is not None:
+                return siann, mo_tiau_piau_im[n:]
+        return "", mo_tiau_piau_im
+
+    def tng_un_bu(self, un: str) -> str:
+        """2. 轉韻母：整段比對。"""
+        return self._un_bu.get(un, un)
+
+    @staticmethod
+    def tng_ling_siann_bu(siann: str, un: str) -> tuple[str, str]:
+        """3.【零聲母連i/u】特殊處理，回傳（聲母, 韻母）。"""
+        if siann or not un:
+            return siann, un
+
+        first_lo_ma_ji_bu = un[0]
+        if first_lo_ma_ji_bu == "i":
+            # i 為【介音】，聲母變更為：[y]，韻母的首羅馬字 [i] 將之刪除。
+            # 【例】：腰 [iao] ==> [yao]，鞅 [iang] ==> [yang]，央 [iong] ==> [yong]
+            if len(un) >= 2 and un[1] in VOWELS:
+                return "y", un[1:]
+            # i 為【元音】韻母，聲母變更為：[y]，韻母維持不變。
+            # 【例】：伊 [i] ==> [yi]，音 [im] ==> [yim]，益 [ik] ==> [yik]
+            return "y", un
+
+        if first_lo_ma_ji_bu == "u":
+            # u 為【介音】，聲母變更為：[w]，韻母的首羅馬字 [u] 將之刪除。
+            # 【例】：彎 [uan] ==> [wan]，歪 [uai] ==> [wai]，位 [ui] ==> [wi]
+            if len(un) >= 2 and un[1] in VOWELS:
+                return "w", un[1:]
+            # u 為【元音】韻母，聲母變更為：[w]，韻母維持不變。
+            # 【例】：有 [u] ==> [wu]，溫 [un] ==> [wun]，鬱 [ut] ==> [wut]
+            return "w", un
+
+        return siann, un
+
+    def tng_tiau(self, tiau: str) -> str:
+        """4. 【台語音標】調號轉換成【閩拼音標】調號。"""
+        return self._tiau.get(tiau, tiau)
+
+
+# 預先產生的音節對照表（由 build_im_chat_piau.py 產生）；與目前規則不符時不使用
+try:
+    from tlpa_bp_im_chat_piau import IM_CHAT_PIAU, KUI_TSIK_HASH
+except ImportError:
+    IM_CHAT_PIAU, KUI_TSIK_HASH = None, None
+if IM_CHAT_PIAU is not None and KUI_TSIK_HASH != tng_uann_piau_hash():
+    warnings.warn(
+        "tlpa_bp_im_chat_piau.py 與目前的轉換規則不符，已改用規則轉換；"
+        "請執行 build_im_chat_piau.py 重新產生",
+        stacklevel=1,
+    )
+    IM_CHAT_PIAU = None
+
+# 模組層級共用之轉換器
+_converter = TLPAToBPConverter(im_chat_piau=IM_CHAT_PIAU)
+
+
 def convert_TLPA_to_BP(TLPA_piau_im: str) -> str:
     """
     將一個 TLPA（台語音標）詞條轉換為注音二式（BP/MPS2）格式。
@@ -172,149 +434,513 @@ def convert_TLPA_to_BP(TLPA_piau_im: str) -> str:
     5. 以 TLPA_TIAU_HO_PIAU 與 BP_TIAU_HO_PIAU 做聲調名稱與編碼之對應轉換。
     6. 回傳 "<聲母><韻母><聲調>"。
 
+    實際轉換由模組層級的 TLPAToBPConverter 執行，結果會被快取，
+    可用 convert_TLPA_to_BP.cache_info() 查看命中統計。
+
     參數：
     - TLPA_piau_im (str): 要轉換的 TLPA 詞條，如 "tsiann1"、"iao2" 等。
 
     回傳值：
     - str: 轉換後的 BP 詞條；若輸入格式不符則回傳原字串。
     """
-    # 確認傳入之【台語音標】符合格式=聲母+韻母+聲調=英文字母+數字
-    m = re.match(r"^([a-z]+)(\d+)$", TLPA_piau_im)
-    if not m:
-        # 如果不符合「全英文字母+數字」格式，就原樣回傳
-        return TLPA_piau_im
-
-    # 提取：【無調號標音】（聲母+韻母）和【聲調】
-    mo_tiau_piau_im, tiau = m.group(1), m.group(2)
-
-    # 1. 轉聲母：從長到短比對 prefix
-    # 特殊處理：韻化聲母 m、ng（後面直接接聲調，不轉換）
-    siann = ""
-    un = mo_tiau_piau_im
-
-    # 檢查是否為韻化聲母：m 或 ng 後面沒有韻母（整個無調號標音就是 m 或 ng）
-    if mo_tiau_piau_im == "m":
-        # 韻化聲母 m：毋 [m7] 保持為 m，不轉換成 bbn
-        siann = ""
-        un = "m"
-    elif mo_tiau_piau_im == "ng":
-        # 韻化聲母 ng：黃 [ng5] 保持為 ng，不轉換成 ggn
-        siann = ""
-        un = "ng"
-    else:
-        # 正常聲母轉換邏輯
-        for key in sorted(SIANN_BU_TNG_UANN_PIAU.keys(), key=lambda x: -len(x)):
-            if mo_tiau_piau_im.startswith(key):
-                siann = SIANN_BU_TNG_UANN_PIAU[key]
-                un = mo_tiau_piau_im[len(key) :]
+    return _converter.convert(TLPA_piau_im)
+
+
+convert_TLPA_to_BP.cache_info = _converter.cache_info
+convert_TLPA_to_BP.cache_clear = _converter.cache_clear
+
+
+def convert_TLPA_phrase_to_BP(TLPA_su: str) -> str:
+    """
+    將 TLPA 詞條（單一音節或以空白、' 分隔的多音節詞）轉換為 BP。
+    各音節共用 convert_TLPA_to_BP() 的快取，轉換成本與音節總數成正比。
+
+    【例】："tsiann1 ho2" ==> "znia1 ho3"，"tsiann1'ho2" ==> "znia1'ho3"
+    """
+    return _converter.convert_phrase(TLPA_su)
+
+
+def convert_many(codes: Iterable, return_indices: bool = False):
+    """
+    批次轉換一整欄【台語音標】（例如試算表的一欄、語料標注結果）。
+
+    先收集整批資料中不重複的音標，每個只轉換一次，再以索引表對應回原本的位置。
+    多音節詞條以 convert_TLPA_phrase_to_BP() 的規則逐音節轉換。
+    非字串的值（如空白儲存格的 None）原樣保留。
+
+    參數：
+    - codes: 可迭代的 TLPA 音標序列（list、tuple、NumPy 陣列等）。
+    - return_indices (bool): 為 True 時，回傳（不重複轉換結果表, 索引陣列），
+      table[indices[i]] 即為第 i 筆的轉換結果，適合大量重複資料。
+
+    回傳值：
+    - 已安裝 NumPy 時回傳 dtype=object 的 NumPy 陣列（索引為 intp 陣列）；
+      否則回傳 list。
+    """
+    codes = list(codes)
+    # 不重複音標 → 在轉換結果表中的位置
+    ui_ti: dict = {}
+    for code in codes:
+        if code not in ui_ti:
+            ui_ti[code] = len(ui_ti)
+    table = [
+        _converter.convert_phrase(code) if isinstance(code, str) else code
+        for code in ui_ti
+    ]
+
+    if np is None:
+        indices = [ui_ti[code] for code in codes]
+        if return_indices:
+            return table, indices
+        return [table[i] for i in indices]
+
+    table_arr = np.empty(len(table), dtype=object)
+    table_arr[:] = table
+    indices_arr = np.fromiter((ui_ti[code] for code in codes), dtype=np.intp, count=len(codes))
+    if return_indices:
+        return table_arr, indices_arr
+    return table_arr[indices_arr]
+
+
+def thak_thau_bo(lines: Iterator[str], ji_khoo_name: str | None = JI_KHOO_NAME) -> Iterator[str]:
+    """
+    逐行產出字典檔的標頭區（含結尾的 "..." 行），讀到 "..." 即停止。
+    若指定 ji_khoo_name，則以其取代 "name:" 行。
+    lines 必須是迭代器；呼叫結束後其位置恰在詞條區第一行。
+    """
+    for line in lines:
+        # name 欄位自動更換
+        if ji_khoo_name and line.strip().startswith("name:"):
+            yield f"name: {ji_khoo_name}\n"
+            continue
+        yield line
+        # 找到「...」之後即進入詞條區
+        if line.strip() == "...":
+            return
+
+
+def tng_uann_su_tiau(
+    lines: Iterable[str], convert: Callable[[str], str] = convert_TLPA_phrase_to_BP
+) -> Iterator[str]:
+    """逐行轉換詞條區：第二欄（code）交由 convert 轉換，空行及註解原樣產出。"""
+    for line in lines:
+        # 在詞條區，跳過空行或註解
+        if not line.strip() or line.startswith("#"):
+            yield line
+            continue
+
+        # 假設詞條以「欄位1\t欄位2\t...」格式，至少要有兩欄
+        parts = line.rstrip("\n").split("\t")
+        if len(parts) >= 2:
+            parts[1] = convert(parts[1])
+            yield "\t".join(parts) + "\n"
+        else:
+            yield line
+
+
+def tng_uann_ji_khoo(
+    lines: Iterable[str],
+    convert: Callable[[str], str] = convert_TLPA_phrase_to_BP,
+    ji_khoo_name: str | None = JI_KHOO_NAME,
+) -> Iterator[str]:
+    """字典檔轉換管線：標頭區 → 詞條區，逐行產出，不在記憶體中保留整個檔案。"""
+    lines = iter(lines)
+    yield from thak_thau_bo(lines, ji_khoo_name)
+    yield from tng_uann_su_tiau(lines, convert)
+
+
+def _tng_uann_tuann(infile: str, start: int, end: int) -> str:
+    """（子行程）讀取 [start, end) 位元組範圍內的詞條並轉換，回傳轉換結果。"""
+    with open(infile, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # 與逐行模式相同，以 TextIOWrapper 解碼並做通用換行處理
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+    return "".join(tng_uann_su_tiau(lines))
+
+
+def hun_tuann(f: BinaryIO, start: int, end: int, tuann_so: int) -> list[tuple[int, int]]:
+    """
+    將 [start, end) 位元組範圍切成約 tuann_so 段，每段邊界都對齊到行首。
+    回傳 [(起點, 終點), ...]，依原始順序排列。
+    """
+    size = max(1, (end - start) // max(1, tuann_so))
+    tuann = []
+    pos = start
+    while pos < end:
+        f.seek(min(pos + size, end))
+        if f.tell() < end:
+            f.readline()  # 移到下一行行首
+        nxt = min(f.tell(), end)
+        tuann.append((pos, nxt))
+        pos = nxt
+    return tuann
+
+
+def tng_uann_ji_khoo_parallel(infile: str, fout: TextIO, jobs: int):
+    """
+    以多行程轉換字典檔：標頭區由主行程處理，"..." 之後的詞條區依位元組範圍切段，
+    交由 jobs 個子行程轉換，再依原始順序寫出；輸出與逐行模式完全相同。
+    同時最多只保留 2 × jobs 段結果在記憶體中。
+    """
+    with open(infile, "rb") as f:
+        thau_bo = []
+        for raw in iter(f.readline, b""):
+            thau_bo.append(raw)
+            if raw.strip() == b"...":
                 break
+        start = f.tell()
+        end = f.seek(0, os.SEEK_END)
+        tuann_so = max(jobs * 4, -(-(end - start) // TUANN_SIONG_HAN))
+        tuann = hun_tuann(f, start, end, tuann_so)
 
-    # 2. 轉韻母：整段比對
-    if un in UN_BU_TNG_UANN_PIAU:
-        un = UN_BU_TNG_UANN_PIAU[un]
+    thau_bo_lines = io.TextIOWrapper(io.BytesIO(b"".join(thau_bo)), encoding="utf-8")
+    fout.writelines(thak_thau_bo(thau_bo_lines))
 
-    # 3.【零聲母連i/u】特殊處理
-    if siann == "" and un:
-        first_lo_ma_ji_bu = un[0]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: deque[Future] = deque()
+        for tuann_start, tuann_end in tuann:
+            if len(pending) >= jobs * 2:
+                fout.write(pending.popleft().result())
+            pending.append(executor.submit(_tng_uann_tuann, infile, tuann_start, tuann_end))
+        while pending:
+            fout.write(pending.popleft().result())
 
-        if first_lo_ma_ji_bu == "i":
-            # i 為【介音】，聲母變更為：[y]，韻母的首羅馬字 [i] 將之刪除。
-            # 【例】：腰 [iao] ==> [yao]，鞅 [iang] ==> [yang]，央 [iong] ==> [yong]
-            # i 後面是母音：移到聲母 y，刪掉韻母開頭 i（1.2）
-            if len(un) >= 2 and un[1] in VOWELS:
-                siann = "y"
-                un = un[1:]
-            else:
-                # i 為【元音】韻母，聲母變更為：[y]，韻母維持不變。
-                # 【例】：伊 [i] ==> [yi]，音 [im] ==> [yim]，益 [ik] ==> [yik]
-                # i 後面不是母音：移到聲母 y，但韻母保留 i（1.1）
-                siann = "y"
-                # un 保持以 i 起頭，例如 i / in / inn
 
-        elif first_lo_ma_ji_bu == "u":
-            # u 為【介音】，聲母變更為：[w]，韻母的首羅馬字 [u] 將之刪除。
-            # 【例】：彎 [uan] ==> [wan]，歪 [uai] ==> [wai]，位 [ui] ==> [wi]
-            # u 後面是母音：移到聲母 w，刪掉韻母開頭 u（2.2）
-            if len(un) >= 2 and un[1] in VOWELS:
-                siann = "w"
-                un = un[1:]
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _kui_tsik_hash() -> str:
+    """轉換規則（即本程式原始碼）的雜湊值；規則一改，舊的清單即失效。"""
+    with open(__file__, "rb") as f:
+        return _hash_bytes(f.read())
+
+
+def manifest_path_for(outfile: str) -> str:
+    """輸出檔對應的清單檔路徑：<outfile>.manifest.json。"""
+    return f"{outfile}.manifest.json"
+
+
+def load_manifest(manifest_path: str, outfile: str) -> dict[str, str]:
+    """
+    讀取上次轉換留下的清單，回傳 {輸入行雜湊: 輸出行}。
+    清單不存在、轉換規則已變更，或輸出檔在上次轉換後曾被修改時，回傳空 dict（即全部重新轉換）。
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        with open(outfile, "r", encoding="utf-8", newline="") as f:
+            out_lines = f.readlines()
+    except (OSError, ValueError):
+        return {}
+
+    if (
+        manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("rules") != _kui_tsik_hash()
+        or manifest.get("ji_khoo_name") != JI_KHOO_NAME
+        or manifest.get("output") != _hash_bytes("".join(out_lines).encode("utf-8"))
+        or len(manifest.get("lines", [])) != len(out_lines)
+    ):
+        return {}
+
+    reuse: dict[str, str] = {}
+    for h, line in zip(manifest["lines"], out_lines):
+        reuse.setdefault(h, line)
+    return reuse
+
+
+def tng_uann_ji_khoo_incremental(infile: str, outfile: str) -> tuple[int, int]:
+    """
+    增量轉換：依上次轉換留下的清單（<outfile>.manifest.json），
+    內容未變的行直接沿用既有輸出，只有新增或修改的行才重新轉換。
+
+    清單記錄每一輸入行的雜湊值（標頭區與詞條區分開計算），輸入行與輸出行一一對應，
+    因此輸出與完整轉換完全相同。完成後更新清單。
+    回傳（沿用行數, 重新轉換行數）。
+    """
+    manifest_path = manifest_path_for(outfile)
+    reuse = load_manifest(manifest_path, outfile)
+
+    hashes: list[str] = []
+    digest = hashlib.blake2b(digest_size=8)
+    yan_iong = tng_uann = 0
+    in_entries = False
+    with open(infile, "r", encoding="utf-8") as fin, open_output(outfile) as fout:
+        for line in fin:
+            h = _hash_bytes((b"E" if in_entries else b"H") + line.encode("utf-8"))
+            out_line = reuse.get(h)
+            if out_line is not None:
+                yan_iong += 1
             else:
-                # u 為【元音】韻母，聲母變更為：[w]，韻母維持不變。
-                # 【例】：有 [u] ==> [wu]，溫 [un] ==> [wun]，鬱 [ut] ==> [wut]
-                # u 後面不是母音：移到聲母 w，但韻母保留 u（2.1）
-                siann = "w"
-                # un 保持以 u 起頭，例如 u / un / unn
+                tng_uann += 1
+                if in_entries:
+                    out_line = next(tng_uann_su_tiau([line]))
+                else:
+                    out_line = next(thak_thau_bo(iter([line])))
+            if not in_entries and line.strip() == "...":
+                in_entries = True
+            hashes.append(h)
+            digest.update(out_line.encode("utf-8"))
+            fout.write(out_line)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "rules": _kui_tsik_hash(),
+        "ji_khoo_name": JI_KHOO_NAME,
+        "output": digest.hexdigest(),
+        "lines": hashes,
+    }
+    with open_output(manifest_path) as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return yan_iong, tng_uann
+
+
+# 效能量測的各階段：（代號, 說明）
+KI_SI_KAI_TUANN = [
+    ("header", "標頭解析"),
+    ("entry_parse", "詞條解析（含讀檔）"),
+    ("convert", "音節轉換（合計）"),
+    ("lookup", "  查表、快取及其他"),
+    ("initial", "  聲母比對"),
+    ("final", "  韻母對應"),
+    ("zero_initial", "  零聲母 y/w 處理"),
+    ("tone", "  聲調轉換"),
+    ("write", "寫出"),
+]
+
+# 轉換規則各階段 → TLPAToBPConverter 的方法名稱
+KUI_TSIK_KAI_TUANN = {
+    "initial": "tng_siann_bu",
+    "final": "tng_un_bu",
+    "zero_initial": "tng_ling_siann_bu",
+    "tone": "tng_tiau",
+}
 
-    # 4. 【台語音標】調號轉換成【閩拼音標】調號
-    tiau_mia = TLPA_TIAU_HO_PIAU.get(tiau, tiau)
-    tiau = BP_TIAU_HO_PIAU.get(tiau_mia, tiau_mia)
-    return f"{siann}{un}{tiau}"
 
+class StageTimer:
+    """
+    累計轉換管線各階段的耗時與呼叫次數（見 KI_SI_KAI_TUANN）。
 
-def main(infile: str, outfile: str):
+    instrument() 可暫時將物件（轉換器實例或模組）上的階段函式換成計時版本，
+    不必在轉換程式中加入任何量測程式碼；計時本身的負擔也會計入各階段。
+    """
+
+    def __init__(self):
+        self.seconds = {stage: 0.0 for stage, _ in KI_SI_KAI_TUANN}
+        self.calls = {stage: 0 for stage, _ in KI_SI_KAI_TUANN}
+
+    def add(self, stage: str, seconds: float, calls: int = 1):
+        self.seconds[stage] += seconds
+        self.calls[stage] += calls
+
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        """回傳 func 的計時版本。"""
+        seconds, calls, perf_counter = self.seconds, self.calls, time.perf_counter
+
+        def timed(*args):
+            t0 = perf_counter()
+            result = func(*args)
+            seconds[stage] += perf_counter() - t0
+            calls[stage] += 1
+            return result
+
+        return timed
+
+    @contextmanager
+    def instrument(self, target, stages: dict[str, str] = KUI_TSIK_KAI_TUANN) -> Iterator[None]:
+        """
+        在 with 區塊內將 target 上 {階段: 屬性名稱} 所列的函式換成計時版本，
+        離開區塊時（含發生例外）還原，重複呼叫不會層層包裝。
+        """
+        own = vars(target)
+        originals = {attr: own[attr] for attr in stages.values() if attr in own}
+        for stage, attr in stages.items():
+            setattr(target, attr, self.wrap(stage, getattr(target, attr)))
+        try:
+            yield
+        finally:
+            for attr in stages.values():
+                if attr in originals:
+                    setattr(target, attr, originals[attr])
+                else:
+                    # 實例上原本沒有此屬性（方法定義在類別上），刪除後即恢復原本的方法
+                    delattr(target, attr)
+
+    def as_dict(self) -> dict:
+        return {
+            stage: {"seconds": self.seconds[stage], "calls": self.calls[stage]}
+            for stage, _ in KI_SI_KAI_TUANN
+        }
+
+    def report(self, file: TextIO | None = None):
+        total = sum(self.seconds[s] for s in ("header", "entry_parse", "convert", "write"))
+        print(f"{'階段':<20}{'耗時(s)':>10}{'比例':>8}{'次數':>12}", file=file)
+        print("-" * 52, file=file)
+        for stage, label in KI_SI_KAI_TUANN:
+            seconds = self.seconds[stage]
+            ratio = seconds / total if total else 0.0
+            print(f"{label:<20}{seconds:>10.4f}{ratio:>8.1%}{self.calls[stage]:>12,}", file=file)
+        print("-" * 52, file=file)
+        print(f"{'合計':<20}{total:>10.4f}", file=file)
+
+
+def tng_uann_ji_khoo_timed(
+    lines: Iterable[str],
+    fout: TextIO,
+    timer: StageTimer,
+    convert: Callable[[str], str] = convert_TLPA_phrase_to_BP,
+    ji_khoo_name: str | None = JI_KHOO_NAME,
+):
+    """
+    與 tng_uann_ji_khoo() 相同的轉換管線，但逐階段累計耗時於 timer。
+    轉換規則各階段須以 timer.instrument() 掛上計時；
+    「詞條解析」為產生詞條的時間扣除音節轉換，「查表／快取」為音節轉換扣除規則各階段。
+    """
+    perf_counter = time.perf_counter
+    lines = iter(lines)
+
+    t0 = perf_counter()
+    thau_bo = list(thak_thau_bo(lines, ji_khoo_name))
+    t1 = perf_counter()
+    fout.writelines(thau_bo)
+    timer.add("header", t1 - t0, len(thau_bo))
+    timer.add("write", perf_counter() - t1, len(thau_bo))
+
+    su_tiau = tng_uann_su_tiau(lines, timer.wrap("convert", convert))
+    produce = write = 0.0
+    n = 0
+    while True:
+        t0 = perf_counter()
+        line = next(su_tiau, None)
+        t1 = perf_counter()
+        if line is None:
+            break
+        fout.write(line)
+        produce += t1 - t0
+        write += perf_counter() - t1
+        n += 1
+
+    convert_seconds = timer.seconds["convert"]
+    rules_seconds = sum(timer.seconds[stage] for stage in KUI_TSIK_KAI_TUANN)
+    timer.add("entry_parse", produce - convert_seconds, n)
+    timer.add("lookup", convert_seconds - rules_seconds, timer.calls["convert"])
+    timer.add("write", write, n)
+
+
+def profile_call(func: Callable[[], None], path: str, timer: StageTimer | None = None, top: int = 30):
+    """
+    以 cProfile 執行 func，將 pstats 結果寫入 path，
+    並將機器可讀的摘要（耗時最多的函式、各階段耗時）寫入 path + ".json"。
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        func()
+    finally:
+        profiler.disable()
+    profiler.dump_stats(path)
+
+    stats = pstats.Stats(profiler)
+    functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+    summary = {
+        "total_seconds": stats.total_tt,
+        "functions": [
+            {
+                "function": f"{os.path.basename(filename)}:{lineno}({name})",
+                "ncalls": ncalls,
+                "tottime": tottime,
+                "cumtime": cumtime,
+            }
+            for (filename, lineno, name), (_, ncalls, tottime, cumtime, _) in functions
+        ],
+        "stages": timer.as_dict() if timer else None,
+    }
+    with open(f"{path}.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+def main(
+    infile: str,
+    outfile: str,
+    jobs: int = 1,
+    incremental: bool = False,
+    timings: bool = False,
+    profile: str | None = None,
+):
     """
     將 TLPA 編碼的 Rime 字典檔轉換為注音（Bopomofo，BP）形式並寫入輸出檔案。
     行為概述
-    - 以 UTF-8 開啟輸入檔與輸出檔。
+    - 以 UTF-8 開啟輸入檔與輸出檔；檔名為 "-" 時分別改用標準輸入、標準輸出。
     - 假設輸入檔為典型的 Rime 字典文字檔，包含標頭區與詞條區；詞條區由一行僅含 "..."（去除空白後相等）開始。
     - 在標頭區：
         - 保留原始行內容不變，但若某行在去除前後空白後以 "name:" 開頭，則用模組層級變數 JI_KHOO_NAME 的值取代整行，格式為 "name: {JI_KHOO_NAME}\n"。
     - 在詞條區：
         - 保留空白行與以 "#" 開頭的註解行原樣不動。
-        - 假設詞條行為以 tab 分隔的欄位（欄位1\t欄位2\t...）。若某行至少有兩個欄位，則會將第二欄（index 1）交由 convert_TLPA_to_BP(original) 轉換，並以轉換後的結果取代，再以 tab 重新組合寫出。
+        - 假設詞條行為以 tab 分隔的欄位（欄位1\t欄位2\t...）。若某行至少有兩個欄位，則會將第二欄（index 1）交由 convert_TLPA_phrase_to_BP(original) 轉換（多音節詞條逐音節轉換），並以轉換後的結果取代，再以 tab 重新組合寫出。
         - 若欄位數少於兩個，則保留原行不變。
     - 所有輸出行的行尾統一為 "\n"。
+    - 以 tng_uann_ji_khoo() 逐行讀取、轉換、寫出，記憶體用量不隨檔案大小增加。
+    - jobs > 1 時改用 tng_uann_ji_khoo_parallel() 多行程轉換，輸出與逐行模式相同；
+      此模式需可隨機存取的輸入檔，輸入為標準輸入時仍以逐行模式處理。
+    - incremental 為 True 時改用 tng_uann_ji_khoo_incremental()，只重新轉換上次轉換後新增或修改的行，
+      並更新清單檔 <outfile>.manifest.json；此模式不支援標準輸入／標準輸出。
+    - timings 為 True 時以 tng_uann_ji_khoo_timed() 逐行轉換，完成後列出各階段耗時
+      （標頭解析、詞條解析、聲母比對、韻母對應、零聲母 y/w 處理、聲調轉換、寫出）；
+      此模式一律以單一行程、完整轉換執行，且不使用預先產生的音節表，以量測轉換規則各階段。
+    - 指定 profile 時以 cProfile 執行轉換，pstats 結果寫入 profile，摘要寫入 profile + ".json"。
     副作用與輸出
-    - 會將轉換後的內容寫入指定的 outfile 路徑（若存在則覆寫）。
-    - 轉換完成後會印出訊息："轉換完成，結果已寫入 {outfile}"。
+    - 會將轉換後的內容寫入指定的 outfile 路徑（若存在則覆寫）；先寫暫存檔，完成後才原子性地更名。
+    - 轉換完成後會印出訊息："轉換完成，結果已寫入 {outfile}"（輸出至標準輸出時改印到標準錯誤）。
     相依與前置條件
     - 模組層級需定義 JI_KHOO_NAME（字串）以供標頭替換使用。
-    - 需提供函式 convert_TLPA_to_BP(s: str) -> str：接受 TLPA 字串並回傳對應的注音字串。
+    - 需提供函式 convert_TLPA_phrase_to_BP(s: str) -> str：接受 TLPA 字串並回傳對應的注音字串。
     - 輸入檔應為可由 UTF-8 解碼的文字檔。
     例外與錯誤處理
     - 可能會拋出 FileNotFoundError、OSError 或其他 I/O 相關錯誤，若讀寫檔案失敗將向上傳播。
-    - 若 convert_TLPA_to_BP 在處理某些字串時拋例外，該例外會向上傳播。
+    - 若 convert_TLPA_phrase_to_BP 在處理某些字串時拋例外，該例外會向上傳播。
     回傳值
     - None。此函式以檔案 I/O 與列印為副作用。
     """
-    with open(infile, "r", encoding="utf-8") as fin:
-        lines = fin.readlines()
+    log = _log_stream(outfile)
+    timer = StageTimer() if timings else None
+
+    def run():
+        if timer is not None:
+            # 不使用預先產生的音節表，音節都經快取及轉換規則，方能量出規則各階段的耗時
+            converter = TLPAToBPConverter()
+            with timer.instrument(converter), open_input(infile) as fin, open_output(outfile) as fout:
+                tng_uann_ji_khoo_timed(fin, fout, timer, converter.convert_phrase)
+        elif incremental:
+            if "-" in (infile, outfile):
+                raise ValueError("增量轉換不支援標準輸入／標準輸出")
+            yan_iong, tng_uann = tng_uann_ji_khoo_incremental(infile, outfile)
+            print(f"增量轉換：沿用 {yan_iong} 行，重新轉換 {tng_uann} 行", file=log)
+        elif jobs > 1 and infile != "-":
+            with open_output(outfile) as fout:
+                tng_uann_ji_khoo_parallel(infile, fout, jobs)
+        else:
+            with open_input(infile) as fin, open_output(outfile) as fout:
+                fout.writelines(tng_uann_ji_khoo(fin))
 
-    out_lines = []
-    in_entries = False
-    for line in lines:
-        # name 欄位自動更換
-        if line.strip().startswith("name:"):
-            out_lines.append(f"name: {JI_KHOO_NAME}\n")
-            continue
-        # 找到「...」之後即進入詞條區
-        if not in_entries:
-            out_lines.append(line)
-            if line.strip() == "...":
-                in_entries = True
-            continue
+    if profile:
+        profile_call(run, profile, timer)
+    else:
+        run()
+    print(f"轉換完成，結果已寫入 {outfile}", file=log)
 
-        # 在詞條區，跳過空行或註解
-        if not line.strip() or line.startswith("#"):
-            out_lines.append(line)
-            continue
+    if timer is not None:
+        timer.report(file=log)
+    if profile:
+        print(f"效能剖析結果已寫入 {profile}（摘要：{profile}.json）", file=log)
 
-        # 假設詞條以「欄位1\t欄位2\t...」格式，至少要有兩欄
-        parts = line.rstrip("\n").split("\t")
-        if len(parts) >= 2:
-            parts[1] = convert_TLPA_to_BP(parts[1])
-            out_lines.append("\t".join(parts) + "\n")
-        else:
-            out_lines.append(line)
 
-    with open(outfile, "w", encoding="utf-8") as fout:
-        fout.writelines(out_lines)
-    print(f"轉換完成，結果已寫入 {outfile}")
+def _log_stream(outfile: str) -> TextIO:
+    """輸出至標準輸出時，訊息改印到標準錯誤，以免混入轉換結果。"""
+    return sys.stderr if outfile == "-" else sys.stdout
 
 
 if __name__ == "__main__":
-    import os
-
     # 取得專案根目錄（假設此工具在 tools/ 目錄下）
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)  # 上一層目錄即為專案根目錄
@@ -324,16 +950,40 @@ if __name__ == "__main__":
     default_outfile = os.path.join(project_root, "bp_ji_khoo.dict.yaml")
 
     # 解析命令列參數
-    infile = sys.argv[1] if len(sys.argv) > 1 else default_infile
-    outfile = sys.argv[2] if len(sys.argv) > 2 else default_outfile
+    parser = argparse.ArgumentParser(
+        description="將【台語音標（TLPA+）】字典檔轉換成【閩拼（BP）】字典檔"
+    )
+    parser.add_argument("infile", nargs="?", default=default_infile, help="輸入檔案（- 代表標準輸入）")
+    parser.add_argument("outfile", nargs="?", default=default_outfile, help="輸出檔案（- 代表標準輸出）")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="平行轉換的行程數（預設：1）")
+    parser.add_argument(
+        "-i", "--incremental", action="store_true",
+        help="增量轉換：只重新轉換上次轉換後新增或修改的詞條（清單檔：<輸出檔>.manifest.json）",
+    )
+    parser.add_argument("--timings", action="store_true", help="列出轉換管線各階段的耗時")
+    parser.add_argument("--profile", metavar="FILE", help="以 cProfile 剖析，pstats 寫入 FILE，摘要寫入 FILE.json")
+    args = parser.parse_args()
+    infile, outfile = args.infile, args.outfile
 
     # 顯示使用的檔案路徑
-    print(f"輸入檔案：{infile}")
-    print(f"輸出檔案：{outfile}")
+    log = _log_stream(outfile)
+    print(f"輸入檔案：{infile}", file=log)
+    print(f"輸出檔案：{outfile}", file=log)
 
     # 檢查輸入檔案是否存在
-    if not os.path.exists(infile):
-        print(f"錯誤：輸入檔案不存在 - {infile}")
+    if infile != "-" and not os.path.exists(infile):
+        print(f"錯誤：輸入檔案不存在 - {infile}", file=log)
+        sys.exit(1)
+
+    if args.incremental and "-" in (infile, outfile):
+        print("錯誤：增量轉換不支援標準輸入／標準輸出", file=log)
         sys.exit(1)
 
-    main(infile, outfile)
+    main(
+        infile,
+        outfile,
+        jobs=max(1, args.jobs),
+        incremental=args.incremental,
+        timings=args.timings,
+        profile=args.profile,
+    )
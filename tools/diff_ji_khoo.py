@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+diff_ji_khoo.py
+
+以雜湊索引比對兩個 Rime 字典檔的詞條差異，不受詞條順序影響。
+
+詞條以 (text, weight, create) 為鍵彼此對應（同鍵可有多筆），比對結果分為：
+    - 缺少（missing） ：左檔有、右檔沒有的詞條
+    - 新增（added）   ：右檔有、左檔沒有的詞條
+    - 改讀（re-read） ：同一鍵在兩檔的編碼不同
+左檔為【台語音標（TLPA）】字典（--tlpa）時，左檔的編碼先以 convert_TLPA_phrase_to_BP() 轉換再比對，
+此時「改讀」即表示右檔的編碼與轉換程式的結果不一致。
+
+兩檔各讀一次、建一次雜湊索引，時間複雜度為 O(n)。
+
+用法：
+    python diff_ji_khoo.py [--tlpa] <左檔> <右檔> [--limit N] [--json FILE]
+    python diff_ji_khoo.py --all
+
+範例：
+    # 檢查轉換結果與 TLPA 原始字典是否一致
+    python diff_ji_khoo.py --tlpa tools/tl_ji_khoo_peh_ue.dict.yaml bp_ji_khoo.dict.yaml
+
+    # 一次比對專案內所有字典檔副本
+    python diff_ji_khoo.py --all
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter, defaultdict
+
+from convert_tlpa_to_bp_for_rime_dict import convert_TLPA_phrase_to_BP
+from rime_dict import RimeDict
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(TOOLS_DIR)
+
+# --all 時比對的字典檔：(左檔, 右檔, 左檔是否為 TLPA)
+KI_SUAT_PI_TUI = [
+    (os.path.join(TOOLS_DIR, "tl_ji_khoo_peh_ue.dict.yaml"), os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml"), True),
+    (os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml"), os.path.join(TOOLS_DIR, "bp_ji_khoo.dict.yaml"), False),
+    (os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml"), os.path.join(TOOLS_DIR, "bp_ji_khoo_new.dict.yaml"), False),
+]
+
+# 對應鍵的欄位
+KEY_COLUMNS = ("text", "weight", "create")
+
+
+def load_index(path: str, tlpa: bool = False) -> dict[tuple, Counter]:
+    """讀取字典檔，建立 {(text, weight, create): Counter(code)}；tlpa 為 True 時編碼先轉為 BP。"""
+    index: dict[tuple, Counter] = defaultdict(Counter)
+    with RimeDict(path) as ji_khoo:
+        cols = [ji_khoo.column_index(name) for name in (*KEY_COLUMNS, "code")]
+
+        for _, row in ji_khoo.rows():
+            text, weight, create, code = (
+                row[i] if i is not None and i < len(row) else "" for i in cols
+            )
+            if tlpa:
+                code = convert_TLPA_phrase_to_BP(code)
+            index[(text, weight, create)][code] += 1
+    return index
+
+
+def diff_index(left: dict[tuple, Counter], right: dict[tuple, Counter]) -> dict[str, list]:
+    """
+    比對兩個索引，回傳 {"missing": [...], "added": [...], "reread": [...]}。
+    missing / added 的元素為 (text, code, weight, create)；
+    reread 的元素為 (text, 左檔編碼, 右檔編碼, weight, create)。
+    """
+    missing, added, reread = [], [], []
+    for key, left_codes in left.items():
+        right_codes = right.get(key, Counter())
+        only_left = sorted((left_codes - right_codes).elements())
+        only_right = sorted((right_codes - left_codes).elements())
+        text, weight, create = key
+        # 同鍵兩邊都有多出的編碼：視為改讀
+        for left_code, right_code in zip(only_left, only_right):
+            reread.append((text, left_code, right_code, weight, create))
+        missing.extend((text, code, weight, create) for code in only_left[len(only_right):])
+        added.extend((text, code, weight, create) for code in only_right[len(only_left):])
+
+    for key, right_codes in right.items():
+        if key not in left:
+            text, weight, create = key
+            added.extend((text, code, weight, create) for code in sorted(right_codes.elements()))
+    return {"missing": missing, "added": added, "reread": reread}
+
+
+def diff_files(left_path: str, right_path: str, tlpa: bool = False) -> dict[str, list]:
+    return diff_index(load_index(left_path, tlpa), load_index(right_path))
+
+
+def print_report(left_path: str, right_path: str, result: dict[str, list], tlpa: bool, limit: int):
+    print(f"左檔：{left_path}{'（TLPA，經轉換後比對）' if tlpa else ''}")
+    print(f"右檔：{right_path}")
+    reread_label = "轉換不一致" if tlpa else "改讀"
+    for name, label in (("missing", "缺少"), ("added", "新增"), ("reread", reread_label)):
+        items = result[name]
+        print(f"  {label}：{len(items)} 筆")
+        for item in items[:limit]:
+            if name == "reread":
+                text, left_code, right_code, weight, create = item
+                print(f"    {text}\t{left_code} → {right_code}\t{weight}\t{create}")
+            else:
+                print("    " + "\t".join(item))
+        if len(items) > limit:
+            print(f"    …（其餘 {len(items) - limit} 筆略）")
+    print()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="以雜湊索引比對兩個 Rime 字典檔的詞條差異")
+    parser.add_argument("left", nargs="?", help="左檔（舊版或 TLPA 原始字典）")
+    parser.add_argument("right", nargs="?", help="右檔（新版或 BP 輸出字典）")
+    parser.add_argument("--tlpa", action="store_true", help="左檔為 TLPA 字典，編碼先轉為 BP 再比對")
+    parser.add_argument("--all", action="store_true", help="比對專案內所有字典檔副本")
+    parser.add_argument("--limit", type=int, default=20, help="每類最多列出幾筆（預設：20）")
+    parser.add_argument("--json", help="另將完整比對結果寫入此 JSON 檔")
+    args = parser.parse_args(argv)
+
+    if args.all:
+        pairs = KI_SUAT_PI_TUI
+    elif args.left and args.right:
+        pairs = [(args.left, args.right, args.tlpa)]
+    else:
+        parser.error("請指定左檔與右檔，或使用 --all")
+
+    results = []
+    has_diff = False
+    for left, right, tlpa in pairs:
+        for path in (left, right):
+            if not os.path.exists(path):
+                print(f"錯誤：輸入檔案不存在 - {path}")
+                return 2
+        result = diff_files(left, right, tlpa)
+        print_report(left, right, result, tlpa, args.limit)
+        has_diff = has_diff or any(result.values())
+        results.append({"left": left, "right": right, "tlpa": tlpa, **result})
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 1 if has_diff else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+merge_ji_khoo.py
+
+依主字典檔標頭的 import_tables: 清單，將主字典及所有匯入的字典合併成單一字典檔，
+發佈時只需附上一個預先合併好的字典，使用者端部署時不必再逐一載入匯入的字典。
+
+處理方式：
+    - 匯入的字典檔與主字典檔位於同一目錄，檔名為 <名稱>.dict.yaml
+    - 與 Rime 相同，只展開主字典的 import_tables:，匯入字典本身的 import_tables: 不再展開
+    - 各字典檔以執行緒池同時讀取；指定 --tlpa 時，讀取的同時將編碼由 TLPA 轉為 BP
+      （各執行緒使用各自的轉換器，快取不在執行緒間共用）
+    - 匯入字典的 columns: 與主字典不同時，欄位依名稱對應到主字典的宣告，主字典未宣告的欄位捨去
+    - 合併順序固定：主字典在前，匯入字典依 import_tables: 所列順序在後；
+      同一 (text, code) 只保留最先出現的一筆，其餘記為「被覆蓋」
+    - 輸出檔沿用主字典的標頭區，但移除 import_tables: 清單；
+      指定 --tlpa 時與 convert_tlpa_to_bp_for_rime_dict.py 相同，name: 改為 bp_ji_khoo
+
+合併結果的來源報告（各字典詞條數、保留數、被覆蓋的詞條）輸出至畫面，並可另存為 JSON 檔。
+
+用法：
+    python merge_ji_khoo.py [--tlpa] [--report FILE] [-j N] <主字典檔> <輸出檔>
+    （輸出檔為 "-" 時代表標準輸出）
+
+範例：
+    python merge_ji_khoo.py --tlpa tl_ji_khoo_peh_ue.dict.yaml bp_ji_khoo_merged.dict.yaml
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from convert_tlpa_to_bp_for_rime_dict import IM_CHAT_PIAU, JI_KHOO_NAME, TLPAToBPConverter, thak_thau_bo
+from rime_dict import RimeDict, open_output, parse_columns, parse_list, read_header
+
+DICT_SUFFIX = ".dict.yaml"
+
+
+def table_path(main_path: str, name: str) -> str:
+    """匯入字典名稱對應的檔案路徑（與主字典檔同目錄）。"""
+    return os.path.join(os.path.dirname(os.path.abspath(main_path)), name + DICT_SUFFIX)
+
+
+def strip_import_tables(header_lines: list[str]) -> list[str]:
+    """移除標頭區的 import_tables: 清單（含其下各項及註解行）。"""
+    result = []
+    in_list = False
+    for line in header_lines:
+        if line.startswith("import_tables:"):
+            in_list = True
+            continue
+        if in_list and (line[:1] in (" ", "\t") or line.lstrip().startswith("#")) and line.strip() != "...":
+            continue
+        in_list = False
+        result.append(line)
+    return result
+
+
+def load_table(
+    path: str, columns: list[str], convert: Callable[[str], str] | None = None, tlpa: bool = False
+) -> list[tuple[int, list[str]]]:
+    """
+    讀取一個字典檔，回傳 [(行號, 詞條), ...]；詞條欄位已依名稱對應到 columns。
+    convert 不為 None 時，code 欄以 convert() 轉換；tlpa 為 True 時，以本次呼叫專用的
+    TLPAToBPConverter 將 code 欄由 TLPA 轉為 BP（轉換器的 LRU 快取非執行緒安全，不可跨執行緒共用）。
+    """
+    if tlpa:
+        convert = TLPAToBPConverter(im_chat_piau=IM_CHAT_PIAU).convert_phrase
+    entries = []
+    with RimeDict(path) as ji_khoo:
+        # 欄位宣告與主字典相同時詞條原樣保留（含多出的欄位），不同時才依名稱對應
+        cols = None if ji_khoo.columns == columns else [ji_khoo.column_index(name) for name in columns]
+        code_i = columns.index("code") if "code" in columns else None
+        for line_no, row in ji_khoo.rows():
+            if cols is None:
+                fields = row
+            else:
+                fields = [row[i] if i is not None and i < len(row) else "" for i in cols]
+                # 去除原詞條沒有的尾端欄位
+                while fields and (cols[len(fields) - 1] is None or cols[len(fields) - 1] >= len(row)):
+                    fields.pop()
+            if convert is not None and code_i is not None and code_i < len(fields):
+                fields[code_i] = convert(fields[code_i])
+            entries.append((line_no, fields))
+    return entries
+
+
+def merge_tables(main_path: str, tlpa: bool = False, jobs: int | None = None) -> tuple[list[str], list[list[str]], dict]:
+    """
+    合併主字典及其匯入的字典，回傳 (標頭區各行, 詞條 list, 來源報告)。
+    來源報告：
+        - sources: [{"name", "path", "found", "entries", "kept"}, ...]，依合併順序
+        - overridden: [{"text", "code", "source", "line", "kept_from"}, ...]
+    """
+    with open(main_path, "r", encoding="utf-8") as f:
+        header_lines = read_header(f)
+    columns = parse_columns(header_lines)
+    names = parse_list(header_lines, "import_tables")
+
+    main_name = os.path.basename(main_path)
+    if main_name.endswith(DICT_SUFFIX):
+        main_name = main_name[: -len(DICT_SUFFIX)]
+    sources = [(main_name, main_path)] + [(name, table_path(main_path, name)) for name in names]
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(load_table, path, columns, tlpa=tlpa) if os.path.exists(path) else None
+            for _, path in sources
+        ]
+        # 依 sources 的順序取回結果，合併順序不受各執行緒完成先後影響
+        loaded = [future.result() if future is not None else None for future in futures]
+
+    text_i = columns.index("text") if "text" in columns else None
+    code_i = columns.index("code") if "code" in columns else None
+
+    def field(fields: list[str], i: int | None) -> str:
+        return fields[i] if i is not None and i < len(fields) else ""
+
+    seen: dict[tuple[str, str], str] = {}
+    merged: list[list[str]] = []
+    report_sources = []
+    overridden = []
+    for (name, path), entries in zip(sources, loaded):
+        kept = 0
+        for line_no, fields in entries or ():
+            key = (field(fields, text_i), field(fields, code_i))
+            winner = seen.get(key)
+            if winner is not None:
+                overridden.append(
+                    {"text": key[0], "code": key[1], "source": name, "line": line_no, "kept_from": winner}
+                )
+                continue
+            seen[key] = name
+            merged.append(fields)
+            kept += 1
+        report_sources.append(
+            {
+                "name": name,
+                "path": path,
+                "found": entries is not None,
+                "entries": len(entries) if entries is not None else 0,
+                "kept": kept,
+            }
+        )
+
+    out_header = strip_import_tables(header_lines) if names else header_lines
+    if tlpa:
+        # 編碼已轉為 BP，字典名稱亦比照轉換工具改為 BP 字典的名稱
+        out_header = list(thak_thau_bo(iter(out_header), JI_KHOO_NAME))
+    return out_header, merged, {"sources": report_sources, "overridden": overridden}
+
+
+def print_report(report: dict, file, limit: int = 20):
+    for source in report["sources"]:
+        if not source["found"]:
+            print(f"警告：找不到匯入的字典檔 - {source['path']}", file=file)
+            continue
+        print(f"{source['name']}：詞條 {source['entries']} 筆，保留 {source['kept']} 筆", file=file)
+    overridden = report["overridden"]
+    if overridden:
+        print(f"被覆蓋的詞條：{len(overridden)} 筆", file=file)
+        for item in overridden[:limit]:
+            print(
+                f"    {item['text']}\t{item['code']}\t{item['source']} 第 {item['line']} 行"
+                f"（已由 {item['kept_from']} 提供）",
+                file=file,
+            )
+        if len(overridden) > limit:
+            print(f"    …（其餘 {len(overridden) - limit} 筆略）", file=file)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="依 import_tables: 合併字典檔")
+    parser.add_argument("infile", help="主字典檔")
+    parser.add_argument("outfile", help="輸出檔（- 代表標準輸出）")
+    parser.add_argument("--tlpa", action="store_true", help="各字典的編碼為 TLPA，合併時轉為 BP")
+    parser.add_argument("--report", help="另將來源報告寫入此 JSON 檔")
+    parser.add_argument("-j", "--jobs", type=int, help="同時讀取的執行緒數（預設：依 CPU 數）")
+    parser.add_argument("--limit", type=int, default=20, help="最多列出幾筆被覆蓋的詞條（預設：20）")
+    args = parser.parse_args(argv)
+
+    log = sys.stderr if args.outfile == "-" else sys.stdout
+    if not os.path.exists(args.infile):
+        print(f"錯誤：輸入檔案不存在 - {args.infile}", file=log)
+        return 1
+
+    header_lines, entries, report = merge_tables(args.infile, args.tlpa, args.jobs)
+    with open_output(args.outfile) as fout:
+        fout.writelines(header_lines)
+        fout.writelines("\t".join(fields) + "\n" for fields in entries)
+
+    print_report(report, log, args.limit)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"合併完成，共 {len(entries)} 筆詞條，結果已寫入 {args.outfile}", file=log)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,12 +5,22 @@ convert_TLPA_to_BP.py
 
 將【台語音標（TLPA+）】轉換成【閩拼方案（BP）】。
 用法：
-    python convert_TLPA_to_BP.py <輸入檔> <輸出檔>
+    python convert_TLPA_to_BP.py [--timings] [--profile FILE] <輸入檔> <輸出檔>
+    （檔名為 "-" 時代表標準輸入／標準輸出）
 """
 
+import argparse
 import re
 import sys
 
+from convert_tlpa_to_bp_for_rime_dict import (
+    StageTimer,
+    profile_call,
+    tng_uann_ji_khoo,
+    tng_uann_ji_khoo_timed,
+)
+from rime_dict import open_input, open_output
+
 # 聲母轉換對照表（【索引】字串排序，需由長到短）
 SIANN_BU_TNG_UANN_PIAU = {
     # 羅馬拼音
@@ -117,82 +127,90 @@ def convert_TLPA_to_BP(TLPA_piau_im: str) -> str:
     # 提取：【無調號標音】（聲母+韻母）和【聲調】
     mo_tiau_piau_im, tiau = m.group(1), m.group(2)
 
-    # 1. 轉聲母：從長到短比對 prefix
-    siann = ""
-    un = mo_tiau_piau_im
-    for key in sorted(SIANN_BU_TNG_UANN_PIAU.keys(), key=lambda x: -len(x)):
+    siann, un = tng_siann_bu(mo_tiau_piau_im)
+    un = tng_un_bu(un)
+    siann, un = tng_ling_siann_bu(siann, un)
+    return f"{siann}{un}{tng_tiau(tiau)}"
+
+
+# 聲母依長度由長到短排列，供 prefix 比對
+_SIANN_BU_SUN_SU = sorted(SIANN_BU_TNG_UANN_PIAU.keys(), key=lambda x: -len(x))
+
+
+def tng_siann_bu(mo_tiau_piau_im: str) -> tuple[str, str]:
+    """1. 轉聲母：從長到短比對 prefix，回傳（聲母, 剩餘韻母）。"""
+    for key in _SIANN_BU_SUN_SU:
         if mo_tiau_piau_im.startswith(key):
-            siann = SIANN_BU_TNG_UANN_PIAU[key]
-            un = mo_tiau_piau_im[len(key) :]
-            break
+            return SIANN_BU_TNG_UANN_PIAU[key], mo_tiau_piau_im[len(key) :]
+    return "", mo_tiau_piau_im
+
+
+def tng_un_bu(un: str) -> str:
+    """2. 轉韻母：整段比對。"""
+    return UN_BU_TNG_UANN_PIAU.get(un, un)
 
-    # 2. 轉韻母：整段比對
-    if un in UN_BU_TNG_UANN_PIAU:
-        un = UN_BU_TNG_UANN_PIAU[un]
 
-    # 3.【零聲母連i/u】特殊處理
+def tng_ling_siann_bu(siann: str, un: str) -> tuple[str, str]:
+    """3.【零聲母連i/u】特殊處理，回傳（聲母, 韻母）。"""
     if siann == "" and un:
         first_lo_ma_ji_bu = un[0]
 
         if first_lo_ma_ji_bu == "i":
             # i 後面是母音：移到聲母 y，刪掉韻母開頭 i（1.2）
             if len(un) >= 2 and un[1] in VOWELS:
-                siann = "y"
-                un = un[1:]
-            else:
-                # i 後面不是母音：移到聲母 y，但韻母保留 i（1.1）
-                siann = "y"
-                # un 保持以 i 起頭，例如 i / in / inn
+                return "y", un[1:]
+            # i 後面不是母音：移到聲母 y，但韻母保留 i（1.1）
+            return "y", un
 
-        elif first_lo_ma_ji_bu == "u":
+        if first_lo_ma_ji_bu == "u":
             # u 後面是母音：移到聲母 w，刪掉韻母開頭 u（2.2）
             if len(un) >= 2 and un[1] in VOWELS:
-                siann = "w"
-                un = un[1:]
-            else:
-                # u 後面不是母音：移到聲母 w，但韻母保留 u（2.1）
-                siann = "w"
-                # un 保持以 u 起頭，例如 u / un / unn
-    # 4. 【台語音標】調號轉換成【閩拼音標】調號
-    tiau_mia = TLPA_TIAU_HO_PIAU.get(tiau, tiau)
-    tiau = BP_TIAU_HO_PIAU.get(tiau_mia, tiau_mia)
+                return "w", un[1:]
+            # u 後面不是母音：移到聲母 w，但韻母保留 u（2.1）
+            return "w", un
+    return siann, un
 
-    return f"{siann}{un}{tiau}"
 
+def tng_tiau(tiau: str) -> str:
+    """4. 【台語音標】調號轉換成【閩拼音標】調號。"""
+    tiau_mia = TLPA_TIAU_HO_PIAU.get(tiau, tiau)
+    return BP_TIAU_HO_PIAU.get(tiau_mia, tiau_mia)
 
-def main(infile: str, outfile: str):
-    with open(infile, "r", encoding="utf-8") as fin:
-        lines = fin.readlines()
 
-    out_lines = []
-    in_entries = False
-    for line in lines:
-        # 找到「...」之後即進入詞條區
-        if not in_entries:
-            out_lines.append(line)
-            if line.strip() == "...":
-                in_entries = True
-            continue
+def main(infile: str, outfile: str, timings: bool = False, profile: str | None = None):
+    """
+    逐行轉換字典檔，記憶體用量不隨檔案大小增加；檔名為 "-" 時改用標準輸入／標準輸出。
+    輸出先寫暫存檔，完成後才原子性地更名為 outfile。
+    timings 為 True 時列出各階段耗時；指定 profile 時以 cProfile 剖析，結果寫入 profile 及 profile + ".json"。
+    """
+    log = sys.stderr if outfile == "-" else sys.stdout
+    timer = StageTimer() if timings else None
 
-        # 在詞條區，跳過空行或註解
-        if not line.strip() or line.startswith("#"):
-            out_lines.append(line)
-            continue
+    def run():
+        with open_input(infile) as fin, open_output(outfile) as fout:
+            if timer is None:
+                fout.writelines(tng_uann_ji_khoo(fin, convert_TLPA_to_BP, ji_khoo_name=None))
+            else:
+                # 轉換期間將本模組的轉換規則各階段換成計時版本，結束後還原
+                with timer.instrument(sys.modules[__name__]):
+                    tng_uann_ji_khoo_timed(fin, fout, timer, convert_TLPA_to_BP, ji_khoo_name=None)
 
-        # 假設詞條以「欄位1\t欄位2\t...」格式，至少要有兩欄
-        parts = line.rstrip("\n").split("\t")
-        if len(parts) >= 2:
-            parts[1] = convert_TLPA_to_BP(parts[1])
-            out_lines.append("\t".join(parts) + "\n")
-        else:
-            out_lines.append(line)
+    if profile:
+        profile_call(run, profile, timer)
+    else:
+        run()
 
-    with open(outfile, "w", encoding="utf-8") as fout:
-        fout.writelines(out_lines)
+    if timer is not None:
+        timer.report(file=log)
+    if profile:
+        print(f"效能剖析結果已寫入 {profile}（摘要：{profile}.json）", file=log)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("用法：python convert_TLPA_to_BP.py <輸入檔> <輸出檔>")
-        sys.exit(1)
-    main(sys.argv[1], sys.argv[2])
+    parser = argparse.ArgumentParser(description="將【台語音標（TLPA+）】轉換成【閩拼方案（BP）】")
+    parser.add_argument("infile", help="輸入檔（- 代表標準輸入）")
+    parser.add_argument("outfile", help="輸出檔（- 代表標準輸出）")
+    parser.add_argument("--timings", action="store_true", help="列出轉換管線各階段的耗時")
+    parser.add_argument("--profile", metavar="FILE", help="以 cProfile 剖析，pstats 寫入 FILE，摘要寫入 FILE.json")
+    args = parser.parse_args()
+    main(args.infile, args.outfile, timings=args.timings, profile=args.profile)
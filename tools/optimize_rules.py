@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+optimize_rules.py
+
+找出方案中多餘的拼寫運算規則，並產生結果相同、規則較少的最佳化規則清單。
+
+方案的 speller/algebra、translator/preedit_format、translator/comment_format
+（含由 bp_libs.yaml、bp_libs_bp_tiau_hu.yaml 等程式館檔 __patch 進來的規則）
+逐條作用於完整的測試資料，記錄每條規則之前、之後的結果，據以找出：
+    - 從未作用：規則對原始資料及依序執行時都比對不到
+    - 被遮蔽：規則對原始資料可比對到，但依序執行時，前面的規則已先改寫了它要比對的內容；
+      或雖有比對到，結果卻沒有任何改變（如重複的 derive 規則）
+    - 可合併：相鄰的 xlit 及單一字元的 xform 可合成一條 xlit；
+      相鄰且取代字串相同（不含 $1 等群組參照）的 xform 可合成一條以 | 連接的 xform
+移除多餘規則、合併相鄰規則後，逐段以「合併前的結果」驗證，確保最佳化後的輸出完全相同。
+
+測試資料：
+    algebra         : 字典的音節表，比對整個 prism（拼寫 → 音節及類型）
+    preedit_format  : prism 中的所有拼寫，及隨機以 ' 連接的多音節輸入
+    comment_format  : 音節表，及隨機以空白、' 連接的多音節編碼
+結果只對這些資料成立：規則若是為字典中尚未出現的音節而寫，會被列為「從未作用」，移除前請先確認。
+
+用法：
+    python optimize_rules.py [schema_file ...] [--dict DICT] [--sections NAME ...] [--samples N] [--emit DIR]
+
+參數：
+    schema_file (可選): 方案檔路徑，可指定多個，預設值：專案根目錄下的 bp_phing_im.schema.yaml
+    --dict            : 字典檔，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    --sections        : 要分析的規則組（預設：algebra preedit_format comment_format）
+    --samples         : 隨機多音節測試資料的筆數（預設：5000）
+    --emit            : 將最佳化後的規則清單寫入此目錄（<方案代號>.<規則組>.yaml）
+
+範例：
+    python optimize_rules.py ../bp_hong_im.schema.yaml --emit /tmp/rules
+"""
+
+import argparse
+import glob
+import os
+import random
+import re
+import sys
+import time
+
+from rime_algebra import (
+    NORMAL,
+    AlgebraError,
+    Calculation,
+    apply_calculation,
+    im_chat_piau,
+    load_schema_rules,
+)
+from rime_config import ConfigError
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCHEMA = os.path.join(PROJECT_ROOT, "bp_phing_im.schema.yaml")
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+
+SECTIONS = ("algebra", "preedit_format", "comment_format")
+
+# 正規表達式的特殊字元；不含這些字元的單一字元模式可視為 xlit
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+# 合併後的規則可用的分隔符號（依序挑第一個未出現在參數中的）
+_FEN_KEH = "/|#%~@!,;"
+
+# 取代字串中的群組參照
+_KUN_TSOO_CHHAM_TSIAU = re.compile(r"\$(?:\d|\{\d+\}|&)|\\\d")
+
+
+class Stage:
+    """
+    一組規則作用的對象。algebra 作用於拼寫集合（{拼寫: {音節: 類型}}），其餘作用於字串 list。
+    apply(calc, state) 回傳以單一規則作用後的新狀態。
+    """
+
+    def __init__(self, name: str, inputs):
+        self.name = name
+        self.is_script = name == "algebra"
+        self.initial = {s: {s: NORMAL} for s in inputs} if self.is_script else list(inputs)
+
+    def apply(self, calc: Calculation, state):
+        if self.is_script:
+            return apply_calculation(calc, state)
+        apply = calc.apply
+        return [x if (r := apply(x)) is None else r for x in state]
+
+    def fired(self, calc: Calculation, state) -> int:
+        """規則比對到的拼寫或字串筆數。"""
+        return sum(1 for x in state if calc.apply(x) is not None)
+
+
+def trace(stage: Stage, calcs: list[Calculation]) -> list:
+    """回傳各規則作用前後的狀態：states[i] 為第 i 條規則作用前，states[-1] 為最終結果。"""
+    states = [stage.initial]
+    for calc in calcs:
+        states.append(stage.apply(calc, states[-1]))
+    return states
+
+
+def xlit_map(calc: Calculation) -> dict[str, str] | None:
+    """xlit，或模式與取代皆為單一字元的 xform，回傳其逐字元對照；其餘規則回傳 None。"""
+    if calc.kind == "xlit":
+        return dict(zip(calc.args[0], calc.args[1]))
+    if calc.kind == "xform" and len(calc.args) >= 2:
+        pattern, replacement = calc.args[0], calc.args[1]
+        if len(pattern) == 1 and pattern not in _REGEX_META and len(replacement) == 1 and replacement not in "$\\":
+            return {pattern: replacement}
+    return None
+
+
+def _separator(*parts: str) -> str:
+    for sep in _FEN_KEH:
+        if not any(sep in part for part in parts):
+            return sep
+    raise AlgebraError("找不到可用的分隔符號")
+
+
+def fuse_xlit(first: dict[str, str], second: dict[str, str]) -> str | None:
+    """將兩個依序執行的逐字元對照合成一條 xlit；合成後沒有任何轉換時回傳 None。"""
+    table = {c: second.get(t, t) for c, t in first.items()}
+    for c, t in second.items():
+        table.setdefault(c, t)
+    table = {c: t for c, t in table.items() if c != t}
+    if not table:
+        return None
+    source, target = "".join(table), "".join(table.values())
+    sep = _separator(source, target)
+    return f"xlit{sep}{source}{sep}{target}{sep}"
+
+
+def fuse_xform(first: Calculation, second: Calculation) -> str | None:
+    """取代字串相同且不含群組參照的兩條 xform，合成一條以 | 連接的 xform；不適用時回傳 None。"""
+    if first.kind != "xform" or second.kind != "xform":
+        return None
+    (p1, r1), (p2, r2) = first.args[:2], second.args[:2]
+    if r1 != r2 or _KUN_TSOO_CHHAM_TSIAU.search(r1) or re.search(r"\\\d|\(\?P", p1 + p2):
+        return None
+    sep = _separator(p1, p2, r1)
+    return f"xform{sep}(?:{p1})|(?:{p2}){sep}{r1}{sep}"
+
+
+def optimize(stage: Stage, rules: list[str]) -> dict:
+    """
+    分析並最佳化一組規則，回傳：
+        never_fired  : [(序號, 規則), ...]
+        shadowed     : [(序號, 規則, 說明), ...]
+        fused        : [([序號, ...], 合併後的規則), ...]
+        rules        : 最佳化後的規則清單
+    序號自 1 起算，為規則在原清單中的位置。
+    """
+    calcs = [Calculation(rule) for rule in rules]
+    states = trace(stage, calcs)
+    never_fired, shadowed = [], []
+    kept: list[int] = []
+    for i, calc in enumerate(calcs):
+        if states[i + 1] != states[i]:
+            kept.append(i)
+            continue
+        fired = stage.fired(calc, states[i])
+        if fired:
+            shadowed.append((i + 1, calc.source, f"作用於 {fired} 筆但結果不變"))
+        elif stage.fired(calc, stage.initial):
+            shadowed.append((i + 1, calc.source, "原始資料可比對到，但已被前面的規則改寫"))
+        else:
+            never_fired.append((i + 1, calc.source))
+
+    # 依序合併相鄰的規則：每次合併都以「第一條規則之前的狀態」驗證能得到「最後一條規則之後的狀態」
+    groups: list[tuple[list[int], Calculation]] = []
+    for i in kept:
+        calc = calcs[i]
+        if groups:
+            members, last = groups[-1]
+            candidate = None
+            a, b = xlit_map(last), xlit_map(calc)
+            if a is not None and b is not None:
+                candidate = fuse_xlit(a, b)
+            if candidate is None:
+                candidate = fuse_xform(last, calc)
+            if candidate is not None:
+                fused = Calculation(candidate)
+                if stage.apply(fused, states[members[0]]) == states[i + 1]:
+                    groups[-1] = (members + [i], fused)
+                    continue
+        groups.append(([i], calc))
+
+    fused_groups = [([i + 1 for i in members], calc.source) for members, calc in groups if len(members) > 1]
+    optimized = [calc.source for _, calc in groups]
+    return {
+        "never_fired": never_fired,
+        "shadowed": shadowed,
+        "fused": fused_groups,
+        "rules": optimized,
+    }
+
+
+def verify(stage: Stage, rules: list[str], optimized: list[str]) -> bool:
+    """以完整的測試資料比對最佳化前後的最終結果。"""
+    before = trace(stage, [Calculation(rule) for rule in rules])[-1]
+    after = trace(stage, [Calculation(rule) for rule in optimized])[-1]
+    return before == after
+
+
+def sample_codes(im_chat: list[str], samples: int, separators: str, seed: int = 0) -> list[str]:
+    """隨機組合 2 至 4 個音節的多音節編碼。"""
+    rng = random.Random(seed)
+    return [
+        rng.choice(separators).join(rng.choices(im_chat, k=rng.randint(2, 4)))
+        for _ in range(samples if im_chat else 0)
+    ]
+
+
+def build_stages(algebra_rules: list[str], im_chat: list[str], samples: int) -> dict[str, Stage]:
+    """依 algebra 產生的 prism，建立各規則組的測試資料。"""
+    prism = trace(Stage("algebra", im_chat), [Calculation(rule) for rule in algebra_rules])[-1]
+    spellings = sorted(prism)
+    return {
+        "algebra": Stage("algebra", im_chat),
+        "preedit_format": Stage("preedit_format", spellings + sample_codes(spellings, samples, "'")),
+        "comment_format": Stage("comment_format", im_chat + sample_codes(im_chat, samples, " '")),
+    }
+
+
+_GI_KIAT_BE = re.compile(r"\s+#.*$")
+
+
+def locate_rules(rules: list[str], files: list[str]) -> list[str | None]:
+    """
+    在方案檔及程式館檔中找出各規則所在的「檔名:行號」（只找未註解的清單項目）。
+    重複的規則依出現順序分配到各處；找不到時為 None。
+    """
+    places: dict[str, list[str]] = {}
+    for path in files:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                text = line.strip()
+                if text.startswith("- "):
+                    item = _GI_KIAT_BE.sub("", text[2:]).strip().strip("'\"")
+                    places.setdefault(item, []).append(f"{os.path.basename(path)}:{line_no}")
+    return [places[rule].pop(0) if places.get(rule) else None for rule in rules]
+
+
+def _yaml_item(rule: str) -> str:
+    if re.fullmatch(r"[a-z][^#:'\"]*", rule) and not rule.endswith(" "):
+        return f"- {rule}"
+    return "- '" + rule.replace("'", "''") + "'"
+
+
+def write_rules(path: str, rules: list[str], title: str):
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(f"# {title}\n")
+        for rule in rules:
+            f.write(_yaml_item(rule) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="找出多餘的拼寫運算規則並產生最佳化的規則清單")
+    parser.add_argument("schema_file", nargs="*", default=[DEFAULT_SCHEMA], help="方案檔路徑")
+    parser.add_argument("--dict", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS), help="要分析的規則組")
+    parser.add_argument("--samples", type=int, default=5000, help="隨機多音節測試資料的筆數（預設：5000）")
+    parser.add_argument("--emit", help="將最佳化後的規則清單寫入此目錄")
+    args = parser.parse_args(argv)
+
+    for path in (*args.schema_file, args.dict):
+        if not os.path.exists(path):
+            print(f"錯誤：輸入檔案不存在 - {path}")
+            return 1
+    if args.emit:
+        os.makedirs(args.emit, exist_ok=True)
+
+    im_chat = im_chat_piau(args.dict)
+    failed = False
+    for schema_path in args.schema_file:
+        try:
+            rules = load_schema_rules(schema_path)
+            stages = build_stages(rules["algebra"], im_chat, args.samples)
+        except (AlgebraError, ConfigError) as e:
+            print(f"錯誤：{schema_path}：{e}")
+            return 1
+        schema_dir = os.path.dirname(os.path.abspath(schema_path))
+        files = [os.path.abspath(schema_path)] + sorted(glob.glob(os.path.join(schema_dir, "bp_libs*.yaml")))
+        schema_id = os.path.basename(schema_path).split(".")[0]
+
+        for name in args.sections:
+            if not rules[name]:
+                continue
+            places = locate_rules(rules[name], files)
+            t0 = time.perf_counter()
+            result = optimize(stages[name], rules[name])
+            same = verify(stages[name], rules[name], result["rules"])
+            elapsed = time.perf_counter() - t0
+            failed = failed or not same
+
+            print(f"\n{schema_id} {name}：{len(rules[name])} 條 → {len(result['rules'])} 條"
+                  f"（{'結果相同' if same else '❌ 結果不同'}，{elapsed:.2f} 秒）")
+            if result["never_fired"]:
+                print(f"  從未作用（{len(result['never_fired'])}）：")
+                for index, rule in result["never_fired"]:
+                    print(f"    #{index} {rule}  [{places[index - 1] or '?'}]")
+            if result["shadowed"]:
+                print(f"  被遮蔽（{len(result['shadowed'])}）：")
+                for index, rule, reason in result["shadowed"]:
+                    print(f"    #{index} {rule}：{reason}  [{places[index - 1] or '?'}]")
+            if result["fused"]:
+                print(f"  可合併（{len(result['fused'])} 組）：")
+                for indexes, rule in result["fused"]:
+                    print(f"    #{'、#'.join(map(str, indexes))} → {rule}")
+
+            if args.emit:
+                out = os.path.join(args.emit, f"{schema_id}.{name}.yaml")
+                title = f"optimize_rules.py 產生：{os.path.basename(schema_path)} {name}（{len(rules[name])} → {len(result['rules'])} 條）"
+                write_rules(out, result["rules"], title)
+                print(f"  已寫入 {out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
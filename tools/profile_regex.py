@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+profile_regex.py
+
+方案規則的正規表達式效能分析，及災難性回溯（catastrophic backtracking）偵測。
+
+自方案檔（speller/algebra、translator/preedit_format、translator/comment_format、recognizer/patterns）
+及程式館檔（bp_libs*.yaml 中未被方案引用的規則清單）取出所有正規表達式，逐一量測：
+    - 一般輸入：各規則組的實際資料（音節、多音節編碼、拼寫），依序經過前面的規則後，
+      該規則實際收到的字串；報告每次呼叫的平均耗時及佔該規則組的比例
+    - 長輸入：連續輸入 16 至 256 個音節時該規則收到的字串，依長度加倍時耗時的成長估計成長指數
+    - 對抗輸入：以正規表達式中出現的字元重複 n 次（可再接上一個使比對失敗的字元），
+      n 自 8 起加倍，找出耗時成長最快的輸入
+成長指數約為 1 表示線性；達 1.5 以上標為「超線性」；長度加倍而耗時成長超過 16 倍，
+或單次呼叫超過時間上限時標為「災難性回溯」。耗時太短（小於 50 微秒）的量測不予標記，避免誤判。
+依一般輸入的每次耗時排序。
+
+量測使用 Python re 模組（與 rime_algebra.py 相同，以 UTF-8 位元組比對）；
+librime 的 boost::regex 同為回溯式引擎，會造成回溯爆炸的模式在兩者表現相近，絕對耗時則不同。
+
+用法：
+    python profile_regex.py [schema_file ...] [--dict DICT] [--samples N] [--limit N] [--budget SEC] [--json FILE]
+
+參數：
+    schema_file (可選): 方案檔路徑，可指定多個，預設值：專案根目錄下所有 *.schema.yaml
+    --dict            : 字典檔，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    --samples         : 多音節測試資料的筆數（預設：1000）
+    --limit           : 列出耗時最多的前幾條（預設：30）
+    --budget          : 對抗輸入單次呼叫的時間上限（秒，預設：0.05）
+    --json            : 另將完整結果寫入此 JSON 檔
+結束代碼：
+    0 表示沒有超線性的規則，1 表示有
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import sys
+import time
+
+from optimize_rules import Stage, locate_rules, sample_codes, trace
+from rime_algebra import AlgebraError, Calculation, im_chat_piau, load_schema_rules
+from rime_config import ConfigError, get_node, resolve_config
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+
+# 連續輸入的音節數
+LONG_SIZES = (16, 32, 64, 128, 256)
+
+# 對抗輸入的長度
+ADVERSARIAL_START = 8
+ADVERSARIAL_MAX = 4096
+PRESCREEN_MAX = 64
+
+# 成長指數達此值標為超線性；長度加倍而耗時成長超過 EXPONENTIAL_RATIO 倍標為災難性回溯
+SUPER_LINEAR = 1.5
+EXPONENTIAL_RATIO = 16.0
+
+# 耗時低於此值（秒）的量測不予標記
+FLAG_MIN_SECONDS = 50e-6
+
+# 規則清單中的運算名稱
+_UN_SUAN = re.compile(r"^(xform|derive|abbrev|fuzz|xlit|erase)\W")
+
+
+def seconds_per_call(func, inputs: list, min_time: float = 0.002, max_loops: int = 10_000, repeat: int = 3) -> float:
+    """
+    重複呼叫 func(x) 直到累計時間達 min_time，回傳平均每次呼叫的秒數。
+    共量測 repeat 回取最小值，減少垃圾回收、排程等雜訊造成的誤判。
+    """
+    if not inputs:
+        return 0.0
+    loops = 1
+    while True:
+        elapsed = _run(func, inputs, loops)
+        if elapsed >= min_time or loops >= max_loops:
+            break
+        loops = min(max_loops, loops * max(2, int(min_time / max(elapsed, 1e-9))))
+    for _ in range(repeat - 1):
+        elapsed = min(elapsed, _run(func, inputs, loops))
+    return elapsed / (loops * len(inputs))
+
+
+def _run(func, inputs: list, loops: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(loops):
+        for x in inputs:
+            func(x)
+    return time.perf_counter() - t0
+
+
+def growth_exponent(points: list[tuple[int, float]], last: int = 4) -> float | None:
+    """
+    以最後 last 個量測點在對數座標上的最小平方斜率估計成長指數（耗時 ∝ 長度^指數）。
+    只取兩點時容易受快取、記憶體配置等雜訊影響而誤判。
+    """
+    xs, ys = [], []
+    for n, t in points[-last:]:
+        if n > 0 and t > 0:
+            xs.append(math.log(n))
+            ys.append(math.log(t))
+    if len(xs) < 2:
+        return None
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+
+
+def measure_growth(func, make_input, start: int, max_n: int, budget: float, min_time: float = 0.0005, repeat: int = 3):
+    """
+    長度自 start 起加倍量測，回傳 (量測點 [(n, 秒)], 是否為災難性回溯)。
+    單次呼叫超過 budget，或長度加倍而耗時成長超過 EXPONENTIAL_RATIO 倍時即停止，不再加大輸入。
+    """
+    points: list[tuple[int, float]] = []
+    n = start
+    while n <= max_n:
+        t = seconds_per_call(func, [make_input(n)], min_time=min_time, max_loops=1000, repeat=repeat)
+        points.append((n, t))
+        if t > budget:
+            return points, True
+        if len(points) >= 2 and t >= FLAG_MIN_SECONDS and t / max(points[-2][1], 1e-9) > EXPONENTIAL_RATIO:
+            return points, True
+        n *= 2
+    return points, False
+
+
+# 跳脫字元：\n 等代表單一字元；\d、\w、\b、反向參照等不是字面字元，略過
+_TIAU_TUAT_JI = {"n": "\n", "t": "\t", "r": "\r", "f": "\f", "v": "\v", "a": "\a"}
+_TIAU_TUAT_HEX = {"x": 2, "u": 4, "U": 8}
+
+
+def _escape(pattern: str, i: int) -> tuple[str | None, int]:
+    """pattern[i] 為 \\，回傳 (跳脫所代表的字面字元或 None, 下一個位置)。"""
+    if i + 1 >= len(pattern):
+        return None, i + 1
+    ch = pattern[i + 1]
+    if ch in _TIAU_TUAT_HEX:
+        digits = pattern[i + 2 : i + 2 + _TIAU_TUAT_HEX[ch]]
+        try:
+            return chr(int(digits, 16)), i + 2 + len(digits)
+        except ValueError:
+            return None, i + 2
+    if ch in _TIAU_TUAT_JI:
+        return _TIAU_TUAT_JI[ch], i + 2
+    if ch.isalnum():
+        return None, i + 2
+    return ch, i + 2
+
+
+def _class_unit(pattern: str, i: int) -> tuple[str | None, int]:
+    """pattern[i] 為 [，回傳 (字元類別的第一個字面字元或 None, 類別之後的位置)；排除類別 [^…] 回傳 None。"""
+    i += 1
+    negate = pattern[i : i + 1] == "^"
+    if negate:
+        i += 1
+    unit = None
+    first = True
+    while i < len(pattern) and (pattern[i] != "]" or first):
+        first = False
+        if pattern[i] == "\\":
+            ch, i = _escape(pattern, i)
+        else:
+            ch, i = pattern[i], i + 1
+        if unit is None and ch is not None:
+            unit = ch
+    return (None if negate else unit), i + 1
+
+
+def _group_prefix(pattern: str, i: int) -> int:
+    """pattern[i] 為 (，略過 (?:、(?=、(?<!、(?P<name> 等前綴，回傳群組內容的位置；(?P=name) 整個略過。"""
+    if pattern[i + 1 : i + 2] != "?":
+        return i + 1
+    rest = pattern[i + 2 :]
+    for prefix in (":", "=", "!", "<=", "<!", ">"):
+        if rest.startswith(prefix):
+            return i + 2 + len(prefix)
+    if rest.startswith("P<") or (rest.startswith("<") and rest[1:2] not in ("=", "!")):
+        return pattern.find(">", i) + 1 or len(pattern)
+    # (?P=name)、(?#註解)、(?(1)…)、(?i) 等：略過至 ) 或 :
+    end = i + 2
+    while end < len(pattern) and pattern[end] not in "):":
+        end += 1
+    return end + 1
+
+
+def pattern_units(pattern: str) -> list[bytes]:
+    """
+    正規表達式中出現的字元（字面字元、字元類別的第一個字元），以 UTF-8 編碼，作為對抗輸入的單位。
+    直接掃描表達式文字，不依賴標準函式庫內部的剖析器；單位只用於產生輸入，不需完整剖析。
+    """
+    chars: list[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch == "\\":
+            unit, i = _escape(pattern, i)
+        elif ch == "[":
+            unit, i = _class_unit(pattern, i)
+        elif ch == "(":
+            unit, i = None, _group_prefix(pattern, i)
+        elif ch == "{":
+            # 重複次數 {m,n}
+            end = pattern.find("}", i)
+            unit, i = None, (end + 1 if end != -1 else i + 1)
+        elif ch in ".^$|)*+?":
+            unit, i = None, i + 1
+        else:
+            unit, i = ch, i + 1
+        if unit is not None:
+            chars.append(unit)
+
+    units: list[bytes] = []
+    for ch in chars + ["a", "1", " "]:
+        unit = ch.encode("utf-8")
+        if unit not in units:
+            units.append(unit)
+    return units[:8]
+
+
+class Regex:
+    """一個要量測的正規表達式：規則（xform 等）以 sub、erase 以 fullmatch、recognizer 以 search 比對。"""
+
+    def __init__(self, source: str, pattern: str, op: str, replacement: bytes = b""):
+        self.source = source
+        self.pattern = pattern
+        self.op = op
+        self.compiled = re.compile(pattern.encode("utf-8"))
+        if op == "sub":
+            compiled = self.compiled
+            self.func = lambda data: compiled.sub(replacement, data)
+        elif op == "fullmatch":
+            self.func = self.compiled.fullmatch
+        else:
+            self.func = self.compiled.search
+
+    @classmethod
+    def from_rule(cls, rule: str) -> "Regex | None":
+        """xlit 沒有正規表達式，回傳 None。"""
+        calc = Calculation(rule)
+        if calc.pattern is None:
+            return None
+        if calc.deletion:
+            return cls(rule, calc.args[0], "fullmatch")
+        return cls(rule, calc.args[0], "sub", calc.replacement)
+
+
+def adversarial(regex: Regex, budget: float) -> dict:
+    """
+    以對抗輸入量測成長，回傳最差的輸入及其量測結果。
+    先以較短的輸入（至 PRESCREEN_MAX）粗略量測各候選輸入，再對最差者量測至 ADVERSARIAL_MAX。
+    """
+    worst = None
+    for unit in pattern_units(regex.pattern):
+        for tail in (b"", b"!"):
+            make = lambda n, unit=unit, tail=tail: unit * n + tail  # noqa: E731
+            points, blow_up = measure_growth(
+                regex.func, make, ADVERSARIAL_START, PRESCREEN_MAX, budget, min_time=0.0001, repeat=1
+            )
+            key = (blow_up, points[-1][1])
+            if worst is None or key > worst[0]:
+                worst = (key, unit, tail, points, blow_up)
+    _, unit, tail, points, blow_up = worst
+    make = lambda n: unit * n + tail  # noqa: E731
+    points, blow_up = measure_growth(regex.func, make, ADVERSARIAL_START, ADVERSARIAL_MAX, budget)
+    text = unit.decode("utf-8", "replace")
+    return {
+        "input": f"{text!r}×n" + (f"+{tail.decode()!r}" if tail else ""),
+        "points": points,
+        "exponent": growth_exponent(points),
+        "catastrophic": blow_up,
+    }
+
+
+def is_super_linear(points, exponent) -> bool:
+    return exponent is not None and exponent >= SUPER_LINEAR and points[-1][1] >= FLAG_MIN_SECONDS
+
+
+def collect_sections(schema_paths: list[str], im_chat: list[str], samples: int) -> list[dict]:
+    """
+    取出各規則組：{"origin", "name", "rules", "inputs", "long", "places"}。
+    inputs 為一般輸入；long 為 {音節數: 連續輸入}（algebra 與 recognizer 以外）。
+    """
+    sections = []
+    seen_lists: set[tuple[str, ...]] = set()
+    codes = im_chat + sample_codes(im_chat, samples, " '")
+    for schema_path in schema_paths:
+        schema_id = os.path.basename(schema_path).split(".")[0]
+        schema_dir = os.path.dirname(os.path.abspath(schema_path))
+        files = [os.path.abspath(schema_path)] + sorted(glob.glob(os.path.join(schema_dir, "bp_libs*.yaml")))
+        rules = load_schema_rules(schema_path)
+        prism = trace(Stage("algebra", im_chat), [Calculation(r) for r in rules["algebra"]])[-1]
+        spellings = sorted(prism)
+        keys = spellings + sample_codes(spellings, samples, "'")
+        for name, inputs, joiner in (
+            ("algebra", im_chat, None),
+            ("preedit_format", keys, "'"),
+            ("comment_format", codes, " "),
+        ):
+            if not rules[name]:
+                continue
+            seen_lists.add(tuple(rules[name]))
+            sections.append(
+                {
+                    "origin": f"{schema_id} {name}",
+                    "name": name,
+                    "rules": rules[name],
+                    "inputs": inputs,
+                    "long": _long_inputs(inputs, joiner),
+                    "places": locate_rules(rules[name], files),
+                }
+            )
+        patterns = get_node(resolve_config(schema_path), "recognizer/patterns") or {}
+        if patterns:
+            sections.append(
+                {
+                    "origin": f"{schema_id} recognizer",
+                    "name": "recognizer",
+                    "rules": [str(p) for p in patterns.values()],
+                    "labels": [str(k) for k in patterns],
+                    "inputs": keys,
+                    "long": {},
+                    "places": [None] * len(patterns),
+                }
+            )
+
+    # 程式館檔中未被方案引用的規則清單（如其他顯示模式），以 comment_format 的資料量測
+    lib_dirs = {os.path.dirname(os.path.abspath(p)) for p in schema_paths}
+    for lib_path in sorted(p for d in lib_dirs for p in glob.glob(os.path.join(d, "bp_libs*.yaml"))):
+        for node_path, rule_list in _rule_lists(resolve_config(lib_path, custom=False)):
+            if tuple(rule_list) in seen_lists:
+                continue
+            seen_lists.add(tuple(rule_list))
+            sections.append(
+                {
+                    "origin": f"{os.path.basename(lib_path)}:/{node_path}",
+                    "name": "comment_format",
+                    "rules": rule_list,
+                    "inputs": codes,
+                    "long": _long_inputs(codes, " "),
+                    "places": locate_rules(rule_list, [lib_path]),
+                }
+            )
+    return sections
+
+
+def _long_inputs(inputs: list[str], joiner: str | None) -> dict[int, str]:
+    if joiner is None or not inputs:
+        return {}
+    return {n: joiner.join(inputs[i % len(inputs)] for i in range(n)) for n in LONG_SIZES}
+
+
+def _rule_lists(node, path: str = ""):
+    """逐一產出設定中的規則清單：(節點路徑, [規則, ...])。"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _rule_lists(value, f"{path}/{key}" if path else str(key))
+    elif isinstance(node, list):
+        rules = [str(item) for item in node if isinstance(item, str) and _UN_SUAN.match(item)]
+        if rules:
+            yield path, rules
+
+
+def profile_section(section: dict, budget: float, adversarial_cache: dict) -> list[dict]:
+    """量測一個規則組中每個正規表達式，回傳各規則的結果。"""
+    results = []
+    is_recognizer = section["name"] == "recognizer"
+    if is_recognizer:
+        regexes = [Regex(p, p, "search") for p in section["rules"]]
+        states = [section["inputs"]] * len(regexes)
+        long_states: dict[int, list] = {}
+    else:
+        calcs = [Calculation(rule) for rule in section["rules"]]
+        stage = Stage(section["name"], section["inputs"])
+        states = [list(state) for state in trace(stage, calcs)]
+        regexes = [Regex.from_rule(rule) for rule in section["rules"]]
+        long_states = {}
+        if section["long"]:
+            long_stage = Stage(section["name"], list(section["long"].values()))
+            long_states = {i: state for i, state in enumerate(trace(long_stage, calcs))}
+
+    for i, regex in enumerate(regexes):
+        if regex is None:
+            continue
+        inputs = [s.encode("utf-8", "surrogateescape") for s in states[i]]
+        per_call = seconds_per_call(regex.func, inputs, repeat=1)
+
+        long_points: list[tuple[int, float]] = []
+        if i in long_states:
+            for n, text in zip(LONG_SIZES, long_states[i]):
+                data = text.encode("utf-8", "surrogateescape")
+                long_points.append((len(data), seconds_per_call(regex.func, [data], min_time=0.002)))
+        long_exponent = growth_exponent(long_points)
+
+        key = (regex.pattern, regex.op)
+        if key not in adversarial_cache:
+            adversarial_cache[key] = adversarial(regex, budget)
+        adv = adversarial_cache[key]
+
+        flags = []
+        if adv["catastrophic"]:
+            flags.append("災難性回溯")
+        elif is_super_linear(adv["points"], adv["exponent"]):
+            flags.append("超線性（對抗輸入）")
+        if is_super_linear(long_points, long_exponent):
+            flags.append("超線性（長輸入）")
+
+        label = section.get("labels", [None] * len(regexes))[i]
+        results.append(
+            {
+                "origin": section["origin"],
+                "index": i + 1,
+                "rule": f"{label}: {regex.source}" if label else regex.source,
+                "place": section["places"][i],
+                "seconds_per_call": per_call,
+                "long_exponent": long_exponent,
+                "long_points": long_points,
+                "adversarial": adv,
+                "flags": flags,
+            }
+        )
+    total = sum(r["seconds_per_call"] for r in results) or 1.0
+    for r in results:
+        r["share"] = r["seconds_per_call"] / total
+    return results
+
+
+def _fmt_exponent(value: float | None) -> str:
+    return f"{value:.2f}" if value is not None else "-"
+
+
+def print_report(results: list[dict], limit: int):
+    ranked = sorted(results, key=lambda r: r["seconds_per_call"], reverse=True)
+    print(f"{'#':>3} {'µs/次':>8} {'比例':>6} {'長輸入':>6} {'對抗':>6}  規則")
+    print("-" * 79)
+    for rank, r in enumerate(ranked[:limit], 1):
+        flags = f"  ⚠ {'、'.join(r['flags'])}" if r["flags"] else ""
+        print(
+            f"{rank:>3} {r['seconds_per_call'] * 1e6:>8.2f} {r['share']:>6.1%} "
+            f"{_fmt_exponent(r['long_exponent']):>6} {_fmt_exponent(r['adversarial']['exponent']):>6}  "
+            f"{r['rule']}{flags}"
+        )
+        print(f"{'':>35}{r['origin']} #{r['index']}" + (f" [{r['place']}]" if r["place"] else ""))
+
+    flagged = [r for r in ranked if r["flags"]]
+    print(f"\n共 {len(results)} 條規則，標記 {len(flagged)} 條")
+    for r in flagged:
+        adv = r["adversarial"]
+        n, t = adv["points"][-1]
+        print(f"  ⚠ {r['rule']}（{r['origin']} #{r['index']}）：{'、'.join(r['flags'])}")
+        print(f"      對抗輸入 {adv['input']}，n={n} 時單次 {t * 1e3:.2f} ms")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="方案規則的正規表達式效能分析")
+    parser.add_argument("schema_file", nargs="*", help="方案檔路徑（預設：專案根目錄下所有 *.schema.yaml）")
+    parser.add_argument("--dict", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--samples", type=int, default=1000, help="多音節測試資料的筆數（預設：1000）")
+    parser.add_argument("--limit", type=int, default=30, help="列出耗時最多的前幾條（預設：30）")
+    parser.add_argument("--budget", type=float, default=0.05, help="對抗輸入單次呼叫的時間上限（秒，預設：0.05）")
+    parser.add_argument("--json", help="另將完整結果寫入此 JSON 檔")
+    args = parser.parse_args(argv)
+
+    schema_paths = args.schema_file or sorted(glob.glob(os.path.join(PROJECT_ROOT, "*.schema.yaml")))
+    for path in (*schema_paths, args.dict):
+        if not os.path.exists(path):
+            print(f"錯誤：輸入檔案不存在 - {path}")
+            return 1
+
+    t0 = time.perf_counter()
+    try:
+        sections = collect_sections(schema_paths, im_chat_piau(args.dict), args.samples)
+        adversarial_cache: dict = {}
+        results = [r for section in sections for r in profile_section(section, args.budget, adversarial_cache)]
+    except (AlgebraError, ConfigError) as e:
+        print(f"錯誤：{e}")
+        return 1
+
+    print_report(results, args.limit)
+    print(f"（規則組 {len(sections)} 個，不重複的正規表達式 {len(adversarial_cache)} 個，{time.perf_counter() - t0:.1f} 秒）")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 1 if any(r["flags"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+rime_algebra.py
+
+以 Python 離線執行 Rime 的拼寫運算（spelling algebra），不必重新部署 Weasel 即可檢查方案的修改。
+
+支援的運算（與 librime 相同）：
+    xform/模式/取代/   : 以正規表達式取代，原拼寫不保留
+    derive/模式/取代/  : 同 xform，但保留原拼寫（衍生）
+    abbrev/模式/取代/  : 同 derive，衍生的拼寫標記為「簡拼」
+    fuzz/模式/取代/    : 同 derive，衍生的拼寫標記為「模糊音」
+    xlit/來源字元/目標字元/ : 逐字元轉換
+    erase/模式/        : 整個拼寫符合模式時刪除
+運算名稱之後的第一個字元即為分隔符號（可為 / | 空白等）。
+Rime（boost::regex）取代字串中的 $1、${1}、$& 會轉為 Python 的 \\g<1>、\\g<0>。
+
+作用範圍：
+    speller/algebra                 : 作用於字典的每個音節（音節表），得出「拼寫 → 音節」對照（prism）
+    translator/preedit_format       : 作用於輸入編輯列的字串
+    translator/comment_format       : 作用於候選字註解（編碼字串）
+
+每條規則只編譯一次；批次處理時逐條規則作用於所有拼寫，與 librime 的 Projection 相同。
+
+用法：
+    python rime_algebra.py [schema_file] [--dict DICT] [--code CODE ...] [--prism FILE] [--comments FILE]
+
+參數：
+    schema_file (可選): 方案檔路徑，預設值：專案根目錄下的 bp_phing_im.schema.yaml
+    --dict            : 字典檔，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    --code            : 顯示指定編碼的拼寫及註解
+    --prism           : 將「拼寫、音節、類型」對照表寫入此檔（tab 分隔）
+    --comments        : 將「編碼、註解」對照表寫入此檔（tab 分隔）
+
+範例：
+    python rime_algebra.py ../bp_hong_im.schema.yaml --code gong1 "zian1 ho3"
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections.abc import Iterable, Iterator
+
+from rime_config import DEFAULT_CACHE, ConfigError, get_node, resolve_config
+from rime_dict import MappedRimeDict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCHEMA = os.path.join(PROJECT_ROOT, "bp_phing_im.schema.yaml")
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+
+# 拼寫類型（數值愈小愈正式；合併時取最小值，與 librime 的 SpellingType 相同）
+NORMAL, FUZZY, ABBREVIATION = 0, 1, 2
+LUI_HING_MIA = {NORMAL: "normal", FUZZY: "fuzzy", ABBREVIATION: "abbrev"}
+
+# 多音節編碼的音節分隔符號
+IM_CHAT_KAN_KEH = re.compile(r"[ ']+")
+
+# 取代字串中的 Rime 語法：$1、${1}、$&、$$，及反斜線跳脫字元
+_TI_TAI_GI_HUAT = re.compile(r"\$(?:(\d+)|\{(\d+)\}|(&)|(\$))|\\(.)", re.S)
+
+
+class AlgebraError(ValueError):
+    """拼寫運算規則無法解析或編譯。"""
+
+
+def tng_uann_ti_tai(replacement: str) -> str:
+    """將 Rime（boost::regex）的取代字串轉成 Python re 的取代字串。"""
+
+    def tng(m: re.Match) -> str:
+        group, braced, whole, dollar, escaped = m.groups()
+        if group or braced:
+            return f"\\g<{group or braced}>"
+        if whole:
+            return "\\g<0>"
+        if dollar:
+            return "$"
+        return {"n": "\n", "t": "\t"}.get(escaped, escaped).replace("\\", "\\\\")
+
+    parts = []
+    pos = 0
+    for m in _TI_TAI_GI_HUAT.finditer(replacement):
+        parts.append(replacement[pos : m.start()].replace("\\", "\\\\"))
+        parts.append(tng(m))
+        pos = m.end()
+    parts.append(replacement[pos:].replace("\\", "\\\\"))
+    return "".join(parts)
+
+
+class Calculation:
+    """
+    一條拼寫運算規則。
+    apply(s) 回傳運算結果；規則不適用（未比對到或結果不變）時回傳 None。
+    addition 為 True 時保留原拼寫（derive、abbrev、fuzz）；deletion 為 True 時刪除拼寫（erase）。
+    separator、args 為規則原文的分隔符號及各參數（Rime 語法，未轉換）。
+    """
+
+    KINDS = ("xform", "derive", "abbrev", "fuzz", "xlit", "erase")
+
+    def __init__(self, source: str):
+        self.source = source
+        m = re.match(r"[a-z]+", source)
+        kind = m.group(0) if m else ""
+        if kind not in self.KINDS or len(source) <= len(kind):
+            raise AlgebraError(f"無法解析的拼寫運算：{source!r}")
+        sep = source[len(kind)]
+        args = source[len(kind) + 1 :].split(sep)
+        self.kind = kind
+        self.separator = sep
+        self.args = args
+        self.addition = kind in ("derive", "abbrev", "fuzz")
+        self.deletion = kind == "erase"
+        self.spelling_type = {"abbrev": ABBREVIATION, "fuzz": FUZZY}.get(kind, NORMAL)
+
+        if kind == "xlit":
+            if len(args) < 2 or len(args[0]) != len(args[1]):
+                raise AlgebraError(f"xlit 來源與目標字元數不同：{source!r}")
+            self.table = str.maketrans(args[0], args[1])
+            self.pattern = None
+            return
+
+        need = 1 if kind == "erase" else 2
+        if len(args) < need:
+            raise AlgebraError(f"拼寫運算缺少參數：{source!r}")
+        # librime 以 boost::regex 比對 UTF-8 位元組：\b、\w、\s 只認 ASCII，[^〕] 等字元類別以位元組為單位。
+        # 為求結果一致，正規表達式一律以 bytes 編譯、作用於 UTF-8 位元組。
+        try:
+            self.pattern = re.compile(args[0].encode("utf-8"))
+        except re.error as e:
+            raise AlgebraError(f"正規表達式錯誤：{source!r}（{e}）") from e
+        self.replacement = tng_uann_ti_tai(args[1]).encode("utf-8") if kind != "erase" else b""
+
+    def apply(self, s: str) -> str | None:
+        if self.kind == "xlit":
+            result = s.translate(self.table)
+            return result if result != s else None
+        data = s.encode("utf-8", "surrogateescape")
+        if self.deletion:
+            return "" if self.pattern.fullmatch(data) else None
+        result = self.pattern.sub(self.replacement, data)
+        return result.decode("utf-8", "surrogateescape") if result != data else None
+
+    def __repr__(self) -> str:
+        return f"Calculation({self.source!r})"
+
+
+class Projection:
+    """
+    一組依序套用的拼寫運算規則，對應 librime 的 Projection。
+
+    apply(s)：作用於單一字串（preedit_format、comment_format），derive 等視同 xform。
+    apply_script(script)：作用於拼寫集合（speller/algebra），
+        script 為 {拼寫: {音節: 拼寫類型}}，回傳運算後的新集合。
+    steps(script)：同 apply_script，但逐條規則產出 (規則, 作用的拼寫數, 運算後的集合)，供分析各規則的影響。
+    """
+
+    def __init__(self, rules: Iterable[str]):
+        self.calculations = [Calculation(rule) for rule in rules]
+
+    def __len__(self) -> int:
+        return len(self.calculations)
+
+    def apply(self, s: str) -> str:
+        for calc in self.calculations:
+            result = calc.apply(s)
+            if result is not None:
+                s = result
+        return s
+
+    def apply_script(self, script: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
+        for calc in self.calculations:
+            script = apply_calculation(calc, script)
+        return script
+
+    def steps(self, script: dict[str, dict[str, int]]) -> Iterator[tuple[Calculation, int, dict[str, dict[str, int]]]]:
+        for calc in self.calculations:
+            script, fired = _apply_counted(calc, script)
+            yield calc, fired, script
+
+
+def _merge(script: dict[str, dict[str, int]], spelling: str, sources: dict[str, int], spelling_type: int):
+    if not spelling:
+        return
+    target = script.setdefault(spelling, {})
+    for im_chat, t in sources.items():
+        t = max(t, spelling_type)
+        if t < target.get(im_chat, t + 1):
+            target[im_chat] = t
+
+
+def _apply_counted(calc: Calculation, script: dict[str, dict[str, int]]) -> tuple[dict[str, dict[str, int]], int]:
+    result: dict[str, dict[str, int]] = {}
+    fired = 0
+    for spelling, sources in script.items():
+        new = calc.apply(spelling)
+        if new is None:
+            _merge(result, spelling, sources, NORMAL)
+            continue
+        fired += 1
+        if not calc.deletion:
+            _merge(result, new, sources, calc.spelling_type)
+        if calc.addition:
+            _merge(result, spelling, sources, NORMAL)
+    return result, fired
+
+
+def apply_calculation(calc: Calculation, script: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
+    """以單一規則作用於拼寫集合，回傳新集合（與 librime Projection::Apply 的單步相同）。"""
+    return _apply_counted(calc, script)[0]
+
+
+def im_chat_piau(dict_path: str) -> list[str]:
+    """字典檔中所有編碼拆成音節後的音節表（依字母排序）。"""
+    im_chat: set[str] = set()
+    seen: set[str] = set()
+    with MappedRimeDict(dict_path) as ji_khoo:
+        for (code,) in ji_khoo.fields("code"):
+            if code and code not in seen:
+                seen.add(code)
+                im_chat.update(s for s in IM_CHAT_KAN_KEH.split(code) if s)
+    return sorted(im_chat)
+
+
+def build_prism(algebra: Projection, im_chat: Iterable[str]) -> dict[str, dict[str, int]]:
+    """以 speller/algebra 作用於音節表，回傳 {拼寫: {音節: 拼寫類型}}。"""
+    return algebra.apply_script({s: {s: NORMAL} for s in im_chat})
+
+
+def load_schema_rules(schema_path: str, cache_path: str | None = DEFAULT_CACHE) -> dict[str, list[str]]:
+    """以 rime_config 展開方案檔，取出 speller/algebra、translator/preedit_format、translator/comment_format 規則。"""
+    config = resolve_config(schema_path, cache_path)
+    return {
+        name: [str(rule) for rule in get_node(config, node_path) or []]
+        for name, node_path in (
+            ("algebra", "speller/algebra"),
+            ("preedit_format", "translator/preedit_format"),
+            ("comment_format", "translator/comment_format"),
+        )
+    }
+
+
+def load_schema(schema_path: str) -> dict[str, Projection]:
+    """讀取方案檔並編譯各組規則，回傳 {"algebra": ..., "preedit_format": ..., "comment_format": ...}。"""
+    return {name: Projection(rules) for name, rules in load_schema_rules(schema_path).items()}
+
+
+def main_spellings(algebra: Projection, im_chat: Iterable[str]) -> dict[str, str]:
+    """
+    各音節的正式拼寫：只套用 xform、xlit、erase，略過 derive、abbrev、fuzz，回傳 {音節: 拼寫}。
+    derive 等規則保留原拼寫，原拼寫沿規則清單繼續運算，最後得到的即為不靠衍生拼寫時應打的按鍵；
+    被 erase 刪除的音節不列入。
+    """
+    result = {}
+    for s in im_chat:
+        spelling = s
+        for calc in algebra.calculations:
+            if calc.addition:
+                continue
+            new = calc.apply(spelling)
+            if new is not None:
+                spelling = new
+            if not spelling:
+                break
+        if spelling:
+            result[s] = spelling
+    return result
+
+
+def spellings_of(prism: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
+    """將 prism 反轉為 {音節: {拼寫: 拼寫類型}}。"""
+    result: dict[str, dict[str, int]] = {}
+    for spelling, sources in prism.items():
+        for im_chat, t in sources.items():
+            result.setdefault(im_chat, {})[spelling] = t
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="離線執行 Rime 方案的拼寫運算")
+    parser.add_argument("schema_file", nargs="?", default=DEFAULT_SCHEMA, help="方案檔路徑")
+    parser.add_argument("--dict", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--code", nargs="+", default=[], help="顯示指定編碼的拼寫及註解")
+    parser.add_argument("--prism", help="將「拼寫、音節、類型」對照表寫入此檔")
+    parser.add_argument("--comments", help="將「編碼、註解」對照表寫入此檔")
+    args = parser.parse_args(argv)
+
+    for path in (args.schema_file, args.dict):
+        if not os.path.exists(path):
+            print(f"錯誤：輸入檔案不存在 - {path}")
+            return 1
+
+    t0 = time.perf_counter()
+    try:
+        schema = load_schema(args.schema_file)
+    except (AlgebraError, ConfigError) as e:
+        print(f"錯誤：{e}")
+        return 1
+    algebra, comment_format = schema["algebra"], schema["comment_format"]
+    t1 = time.perf_counter()
+    im_chat = im_chat_piau(args.dict)
+    prism = build_prism(algebra, im_chat)
+    t2 = time.perf_counter()
+
+    print(f"方案檔：{args.schema_file}")
+    print(
+        f"規則：algebra {len(algebra)} 條、preedit_format {len(schema['preedit_format'])} 條、"
+        f"comment_format {len(comment_format)} 條（編譯 {t1 - t0:.3f} 秒）"
+    )
+    print(f"音節 {len(im_chat)} 個 → 拼寫 {len(prism)} 個（{t2 - t1:.3f} 秒）")
+
+    if args.code:
+        by_im_chat = spellings_of(prism)
+        for code in args.code:
+            print(f"\n{code}")
+            for s in IM_CHAT_KAN_KEH.split(code):
+                spellings = by_im_chat.get(s, {})
+                listed = "、".join(
+                    sp if t == NORMAL else f"{sp}（{LUI_HING_MIA[t]}）" for sp, t in sorted(spellings.items())
+                )
+                print(f"  {s} 的拼寫（{len(spellings)}）：{listed or '（無）'}")
+            print(f"  註解：{comment_format.apply(code)}")
+
+    if args.prism:
+        with open(args.prism, "w", encoding="utf-8") as f:
+            for spelling in sorted(prism):
+                for s, t in sorted(prism[spelling].items()):
+                    f.write(f"{spelling}\t{s}\t{LUI_HING_MIA[t]}\n")
+        print(f"拼寫對照表已寫入 {args.prism}")
+
+    if args.comments:
+        t3 = time.perf_counter()
+        with MappedRimeDict(args.dict) as ji_khoo:
+            codes = sorted({code for (code,) in ji_khoo.fields("code") if code})
+        with open(args.comments, "w", encoding="utf-8") as f:
+            for code in codes:
+                f.write(f"{code}\t{comment_format.apply(code)}\n")
+        print(f"編碼 {len(codes)} 個的註解已寫入 {args.comments}（{time.perf_counter() - t3:.3f} 秒）")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+rime_config.py
+
+展開 Rime 設定檔的組合語法，得出與 librime 部署時相同的「有效設定」，並快取 YAML 的解析結果。
+
+本專案的方案檔大量引用程式館檔（bp_libs.yaml、bp_libs_bp_tiau_hu.yaml 等），例如：
+    comment_format:
+      __patch:
+        - bp_libs:/hau_suan_ji_tuann      # 該節點為 {__append: [規則, ...]}
+各種方案檢查、模擬、打包工具都應以本模組取得展開後的設定，而不是各自處理組合語法。
+
+支援的語法（與 librime 的 ConfigCompiler 相同）：
+    __include: 參照      : 以參照的節點為底，同一層的其他鍵再合併上去
+    __patch: 參照或 map  : 節點編譯完成後，依序套用修補（可為清單）
+    __append: 清單       : （修補中）接在目標清單之後
+    __merge: map         : （修補中）合併到目標 map
+    鍵/+: 值             : 合併時，清單接在後面、map 合併，而非取代
+    a/b/c: 值            : （修補中）以路徑指定要修改的節點；路徑可含 @N、@last、@next
+參照的格式為 "檔名:/節點路徑"，省略檔名時指目前的檔案，省略路徑時指整個檔案，
+結尾加 "?" 表示參照的檔案或節點不存在時略過。
+另外與 librime 相同，展開 xxx.schema.yaml 時會自動套用 xxx.custom.yaml 的 patch: 節點（若存在）。
+
+解析快取：
+    YAML 解析結果以 pickle 存入快取檔，以檔案路徑為鍵，記錄修改時間、大小及內容雜湊。
+    修改時間及大小不變時直接使用快取，完全不讀檔；修改時間變了但內容雜湊相同（如 git checkout）時，
+    只讀檔計算雜湊，仍不解析 YAML。
+
+用法：
+    python rime_config.py [config_file] [--node PATH] [--json] [--cache FILE | --no-cache]
+
+參數：
+    config_file (可選): 設定檔路徑，預設值：專案根目錄下的 bp_phing_im.schema.yaml
+    --node            : 只輸出指定節點，如 speller/algebra
+    --json            : 以 JSON 輸出（預設為 YAML）
+    --cache           : 快取檔路徑，預設值：tools/.rime_config_cache.pickle
+    --no-cache        : 不使用快取檔
+    --no-custom       : 不套用 .custom.yaml 的 patch:
+
+範例：
+    python rime_config.py ../bp_hong_im.schema.yaml --node translator/comment_format
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+
+try:
+    import yaml
+except ImportError:  # PyYAML 為選用套件；快取未命中時才需要
+    yaml = None
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(TOOLS_DIR)
+DEFAULT_CONFIG = os.path.join(PROJECT_ROOT, "bp_phing_im.schema.yaml")
+DEFAULT_CACHE = os.path.join(TOOLS_DIR, ".rime_config_cache.pickle")
+
+# 快取檔格式版本；格式改變時遞增，舊快取即作廢
+CACHE_VERSION = 1
+
+
+class ConfigError(ValueError):
+    """設定檔的組合語法無法展開（參照不存在、循環參照、型別不符等）。"""
+
+
+class ConfigCache:
+    """
+    YAML 解析快取。path 為 None 時只快取在記憶體中。
+    同一個 ConfigCache 中，每個檔案只檢查一次是否變動；hits、misses 為命中及重新解析的檔案數。
+
+    用法：
+        cache = ConfigCache(DEFAULT_CACHE)
+        data = cache.load("bp_libs.yaml")
+        cache.save()
+    """
+
+    def __init__(self, path: str | None = DEFAULT_CACHE):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[int, int, str, object]] = {}
+        self._checked: set[str] = set()  # 本次已確認過的檔案，不再重複 stat
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    version, entries = pickle.load(f)
+                if version == CACHE_VERSION:
+                    self._entries = entries
+            except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+                pass  # 快取檔損壞時重新建立
+
+    def load(self, path: str):
+        """回傳 YAML 檔的解析結果。回傳值與快取共用，呼叫端不得修改。"""
+        path = os.path.abspath(path)
+        if path in self._checked:
+            return self._entries[path][3]
+        self._checked.add(path)
+        st = os.stat(path)
+        entry = self._entries.get(path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            self.hits += 1
+            return entry[3]
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry and entry[2] == digest:
+            self.hits += 1
+            data = entry[3]
+        else:
+            self.misses += 1
+            if yaml is None:
+                raise RuntimeError("讀取設定檔需要 PyYAML 套件，請先執行：pip install pyyaml")
+            data = yaml.safe_load(raw.decode("utf-8"))
+        self._entries[path] = (st.st_mtime_ns, st.st_size, digest, data)
+        self._dirty = True
+        return data
+
+    def save(self):
+        """快取有變動時寫回快取檔（先寫暫存檔再取代，避免寫到一半的快取檔）。"""
+        if not self.path or not self._dirty:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((CACHE_VERSION, self._entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def parse_reference(ref: str) -> tuple[str, list[str], bool]:
+    """將 "檔名:/a/b?" 拆成 (檔名, 路徑各段, 是否可省略)；檔名為空字串時指目前的檔案。"""
+    ref = str(ref).strip()
+    optional = ref.endswith("?")
+    if optional:
+        ref = ref[:-1]
+    file_id, sep, node_path = ref.partition(":")
+    if not sep:
+        file_id, node_path = "", ref
+    return file_id, [key for key in node_path.split("/") if key], optional
+
+
+def _list_index(items: list, key: str, editing: bool = False) -> int | None:
+    """解析清單路徑 @N、@last、@next；@next 只用於修改，指向清單結尾之後。"""
+    if key == "@next":
+        return len(items) if editing else None
+    if key == "@last":
+        return len(items) - 1 if items else None
+    if key.startswith("@") and key[1:].isdigit():
+        return int(key[1:])
+    return None
+
+
+def get_node(config, node_path: str | list[str]):
+    """依路徑（如 "speller/algebra" 或 "menu/@0"）取出節點；節點不存在時回傳 None。"""
+    keys = node_path if isinstance(node_path, list) else [k for k in node_path.split("/") if k]
+    node = config
+    for key in keys:
+        if isinstance(node, dict):
+            node = node.get(key)
+        elif isinstance(node, list):
+            i = _list_index(node, key)
+            node = node[i] if i is not None and 0 <= i < len(node) else None
+        else:
+            return None
+        if node is None:
+            return None
+    return node
+
+
+def _merge_value(target, value):
+    """鍵/+ 與 __merge、__append 的合併：清單、字串接在後面，map 合併。"""
+    if isinstance(target, list) and isinstance(value, list):
+        return target + value
+    if isinstance(target, str) and isinstance(value, str):
+        return target + value
+    if isinstance(target, dict) and isinstance(value, dict):
+        return merge_tree(dict(target), value)
+    if target is None:
+        return value
+    raise ConfigError(f"無法合併 {type(value).__name__} 至 {type(target).__name__}")
+
+
+def merge_tree(target: dict, source: dict) -> dict:
+    """將 source 合併到 target（就地修改並回傳 target）：鍵/+ 合併，其餘鍵取代。"""
+    for key, value in source.items():
+        if key.endswith("/+"):
+            key = key[:-2]
+            target[key] = _merge_value(target.get(key), value)
+        else:
+            target[key] = value
+    return target
+
+
+def apply_patch(target, patch: dict):
+    """套用一個修補 map，回傳修改後的節點（不修改傳入的 target）。"""
+    if not isinstance(patch, dict):
+        raise ConfigError(f"修補必須是 map：{patch!r}")
+    for key, value in patch.items():
+        if key == "__append":
+            target = _merge_value(target if target is not None else [], value)
+        elif key == "__merge":
+            target = _merge_value(target if target is not None else {}, value)
+        else:
+            target = _edit(target, [k for k in key.split("/") if k], value)
+    return target
+
+
+def _edit(node, keys: list[str], value):
+    """回傳將路徑 keys 處設為 value 後的新節點；路徑以 + 結尾時合併而非取代。"""
+    if not keys:
+        return value
+    if keys == ["+"]:
+        return _merge_value(node, value)
+    key, rest = keys[0], keys[1:]
+    if isinstance(node, list):
+        node = list(node)
+        i = _list_index(node, key, editing=True)
+        if i is None or not 0 <= i <= len(node):
+            raise ConfigError(f"清單路徑不合法：{key}")
+        if i == len(node):
+            node.append(_edit(None, rest, value))
+        else:
+            node[i] = _edit(node[i], rest, value)
+        return node
+    node = dict(node) if isinstance(node, dict) else {}
+    node[key] = _edit(node.get(key), rest, value)
+    return node
+
+
+class ConfigResolver:
+    """
+    展開設定檔的組合語法。
+
+    search_dirs 為尋找被參照檔案（檔名.yaml）的目錄，依序尋找；預設為設定檔所在目錄。
+    同一個 ConfigResolver 可重複使用，其 ConfigCache 在多次展開間共用。
+    """
+
+    def __init__(self, search_dirs: list[str] | None = None, cache: ConfigCache | None = None):
+        self.search_dirs = list(search_dirs or [])
+        self.cache = cache if cache is not None else ConfigCache(None)
+        self._stack: list[tuple[str, tuple[str, ...]]] = []
+
+    def find(self, file_id: str) -> str | None:
+        for d in self.search_dirs:
+            path = os.path.join(d, f"{file_id}.yaml")
+            if os.path.exists(path):
+                return path
+        return None
+
+    def resolve_file(self, path: str, custom: bool = True):
+        """展開整個設定檔；custom 為 True 時再套用對應 .custom.yaml 的 patch:。"""
+        path = os.path.abspath(path)
+        base_dir = os.path.dirname(path)
+        if base_dir not in self.search_dirs:
+            self.search_dirs.insert(0, base_dir)
+        config = self._resolve(path, [])
+        if custom:
+            config_id = os.path.basename(path).removesuffix(".yaml")
+            custom_id = config_id.removesuffix(".schema") + ".custom"
+            patch = self.resolve_reference(f"{custom_id}:/patch?", path)
+            if patch is not None:
+                config = apply_patch(config, patch)
+        return config
+
+    def resolve_reference(self, ref: str, current: str):
+        """展開參照所指的節點；current 為參照所在的檔案。"""
+        file_id, keys, optional = parse_reference(ref)
+        path = self.find(file_id) if file_id else current
+        if path is None:
+            if optional:
+                return None
+            raise ConfigError(f"找不到參照的檔案：{file_id}.yaml（{ref}）")
+        node = self._resolve(path, keys)
+        if node is None and not optional:
+            raise ConfigError(f"參照的節點不存在：{ref}")
+        return node
+
+    def _resolve(self, path: str, keys: list[str]):
+        frame = (path, tuple(keys))
+        if frame in self._stack:
+            chain = " → ".join(f"{os.path.basename(p)}:/{'/'.join(k)}" for p, k in self._stack + [frame])
+            raise ConfigError(f"循環參照：{chain}")
+        self._stack.append(frame)
+        try:
+            node = self.cache.load(path)
+            for i, key in enumerate(keys):
+                # 中途的節點若含 __include、__patch，先展開再往下找
+                if isinstance(node, dict) and ("__include" in node or "__patch" in node):
+                    node = self._compile(node, path)
+                node = get_node(node, [key])
+                if node is None:
+                    return None
+            return self._compile(node, path)
+        finally:
+            self._stack.pop()
+
+    def _compile(self, node, path: str):
+        """展開節點（及其子節點）中的 __include、__patch，回傳新的節點；不修改快取中的資料。"""
+        if isinstance(node, list):
+            return [self._compile(item, path) for item in node]
+        if not isinstance(node, dict):
+            return node
+
+        siblings = {k: self._compile(v, path) for k, v in node.items() if k not in ("__include", "__patch")}
+        if "__include" in node:
+            result = self.resolve_reference(node["__include"], path)
+            if siblings and result is not None:
+                if not isinstance(result, dict):
+                    raise ConfigError(f"__include 的節點不是 map，無法合併其他鍵：{node['__include']}")
+                result = merge_tree(dict(result), siblings)
+            elif siblings:
+                result = siblings
+        elif siblings or "__patch" not in node:
+            # 鍵/+ 只在合併時有作用，此處保留原樣，作為修補時仍可合併
+            result = siblings
+        else:
+            # 只有 __patch 的節點：型別由修補決定（如 __append 得出清單）
+            result = None
+
+        patches = node.get("__patch")
+        if patches is not None:
+            for patch in patches if isinstance(patches, list) else [patches]:
+                if isinstance(patch, dict):
+                    patch = self._compile(patch, path)
+                else:
+                    patch = self.resolve_reference(patch, path)
+                    if patch is None:  # 可省略的參照
+                        continue
+                result = apply_patch(result, patch)
+        return result
+
+
+def resolve_config(path: str, cache_path: str | None = DEFAULT_CACHE, custom: bool = True,
+                   search_dirs: list[str] | None = None):
+    """展開設定檔並回傳有效設定；解析快取存於 cache_path（None 表示不存檔）。"""
+    cache = ConfigCache(cache_path)
+    config = ConfigResolver(search_dirs, cache).resolve_file(path, custom=custom)
+    cache.save()
+    return config
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="展開 Rime 設定檔的 __include、__patch 組合語法")
+    parser.add_argument("config_file", nargs="?", default=DEFAULT_CONFIG, help="設定檔路徑")
+    parser.add_argument("--node", help="只輸出指定節點，如 speller/algebra")
+    parser.add_argument("--json", action="store_true", help="以 JSON 輸出")
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="快取檔路徑")
+    parser.add_argument("--no-cache", action="store_true", help="不使用快取檔")
+    parser.add_argument("--no-custom", action="store_true", help="不套用 .custom.yaml 的 patch:")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.config_file):
+        print(f"錯誤：輸入檔案不存在 - {args.config_file}")
+        return 1
+
+    t0 = time.perf_counter()
+    cache = ConfigCache(None if args.no_cache else args.cache)
+    try:
+        config = ConfigResolver(cache=cache).resolve_file(args.config_file, custom=not args.no_custom)
+    except ConfigError as e:
+        print(f"錯誤：{e}")
+        return 1
+    cache.save()
+    elapsed = time.perf_counter() - t0
+
+    if args.node:
+        config = get_node(config, args.node)
+    if args.json or yaml is None:
+        print(json.dumps(config, ensure_ascii=False, indent=2))
+    else:
+        print(yaml.safe_dump(config, allow_unicode=True, sort_keys=False), end="")
+    print(f"快取命中 {cache.hits} 個檔案、解析 {cache.misses} 個檔案（{elapsed:.3f} 秒）", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
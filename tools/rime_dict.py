@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+rime_dict.py
+
+Rime 字典檔（*.dict.yaml）共用讀取工具。
+
+字典檔分為兩區：
+    - 標頭區：自檔首至一行僅含 "..." 為止，為 YAML 格式；其中 columns: 指定詞條各欄位名稱
+    - 詞條區："..." 之後，每行一筆詞條，各欄以 tab 分隔；空行及 # 起頭的註解行略過
+
+未宣告 columns: 時，依 Rime 預設欄位為 text、code、weight。
+
+RimeDict 以文字模式逐行讀取；MappedRimeDict 以 mmap 掃描，只解碼需要的欄位，適合大型字典檔。
+open_input()／open_output() 開啟輸入／輸出檔（"-" 代表標準輸入／標準輸出），輸出檔以原子性更名寫入。
+
+用法（統計詞條數及 weight 分布）：
+    python rime_dict.py <字典檔>
+"""
+
+import io
+import mmap
+import os
+import re
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import BinaryIO, TextIO
+
+# Rime 預設欄位
+DEFAULT_COLUMNS = ["text", "code", "weight"]
+
+# 標頭區清單中的一項，如 "  - text # 漢字"
+_LIST_ITEM = re.compile(r"^\s+-\s*([A-Za-z0-9_.]+)")
+
+# 詞條行的行首（前一行的換行符號）：其後非註解、非空白行
+_SU_TIAU_HANG = re.compile(rb"\n(?=(?!#)[ \t]*[^\s])")
+
+
+def parse_list(header_lines: list[str], key: str) -> list[str]:
+    """自標頭區各行取出頂層清單 key: 的各項（如 columns:、import_tables:），略過已註解的項目。"""
+    items: list[str] = []
+    in_list = False
+    for line in header_lines:
+        if line.startswith(f"{key}:"):
+            in_list = True
+            continue
+        if not in_list:
+            continue
+        m = _LIST_ITEM.match(line)
+        if m:
+            items.append(m.group(1))
+        elif line.strip() and not line.lstrip().startswith("#"):
+            break
+    return items
+
+
+def parse_columns(header_lines: list[str]) -> list[str]:
+    """自標頭區各行取出 columns: 清單；未宣告時回傳 DEFAULT_COLUMNS。"""
+    return parse_list(header_lines, "columns") or list(DEFAULT_COLUMNS)
+
+
+def read_header(f: TextIO) -> list[str]:
+    """讀取標頭區各行（含 "..." 行），讀完後 f 的位置恰在詞條區第一行。"""
+    header_lines = []
+    for line in iter(f.readline, ""):
+        header_lines.append(line)
+        if line.strip() == "...":
+            break
+    return header_lines
+
+
+class RimeDict:
+    """
+    開啟 Rime 字典檔以逐筆讀取詞條。
+
+    用法：
+        with RimeDict(path) as ji_khoo:
+            code_col = ji_khoo.column_index("code")
+            for line_no, row in ji_khoo.rows():
+                ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "r", encoding="utf-8")
+        self.header_lines = read_header(self._f)
+        self.columns = parse_columns(self.header_lines)
+
+    def column_index(self, name: str) -> int | None:
+        """欄位名稱在詞條中的位置；字典未宣告該欄時回傳 None。"""
+        try:
+            return self.columns.index(name)
+        except ValueError:
+            return None
+
+    def rows(self) -> Iterator[tuple[int, list[str]]]:
+        """逐筆產出 (行號, 欄位 list)；只能迭代一次。"""
+        line_no = len(self.header_lines)
+        for line in self._f:
+            line_no += 1
+            if not line.strip() or line.startswith("#"):
+                continue
+            yield line_no, line.rstrip("\r\n").split("\t")
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self) -> "RimeDict":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parse_weight(value: str) -> float:
+    """將 weight 欄轉為浮點數；空白或無法解析時回傳 0.0。"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class MappedRimeDict:
+    """
+    以 mmap 開啟 Rime 字典檔，逐筆掃描詞條而不將整個檔案解碼成字串。
+
+    records() 產出各欄位的 memoryview 切片（不複製資料）；
+    fields() 只解碼呼叫端指定的欄位，例如只取 code 欄做轉換、只取 weight 欄做統計。
+    適合數 GB 的大型字典檔：記憶體用量只與單筆詞條大小有關。
+
+    注意：records() 產出的 memoryview 於 close() 前須全部釋放（或不再被引用）。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "rb")
+        size = os.fstat(self._f.fileno()).st_size
+        # 空檔無法 mmap，以空的 bytes 代替
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._view = memoryview(self._mm)
+        self.size = size
+        self.entries_start = self._find_header_end()
+        header = str(self._view[: self.entries_start], "utf-8")
+        self.header_lines = header.splitlines(keepends=True)
+        self.columns = parse_columns(self.header_lines)
+
+    def _find_header_end(self) -> int:
+        """回傳 "..." 行之後第一個位元組的位置；找不到 "..." 時整個檔案皆為標頭區。"""
+        mm = self._mm
+        pos = 0
+        while pos < self.size:
+            nl = mm.find(b"\n", pos)
+            end = self.size if nl == -1 else nl + 1
+            if mm[pos:end].strip() == b"...":
+                return end
+            pos = end
+        return self.size
+
+    def column_index(self, name: str) -> int | None:
+        """欄位名稱在詞條中的位置；字典未宣告該欄時回傳 None。"""
+        try:
+            return self.columns.index(name)
+        except ValueError:
+            return None
+
+    def _lines(self) -> Iterator[tuple[int, int]]:
+        """產出詞條區每一筆詞條行的 [起點, 終點) 位元組範圍（不含行尾），略過空行及註解。"""
+        mm, size = self._mm, self.size
+        pos = self.entries_start
+        while pos < size:
+            nl = mm.find(b"\n", pos)
+            if nl == -1:
+                nl = size
+            end = nl
+            if end > pos and mm[end - 1] == 0x0D:  # \r
+                end -= 1
+            start, pos = pos, nl + 1
+            if end == start or mm[start] == 0x23:  # 空行或 #
+                continue
+            if mm[start] in (0x20, 0x09) and not mm[start:end].strip():
+                continue
+            yield start, end
+
+    def records(self) -> Iterator[list[memoryview]]:
+        """逐筆產出詞條各欄位的 memoryview 切片（以 tab 分隔）。"""
+        mm, view = self._mm, self._view
+        for start, end in self._lines():
+            fields = []
+            pos = start
+            while True:
+                tab = mm.find(b"\t", pos, end)
+                if tab == -1:
+                    fields.append(view[pos:end])
+                    break
+                fields.append(view[pos:tab])
+                pos = tab + 1
+            yield fields
+
+    def fields(self, *names: str) -> Iterator[tuple[str | None, ...]]:
+        """
+        逐筆產出指定欄位解碼後的字串 tuple；詞條缺少該欄時為 None。
+        只切出到所需的最後一欄為止，其餘欄位不掃描也不解碼。
+        """
+        indexes = [self.column_index(name) for name in names]
+        if any(i is None for i in indexes):
+            missing = [n for n, i in zip(names, indexes) if i is None]
+            raise KeyError(f"字典檔未宣告欄位：{', '.join(missing)}")
+        last = max(indexes)
+        mm = self._mm
+        for start, end in self._lines():
+            bounds = []
+            pos = start
+            while len(bounds) <= last:
+                tab = mm.find(b"\t", pos, end)
+                if tab == -1:
+                    bounds.append((pos, end))
+                    break
+                bounds.append((pos, tab))
+                pos = tab + 1
+            yield tuple(
+                mm[bounds[i][0] : bounds[i][1]].decode("utf-8") if i < len(bounds) else None
+                for i in indexes
+            )
+
+    def scan(self, line_pattern: bytes) -> Iterator[tuple[int, re.Match]]:
+        """
+        以 bytes 正規表達式比對詞條區的每一行（自行首起比對），逐一產出 (行號, match)。
+        比對全在 re 模組內完成，只有比對成功的行才回到 Python，適合在大型字典檔中找出少數問題詞條。
+        實際比對時在 line_pattern 前加上換行字元，讓 re 以字元搜尋直接跳到各行行首。
+        """
+        if self.entries_start >= self.size:
+            return
+        mm = self._mm
+        pattern = re.compile(b"\n" + line_pattern, re.M)
+        line_no = len(self.header_lines)
+        pos = self.entries_start - 1
+        for m in pattern.finditer(mm, pos):
+            line_no += mm[pos : m.start() + 1].count(b"\n")
+            pos = m.start() + 1
+            yield line_no, m
+
+    def count_entries(self) -> int:
+        """詞條區的詞條數（不含空行及註解）。"""
+        if self.entries_start >= self.size:
+            return 0
+        return len(_SU_TIAU_HANG.findall(self._mm, self.entries_start - 1))
+
+    def close(self):
+        self._view.release()
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._f.close()
+
+    def __enter__(self) -> "MappedRimeDict":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@contextmanager
+def open_input(infile: str) -> Iterator[TextIO]:
+    """開啟輸入檔；infile 為 "-" 時改讀標準輸入。"""
+    if infile == "-":
+        yield io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+        return
+    with open(infile, "r", encoding="utf-8") as fin:
+        yield fin
+
+
+@contextmanager
+def open_output(outfile: str, binary: bool = False) -> Iterator[TextIO | BinaryIO]:
+    """
+    開啟輸出檔；outfile 為 "-" 時改寫標準輸出。binary 為 True 時以二進位模式開啟。
+    寫入檔案時先寫到同目錄下的暫存檔，全部完成後才以 os.replace() 原子性地取代目標檔；
+    中途失敗則刪除暫存檔，原有的輸出檔維持不變。
+    """
+    if outfile == "-" and binary:
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+        return
+    if outfile == "-":
+        fout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", write_through=True)
+        try:
+            yield fout
+        finally:
+            fout.flush()
+            fout.detach()
+        return
+
+    out_dir = os.path.dirname(os.path.abspath(outfile))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(outfile)}.", suffix=".tmp", dir=out_dir
+    )
+    # mkstemp() 建立的檔案權限為 0600，改回一般新建檔案的權限
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(tmp_path, 0o666 & ~umask)
+    try:
+        if binary:
+            fout = os.fdopen(fd, "wb")
+        else:
+            fout = os.fdopen(fd, "w", encoding="utf-8", newline="")
+        with fout:
+            yield fout
+        os.replace(tmp_path, outfile)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def weight_stats(path: str) -> dict:
+    """以 MappedRimeDict 只讀 code、weight 兩欄，統計詞條數、不重複編碼數及 weight 分布。"""
+    count = 0
+    codes: set[str] = set()
+    total = 0.0
+    low, high = float("inf"), float("-inf")
+    with MappedRimeDict(path) as ji_khoo:
+        for code, weight in ji_khoo.fields("code", "weight"):
+            count += 1
+            codes.add(code)
+            w = parse_weight(weight)
+            total += w
+            low, high = min(low, w), max(high, w)
+    return {
+        "entries": count,
+        "distinct_codes": len(codes),
+        "weight_min": low if count else None,
+        "weight_max": high if count else None,
+        "weight_mean": total / count if count else None,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("用法：python rime_dict.py <字典檔>")
+        sys.exit(1)
+    for key, value in weight_stats(sys.argv[1]).items():
+        print(f"{key}: {value}")
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+rime_engine.py
+
+離線候選字查詢引擎：不必開啟 Weasel 或圖形介面，即可在 Linux（CI）上查詢輸入按鍵的候選字清單，
+供字典的負載測試及候選字排序的回歸測試使用。
+
+以 rime_algebra.py 執行方案 speller/algebra，得出「拼寫 → 音節」對照（prism），再建立兩棵字典樹（trie）：
+    - 拼寫樹：以字元為節點，自輸入的任一位置找出所有可比對的拼寫，得出「音節圖」
+      （每個位置可接的 (終點, 音節, 拼寫類型)），與 librime 的 Syllabifier 相同
+    - 詞條樹：以音節為節點，節點上存放編碼為該音節序列的詞條（依 weight 由大到小）
+查詢時沿音節圖與詞條樹同步走訪，字典中沒有的音節組合立即剪除，不必列舉所有切分方式。
+
+候選字排序（與 librime script_translator 相近）：
+    1. 比對到的輸入長度，長者在前
+    2. 拼寫類型：正常拼寫在前，模糊音（fuzz）、簡拼（abbrev）在後
+    3. weight 由大到小；相同時依字典檔的順序
+
+輸入可為按鍵（如 bp_phing_im 的 zian;'ho\\），亦可為字典編碼（如 zian1'ho3）：
+各音節皆為字典音節、且其中有音節不是可輸入的拼寫時，視為編碼，以各音節的正式拼寫轉為按鍵後查詢。
+
+用法：
+    python rime_engine.py [query ...] [--schema SCHEMA] [--dict DICT] [--queries FILE] [--random N]
+                          [--top N] [--baseline FILE] [--save-baseline FILE] [--json FILE]
+
+參數：
+    query (可選)    : 要查詢的按鍵或編碼，可指定多個
+    --schema        : 方案檔，預設值：專案根目錄下的 bp_phing_im.schema.yaml
+    --dict          : 字典檔，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    --queries       : 自檔案讀取查詢（每行一筆，略過空行及 # 起頭的註解）
+    --random        : 另以字典中隨機 N 個編碼轉成按鍵查詢（負載測試）
+    --top           : 每筆查詢列出／比對的候選字數（預設：基準檔記錄的值，無基準檔時為 10）；
+                      與基準檔的值不同時，只比對兩者中較少的前幾名
+    --baseline      : 與此基準檔比對各查詢的候選字排序，有不同時結束代碼為 1；
+                      未指定查詢時以基準檔中的查詢比對。隨專案提交的基準檔為 tools/rime_engine_baseline.json
+                      （bp_phing_im + bp_ji_khoo，由 test/test_rime_engine.py 執行比對）
+    --save-baseline : 將各查詢的候選字排序寫入此基準檔
+    --json          : 將各查詢的候選字及耗時寫入此 JSON 檔
+
+範例：
+    python rime_engine.py "zian1'ho3" gau5
+    python rime_engine.py --random 5000 --save-baseline ranking.json
+    python rime_engine.py --baseline rime_engine_baseline.json
+"""
+
+import argparse
+import heapq
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import NamedTuple
+
+from rime_algebra import (
+    IM_CHAT_KAN_KEH,
+    LUI_HING_MIA,
+    NORMAL,
+    AlgebraError,
+    Projection,
+    build_prism,
+    im_chat_piau,
+    load_schema_rules,
+    main_spellings,
+    spellings_of,
+)
+from rime_config import ConfigError, get_node, resolve_config
+from rime_dict import MappedRimeDict, parse_weight
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCHEMA = os.path.join(PROJECT_ROOT, "bp_phing_im.schema.yaml")
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+# 隨專案提交的候選字排序基準檔
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, "tools", "rime_engine_baseline.json")
+
+# 每筆查詢列出／比對的候選字數
+DEFAULT_TOP = 10
+
+# 拼寫樹、詞條樹節點中存放拼寫／詞條的鍵（字元及音節皆不會是 None）
+_BOO = None
+
+
+class Candidate(NamedTuple):
+    text: str
+    code: str
+    weight: float
+    length: int  # 比對到的輸入長度（按鍵數，含分隔符號）
+    spelling_type: int  # 各音節拼寫類型的最大值
+
+
+class CandidateEngine:
+    """
+    以 prism（{拼寫: {音節: 拼寫類型}}）及詞條 [(text, code, weight), ...] 建立的候選字查詢引擎。
+    delimiter 為音節分隔符號（方案的 speller/delimiter）；空白亦視為分隔符號。
+    keys_of 為各音節的正式拼寫（rime_algebra.main_spellings），供編碼轉按鍵；未提供時由 prism 推估。
+    """
+
+    def __init__(
+        self,
+        prism: dict[str, dict[str, int]],
+        entries,
+        delimiter: str = "'",
+        keys_of: dict[str, str] | None = None,
+    ):
+        self.delimiters = set(delimiter) | {" "}
+        self.spelling_trie: dict = {}
+        for spelling, sources in prism.items():
+            node = self.spelling_trie
+            for ch in spelling:
+                node = node.setdefault(ch, {})
+            node[_BOO] = sources
+
+        # 音節的按鍵（編碼轉按鍵用）；由 prism 推估時取正常拼寫中對應音節最少者
+        # （如 zian; 只對應 zian1，而 derive 衍生的 zian- 另對應 zian6 等），再取最短者
+        if keys_of is None:
+            keys_of = {}
+            for s, spellings in spellings_of(prism).items():
+                normal = [sp for sp, t in spellings.items() if t == NORMAL]
+                if normal:
+                    keys_of[s] = min(normal, key=lambda sp: (len(prism[sp]), len(sp), sp))
+        self.keys_of = keys_of
+
+        self.phrase_trie: dict = {}
+        self.entry_count = 0
+        for order, (text, code, weight) in enumerate(entries):
+            node = self.phrase_trie
+            for s in IM_CHAT_KAN_KEH.split(code.strip()):
+                node = node.setdefault(s, {})
+            node.setdefault(_BOO, []).append((-weight, order, text, code, weight))
+            self.entry_count += 1
+        self._sort_entries(self.phrase_trie)
+
+    def _sort_entries(self, root: dict):
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is _BOO:
+                    child.sort()
+                else:
+                    stack.append(child)
+
+    @classmethod
+    def from_files(cls, schema_path: str, dict_path: str) -> "CandidateEngine":
+        """讀取方案檔（speller/algebra、speller/delimiter）及字典檔建立引擎。"""
+        algebra = Projection(load_schema_rules(schema_path)["algebra"])
+        delimiter = str(get_node(resolve_config(schema_path), "speller/delimiter") or "'")
+        im_chat = im_chat_piau(dict_path)
+        prism = build_prism(algebra, im_chat)
+        return cls(prism, read_entries(dict_path), delimiter, main_spellings(algebra, im_chat))
+
+    def _skip_delimiters(self, keys: str, pos: int) -> int:
+        while pos < len(keys) and keys[pos] in self.delimiters:
+            pos += 1
+        return pos
+
+    def syllable_graph(self, keys: str) -> list[dict[str, list[tuple[int, int]]]]:
+        """每個位置可接的 {音節: [(終點, 拼寫類型), ...]}；終點已略過其後的分隔符號。"""
+        graph: list[dict[str, list[tuple[int, int]]]] = [{} for _ in range(len(keys) + 1)]
+        for start in range(len(keys)):
+            if keys[start] in self.delimiters:
+                continue
+            node = self.spelling_trie
+            for end in range(start, len(keys)):
+                node = node.get(keys[end])
+                if node is None:
+                    break
+                sources = node.get(_BOO)
+                if sources:
+                    after = self._skip_delimiters(keys, end + 1)
+                    for s, t in sources.items():
+                        graph[start].setdefault(s, []).append((after, t))
+        return graph
+
+    def is_code(self, query: str) -> bool:
+        """各音節皆為字典音節、且其中有音節不是可輸入的拼寫時，視為編碼。"""
+        parts = [p for p in IM_CHAT_KAN_KEH.split(query) if p]
+        if not parts or not all(p in self.keys_of for p in parts):
+            return False
+        return any(not self._is_spelling(p) for p in parts)
+
+    def _is_spelling(self, s: str) -> bool:
+        node = self.spelling_trie
+        for ch in s:
+            node = node.get(ch)
+            if node is None:
+                return False
+        return _BOO in node
+
+    def code_to_keys(self, code: str, delimiter: str = "'") -> str | None:
+        """
+        將字典編碼轉為按鍵（各音節的正式拼寫，以 delimiter 分隔）；有音節無法輸入時回傳 None。
+        與 is_code() 相同，連續或結尾的分隔符號之間的空字串不視為音節。
+        """
+        keys = []
+        for s in IM_CHAT_KAN_KEH.split(code.strip()):
+            if not s:
+                continue
+            k = self.keys_of.get(s)
+            if k is None:
+                return None
+            keys.append(k)
+        return delimiter.join(keys)
+
+    def lookup(self, query: str, limit: int | None = None) -> list[Candidate]:
+        """
+        查詢按鍵（或編碼）的候選字清單，依比對長度、拼寫類型、weight 排序。
+        每一步取音節圖與詞條樹節點兩者中較小的一方逐一比對（簡拼可對應數百個音節）；
+        走訪時只記下比對到的詞條樹節點，依排序逐組合併各節點（已依 weight 排好）的詞條，取滿 limit 筆即停止。
+        """
+        keys = (self.code_to_keys(query) if self.is_code(query) else None) or query
+        graph = self.syllable_graph(keys)
+        hits: dict[tuple[int, int], list[list]] = {}
+        start = self._skip_delimiters(keys, 0)
+        stack = [(start, self.phrase_trie, NORMAL)]
+        while stack:
+            pos, node, spelling_type = stack.pop()
+            edges = graph[pos]
+            if not edges:
+                continue
+            if len(edges) <= len(node):
+                pairs = ((s, node.get(s), ends) for s, ends in edges.items())
+            else:
+                pairs = ((s, child, edges.get(s)) for s, child in node.items() if s is not _BOO)
+            for s, child, ends in pairs:
+                if child is None or ends is None:
+                    continue
+                entries = child.get(_BOO)
+                has_children = len(child) > (entries is not None)
+                for end, t in ends:
+                    t = max(t, spelling_type)
+                    if entries is not None:
+                        hits.setdefault((-end, t), []).append(entries)
+                    if has_children and end < len(keys):
+                        stack.append((end, child, t))
+
+        ranked: list[Candidate] = []
+        seen: set[tuple[str, str]] = set()
+        for (neg_end, t), groups in sorted(hits.items()):
+            for _, _, text, code, weight in heapq.merge(*groups):
+                if (text, code) in seen:
+                    continue
+                seen.add((text, code))
+                ranked.append(Candidate(text, code, weight, -neg_end, t))
+                if limit is not None and len(ranked) >= limit:
+                    return ranked
+        return ranked
+
+
+def read_entries(dict_path: str) -> list[tuple[str, str, float]]:
+    """字典檔的詞條 [(text, code, weight), ...]。"""
+    with MappedRimeDict(dict_path) as ji_khoo:
+        return [
+            (text, code, parse_weight(weight))
+            for text, code, weight in ji_khoo.fields("text", "code", "weight")
+            if text and code
+        ]
+
+
+def timed_lookup(engine: CandidateEngine, query: str, limit: int) -> tuple[list[Candidate], float]:
+    """查詢並回傳 (候選字, 耗時秒數)。"""
+    t0 = time.perf_counter()
+    candidates = engine.lookup(query, limit)
+    return candidates, time.perf_counter() - t0
+
+
+def random_queries(engine: CandidateEngine, dict_path: str, n: int, seed: int = 0) -> list[str]:
+    """自字典中隨機取 n 個編碼轉成按鍵，作為負載測試的查詢。"""
+    with MappedRimeDict(dict_path) as ji_khoo:
+        codes = sorted({code for (code,) in ji_khoo.fields("code") if code})
+    rng = random.Random(seed)
+    queries = []
+    for code in rng.sample(codes, min(n, len(codes))):
+        keys = engine.code_to_keys(code)
+        if keys:
+            queries.append(keys)
+    return queries
+
+
+def ranking(candidates: list[Candidate]) -> list[str]:
+    """基準檔中記錄的排序：各候選字的「漢字<tab>編碼」。"""
+    return [f"{c.text}\t{c.code}" for c in candidates]
+
+
+def compare_rankings(
+    current: dict[str, list[str]], baseline: dict[str, list[str]], top: int | None = None
+) -> list[str]:
+    """回傳排序與基準不同的查詢（基準中有、目前也有查詢者才比對）；指定 top 時只比對前 top 名。"""
+    return [q for q, expected in baseline.items() if q in current and current[q][:top] != expected[:top]]
+
+
+def latency_summary(seconds: list[float]) -> dict:
+    """查詢耗時的統計（微秒）：筆數、平均、中位數、p95、最大值。"""
+    if not seconds:
+        return {"count": 0}
+    us = sorted(t * 1e6 for t in seconds)
+    return {
+        "count": len(us),
+        "mean_us": statistics.fmean(us),
+        "p50_us": us[len(us) // 2],
+        "p95_us": us[min(len(us) - 1, int(len(us) * 0.95))],
+        "max_us": us[-1],
+    }
+
+
+def read_queries(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="離線候選字查詢引擎")
+    parser.add_argument("query", nargs="*", help="要查詢的按鍵或編碼")
+    parser.add_argument("--schema", default=DEFAULT_SCHEMA, help="方案檔路徑")
+    parser.add_argument("--dict", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--queries", help="自檔案讀取查詢（每行一筆）")
+    parser.add_argument("--random", type=int, default=0, help="另以字典中隨機 N 個編碼查詢")
+    parser.add_argument(
+        "--top", type=int, help=f"每筆查詢列出／比對的候選字數（預設：基準檔的設定，無基準檔時為 {DEFAULT_TOP}）"
+    )
+    parser.add_argument("--baseline", help="與此基準檔比對候選字排序")
+    parser.add_argument("--save-baseline", help="將候選字排序寫入此基準檔")
+    parser.add_argument("--json", help="將各查詢的候選字及耗時寫入此 JSON 檔")
+    args = parser.parse_args(argv)
+
+    for path in (args.schema, args.dict, args.queries, args.baseline):
+        if path and not os.path.exists(path):
+            print(f"錯誤：輸入檔案不存在 - {path}")
+            return 1
+
+    t0 = time.perf_counter()
+    try:
+        engine = CandidateEngine.from_files(args.schema, args.dict)
+    except (AlgebraError, ConfigError) as e:
+        print(f"錯誤：{e}")
+        return 1
+    print(f"已載入 {engine.entry_count} 筆詞條（{time.perf_counter() - t0:.3f} 秒）")
+
+    queries = list(args.query)
+    if args.queries:
+        queries += read_queries(args.queries)
+    if args.random:
+        queries += random_queries(engine, args.dict, args.random)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not queries:
+            queries = list(baseline["rankings"])
+    top = args.top or (baseline or {}).get("top") or DEFAULT_TOP
+
+    results, seconds = {}, []
+    for query in queries:
+        candidates, elapsed = timed_lookup(engine, query, top)
+        results[query] = (candidates, elapsed)
+        seconds.append(elapsed)
+
+    if len(queries) <= 20:
+        for query, (candidates, elapsed) in results.items():
+            print(f"\n{query}（{elapsed * 1e6:.0f} µs）")
+            if not candidates:
+                print("  （查無候選字）")
+            for i, c in enumerate(candidates, 1):
+                kind = "" if c.spelling_type == NORMAL else f"（{LUI_HING_MIA[c.spelling_type]}）"
+                print(f"  {i:>2}. {c.text}\t{c.code}\t{c.weight:g}{kind}")
+
+    summary = latency_summary(seconds)
+    if summary["count"]:
+        print(
+            f"\n查詢 {summary['count']} 筆：平均 {summary['mean_us']:.0f} µs、中位數 {summary['p50_us']:.0f} µs、"
+            f"p95 {summary['p95_us']:.0f} µs、最大 {summary['max_us']:.0f} µs"
+        )
+
+    current = {query: ranking(candidates) for query, (candidates, _) in results.items()}
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"top": top, "rankings": current}, f, ensure_ascii=False, indent=2)
+        print(f"候選字排序已寫入 {args.save_baseline}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "latency": summary,
+                    "queries": {
+                        query: {"seconds": elapsed, "candidates": [c._asdict() for c in candidates]}
+                        for query, (candidates, elapsed) in results.items()
+                    },
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    if baseline is not None:
+        # 以與基準不同的 --top 比對時，只比對兩者都有的前幾名
+        n = min(top, baseline.get("top") or top)
+        rankings = baseline["rankings"]
+        changed = compare_rankings(current, rankings, n)
+        print(f"與基準比對 {len(rankings)} 筆查詢（前 {n} 名），排序不同 {len(changed)} 筆")
+        for query in changed[:20]:
+            print(f"  {query}")
+            print(f"    基準：{' '.join(r.split(chr(9))[0] for r in rankings[query][:n])}")
+            print(f"    目前：{' '.join(r.split(chr(9))[0] for r in current[query][:n])}")
+        if changed:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
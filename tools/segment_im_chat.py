@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+segment_im_chat.py
+
+將未以分隔符號（' 或空白）隔開的連續輸入切分成 BP 音節，如 zian1ho3lang2 → zian1 ho3 lang2。
+
+rime.lua 的 split_inline 與 comment_format 的 xform/'/ / 都依賴使用者在音節之間打 '；
+本工具評估不打分隔符號時能否正確切分音節，作為是否啟用的依據。
+
+切分方式：
+    - 以 bp_im_chat.py 的合法音節（BP_IM_CHAT）接上聲調（BP_TIAU_HO）建立字首樹（trie）；
+      亦收錄不帶聲調的音節（對應該音節的所有聲調，與 algebra 的 derive/^([a-z]+)\\d$/$1/ 相同）
+    - 各音節的分數為其在字典中出現頻率（各詞條 weight 之和）的對數，字典沒有的合法音節給予極小的頻率
+    - 以 Viterbi 動態規劃自左至右，每個位置只保留分數最高的 top_k 個切分（以回溯指標記錄），
+      每個位置最多往後比對「最長音節的字元數」個字元，故耗時與輸入長度成正比
+    - 輸入中的分隔符號為強制的切分點
+無法切分（含不合法的音節）時回傳空清單。
+
+用法：
+    python segment_im_chat.py [input ...] [--dict DICT] [--top N] [--eval N]
+
+參數：
+    input (可選) : 要切分的連續輸入，可指定多個
+    --dict       : 字典檔（音節頻率），預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    --top        : 列出分數最高的前幾個切分（預設：5）
+    --eval       : 以字典頻率隨機組成 N 筆 2–4 個音節的編碼，去掉分隔符號後切分，
+                   統計還原率及省下的按鍵數，並量測耗時是否與輸入長度成正比（預設：0，不評估）
+
+範例：
+    python segment_im_chat.py zian1ho3lang2 zianholang --eval 5000
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from typing import NamedTuple
+
+from bp_im_chat import BP_IM_CHAT, BP_KAN_KEH, BP_TIAU_HO
+from rime_algebra import IM_CHAT_KAN_KEH
+from rime_dict import MappedRimeDict, parse_weight
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+
+# 字典中沒有的合法音節的頻率
+BIN_LUT_SIAU = 1e-4
+
+# 字首樹節點中存放音節分數的鍵
+_BOO = None
+
+
+class Segmentation(NamedTuple):
+    im_chat: tuple[str, ...]
+    score: float  # 各音節分數（頻率的對數）之和
+
+
+def im_chat_frequency(dict_path: str) -> dict[str, float]:
+    """字典中各音節（含聲調）的頻率：包含該音節的詞條 weight 之和。"""
+    freq: dict[str, float] = {}
+    with MappedRimeDict(dict_path) as ji_khoo:
+        for code, weight in ji_khoo.fields("code", "weight"):
+            if not code:
+                continue
+            w = parse_weight(weight) or BIN_LUT_SIAU
+            for s in IM_CHAT_KAN_KEH.split(code.strip()):
+                if s:
+                    freq[s] = freq.get(s, 0.0) + w
+    return freq
+
+
+class Segmenter:
+    """合法 BP 音節的字首樹，及以 Viterbi 求前 top_k 個切分。"""
+
+    def __init__(self, freq: dict[str, float], im_chat=BP_IM_CHAT, tiau_ho: str = BP_TIAU_HO, toneless: bool = True):
+        self.kan_keh = set(BP_KAN_KEH)
+        scores: dict[str, float] = {}
+        total = 0.0
+        for base in im_chat:
+            toneless_freq = 0.0
+            for tone in tiau_ho:
+                f = freq.get(base + tone, 0.0) or BIN_LUT_SIAU
+                scores[base + tone] = f
+                toneless_freq += f
+            if toneless:
+                scores[base] = toneless_freq
+            total += toneless_freq
+        self.trie: dict = {}
+        self.max_len = 0
+        for s, f in scores.items():
+            node = self.trie
+            for ch in s:
+                node = node.setdefault(ch, {})
+            node[_BOO] = math.log(f / total)
+            self.max_len = max(self.max_len, len(s))
+
+    def is_im_chat(self, s: str) -> bool:
+        """s 是否為字首樹中的音節。"""
+        node = self.trie
+        for ch in s:
+            node = node.get(ch)
+            if node is None:
+                return False
+        return _BOO in node
+
+    def segment(self, text: str, top_k: int = 5) -> list[Segmentation]:
+        """切分 text，回傳分數最高的前 top_k 個切分（由高至低）；無法切分時回傳空清單。"""
+        text = text.strip().lower()
+        n = len(text)
+        if not n:
+            return []
+        # best[i]：切分到位置 i 的前 top_k 個 (分數, 前一位置, 前一位置的名次, 音節)；
+        # 位置 i 的候選全由 i 之前的位置產生，處理到 i 時即可排序定案
+        best: list[list[tuple[float, int, int, str | None]]] = [[] for _ in range(n + 1)]
+        best[0] = [(0.0, -1, -1, None)]
+        for i in range(n + 1):
+            if i:
+                best[i] = sorted(best[i], key=lambda item: item[0], reverse=True)[:top_k]
+            if not best[i] or i == n:
+                continue
+            if text[i] in self.kan_keh:
+                # 分隔符號：不產生音節，分數不變
+                best[i + 1].extend((score, i, rank, None) for rank, (score, *_) in enumerate(best[i]))
+                continue
+            node = self.trie
+            for j in range(i, min(n, i + self.max_len)):
+                node = node.get(text[j])
+                if node is None:
+                    break
+                log_p = node.get(_BOO)
+                if log_p is not None:
+                    s = text[i : j + 1]
+                    best[j + 1].extend((score + log_p, i, rank, s) for rank, (score, *_) in enumerate(best[i]))
+
+        results = []
+        for rank, (score, *_) in enumerate(best[n]):
+            im_chat = []
+            pos = n
+            while pos > 0:
+                _, prev, prev_rank, s = best[pos][rank]
+                if s is not None:
+                    im_chat.append(s)
+                pos, rank = prev, prev_rank
+            results.append(Segmentation(tuple(reversed(im_chat)), score))
+        return results
+
+
+def sample_codes(segmenter: Segmenter, freq: dict[str, float], n: int, seed: int = 0) -> list[tuple[str, ...]]:
+    """依音節頻率隨機組成 n 筆 2–4 個音節的編碼（只取合法音節）。"""
+    rng = random.Random(seed)
+    im_chat = sorted(s for s in freq if segmenter.is_im_chat(s))
+    weights = [freq[s] for s in im_chat]
+    return [tuple(rng.choices(im_chat, weights, k=rng.randint(2, 4))) for _ in range(n)]
+
+
+def evaluate(segmenter: Segmenter, codes: list[tuple[str, ...]], top_k: int) -> dict:
+    """
+    去掉分隔符號後切分各編碼，統計：
+    帶聲調／不帶聲調時第 1 名即為原音節的比例、原音節在前 top_k 名內的比例，以及省下的按鍵比例。
+    """
+    stats = {"count": len(codes)}
+    for mode, strip in (("tone", False), ("toneless", True)):
+        top1 = in_top = 0
+        for code in codes:
+            expected = tuple(s.rstrip("0123456789") for s in code) if strip else code
+            results = [r.im_chat for r in segmenter.segment("".join(expected), top_k)]
+            top1 += bool(results) and results[0] == expected
+            in_top += expected in results
+        stats[mode] = {"top1": top1 / max(len(codes), 1), f"top{top_k}": in_top / max(len(codes), 1)}
+    keys = sum(len("'".join(code)) for code in codes)
+    stats["keys_saved"] = sum(len(code) - 1 for code in codes) / max(keys, 1)
+    return stats
+
+
+def linearity(segmenter: Segmenter, freq: dict[str, float], sizes=(16, 64, 256, 1024), top_k: int = 5) -> list:
+    """連續輸入 n 個音節時的切分耗時，回傳 [(音節數, 字元數, 每字元微秒), ...]。"""
+    rng = random.Random(1)
+    im_chat = sorted(s for s in freq if segmenter.is_im_chat(s))
+    rows = []
+    for n in sizes:
+        text = "".join(rng.choices(im_chat, k=n))
+        t0 = time.perf_counter()
+        segmenter.segment(text, top_k)
+        elapsed = time.perf_counter() - t0
+        rows.append((n, len(text), elapsed / len(text) * 1e6))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="以動態規劃切分未加分隔符號的連續輸入")
+    parser.add_argument("input", nargs="*", help="要切分的連續輸入")
+    parser.add_argument("--dict", default=DEFAULT_DICT, help="字典檔路徑")
+    parser.add_argument("--top", type=int, default=5, help="列出分數最高的前幾個切分（預設：5）")
+    parser.add_argument("--eval", type=int, default=0, help="隨機組成 N 筆編碼評估還原率")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.dict):
+        print(f"錯誤：輸入檔案不存在 - {args.dict}")
+        return 1
+
+    t0 = time.perf_counter()
+    freq = im_chat_frequency(args.dict)
+    segmenter = Segmenter(freq)
+    print(f"音節頻率 {len(freq)} 個，字首樹建立完成（{time.perf_counter() - t0:.3f} 秒）")
+
+    for text in args.input:
+        t1 = time.perf_counter()
+        results = segmenter.segment(text, args.top)
+        elapsed = time.perf_counter() - t1
+        print(f"\n{text}（{elapsed * 1e6:.0f} µs）")
+        if not results:
+            print("  （無法切分）")
+        for i, r in enumerate(results, 1):
+            print(f"  {i}. {' '.join(r.im_chat)}\t{r.score:.2f}")
+
+    if args.eval:
+        stats = evaluate(segmenter, sample_codes(segmenter, freq, args.eval), args.top)
+        print(f"\n評估 {stats['count']} 筆 2–4 個音節的編碼（去掉分隔符號）：")
+        for mode, label in (("tone", "帶聲調"), ("toneless", "不帶聲調")):
+            top1, top_k = stats[mode]["top1"], stats[mode][f"top{args.top}"]
+            print(f"  {label}：第 1 名正確 {top1:.1%}，前 {args.top} 名內 {top_k:.1%}")
+        print(f"  省下的按鍵：{stats['keys_saved']:.1%}")
+        print("\n耗時（每字元）：")
+        for n, chars, us in linearity(segmenter, freq, top_k=args.top):
+            print(f"  {n:>5} 個音節（{chars:>5} 字元）：{us:.2f} µs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+sort_ji_khoo.py
+
+以外部合併排序（external merge sort）將 Rime 字典檔的詞條排序，可處理遠大於記憶體的檔案：
+    1. 逐行讀入詞條，每累積 run_size 行便在記憶體中排序，寫成一個暫存檔（run）
+    2. 以 heapq.merge 將所有 run 做 k 路合併，逐行寫出
+
+排序方式：
+    code   : 依 (code, -weight)，同編碼權重高者在前；輸出可直接以二分搜尋查編碼
+    weight : 依 -weight，權重高者在前
+鍵值相同的詞條維持原本的先後順序，因此輸出是確定的，方便增量轉換及比對差異。
+
+標頭區原樣保留；詞條區的空行及註解行無法隨詞條排序，會被略去。
+
+用法：
+    python sort_ji_khoo.py [--by code|weight] [--run-size N] <輸入檔> <輸出檔>
+    （檔名為 "-" 時代表標準輸入／標準輸出）
+
+範例：
+    # 轉換後直接排序，不經中間檔
+    python convert_tlpa_to_bp_for_rime_dict.py input.dict.yaml - | python sort_ji_khoo.py - output.dict.yaml
+"""
+
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, islice
+
+from rime_dict import open_input, open_output, parse_columns, parse_weight, read_header
+
+# 每個 run 的預設行數
+RUN_SIZE = 500_000
+
+# 一次合併的 run 數上限；超過時先分批合併，以免同時開啟過多檔案
+MAX_FAN_IN = 256
+
+SORT_KEYS = ("code", "weight")
+
+
+def make_key(columns: list[str], by: str) -> Callable[[str], tuple]:
+    """依 columns: 宣告產生詞條行的排序鍵函式。"""
+    code_i = columns.index("code") if "code" in columns else 1
+    weight_i = columns.index("weight") if "weight" in columns else None
+
+    def weight_of(parts: list[str]) -> float:
+        if weight_i is None or weight_i >= len(parts):
+            return 0.0
+        return parse_weight(parts[weight_i])
+
+    if by == "code":
+        def key(line: str) -> tuple:
+            parts = line.rstrip("\n").split("\t")
+            code = parts[code_i] if code_i < len(parts) else ""
+            return (code, -weight_of(parts))
+    elif by == "weight":
+        def key(line: str) -> tuple:
+            return (-weight_of(line.rstrip("\n").split("\t")),)
+    else:
+        raise ValueError(f"不支援的排序方式：{by}（可用：{', '.join(SORT_KEYS)}）")
+    return key
+
+
+def _write_run(lines: Iterable[str], tmpdir: str) -> str:
+    """將已排序的詞條行寫成 tmpdir 下的一個 run 檔，回傳其路徑。"""
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmpdir)
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+        f.writelines(lines)
+    return path
+
+
+def _merge_runs(paths: list[str], key: Callable[[str], tuple]) -> Iterator[str]:
+    """k 路合併已排序的 run 檔；鍵值相同時依 paths 的順序輸出（即維持原順序）。"""
+    files = [open(path, "r", encoding="utf-8", newline="") for path in paths]
+    try:
+        yield from heapq.merge(*files, key=key)
+    finally:
+        for f in files:
+            f.close()
+
+
+def sort_lines(
+    lines: Iterable[str],
+    key: Callable[[str], tuple],
+    run_size: int = RUN_SIZE,
+    tmpdir: str | None = None,
+) -> Iterator[str]:
+    """
+    排序詞條行（每行須以 "\\n" 結尾），逐行產出排序結果。
+    記憶體中最多只保留 run_size 行；行數不超過 run_size 時不產生暫存檔。
+    """
+    lines = iter(lines)
+    chunk = list(islice(lines, run_size))
+    chunk.sort(key=key)
+    peek = next(lines, None)
+    if peek is None:
+        yield from chunk
+        return
+
+    lines = chain((peek,), lines)
+    with tempfile.TemporaryDirectory(prefix="sort_ji_khoo_", dir=tmpdir) as workdir:
+        runs = []
+        while chunk:
+            runs.append(_write_run(chunk, workdir))
+            chunk = list(islice(lines, run_size))
+            chunk.sort(key=key)
+
+        # run 過多時分批合併，直到可一次合併為止
+        while len(runs) > MAX_FAN_IN:
+            merged = []
+            for i in range(0, len(runs), MAX_FAN_IN):
+                group = runs[i : i + MAX_FAN_IN]
+                merged.append(_write_run(_merge_runs(group, key), workdir))
+                for path in group:
+                    os.unlink(path)
+            runs = merged
+
+        yield from _merge_runs(runs, key)
+
+
+def sort_ji_khoo(fin, fout, by: str = "code", run_size: int = RUN_SIZE, tmpdir: str | None = None) -> int:
+    """
+    排序字典檔：標頭區原樣寫出，詞條區排序後寫出；回傳略去的空行及註解行數。
+    """
+    header_lines = read_header(fin)
+    fout.writelines(header_lines)
+    key = make_key(parse_columns(header_lines), by)
+
+    skipped = 0
+
+    def su_tiau() -> Iterator[str]:
+        nonlocal skipped
+        for line in fin:
+            if not line.strip() or line.startswith("#"):
+                skipped += 1
+                continue
+            yield line if line.endswith("\n") else line + "\n"
+
+    fout.writelines(sort_lines(su_tiau(), key, run_size, tmpdir))
+    return skipped
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="以外部合併排序排列字典檔詞條")
+    parser.add_argument("infile", help="輸入檔（- 代表標準輸入）")
+    parser.add_argument("outfile", help="輸出檔（- 代表標準輸出）")
+    parser.add_argument("--by", choices=SORT_KEYS, default="code", help="排序方式（預設：code）")
+    parser.add_argument("--run-size", type=int, default=RUN_SIZE, help=f"每個 run 的行數（預設：{RUN_SIZE}）")
+    parser.add_argument("--tmpdir", help="暫存檔目錄（預設：系統暫存目錄）")
+    args = parser.parse_args(argv)
+
+    log = sys.stderr if args.outfile == "-" else sys.stdout
+    if args.infile != "-" and not os.path.exists(args.infile):
+        print(f"錯誤：輸入檔案不存在 - {args.infile}", file=log)
+        return 1
+
+    with open_input(args.infile) as fin, open_output(args.outfile) as fout:
+        skipped = sort_ji_khoo(fin, fout, args.by, max(1, args.run_size), args.tmpdir)
+    if skipped:
+        print(f"已略去詞條區的空行及註解 {skipped} 行", file=log)
+    print(f"排序完成，結果已寫入 {args.outfile}", file=log)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
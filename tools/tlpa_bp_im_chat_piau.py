@@ -0,0 +1,2054 @@
+"""
+tlpa_bp_im_chat_piau.py
+
+【台語音標（TLPA）】→【閩拼（BP）】音節對照表（不含聲調）。
+
+本檔由 build_im_chat_piau.py 自動產生，請勿手動修改；
+修改 convert_tlpa_to_bp_for_rime_dict.py 的轉換規則後，請重新執行該工具。
+"""
+
+# 產生本表時，轉換規則對照表的雜湊值
+KUI_TSIK_HASH = "e16330dfd0cc94c4"
+
+IM_CHAT_PIAU = {
+    "a": "a",
+    "i": "yi",
+    "u": "wu",
+    "e": "e",
+    "o": "o",
+    "oo": "oo",
+    "ir": "yir",
+    "ee": "ee",
+    "er": "er",
+    "ai": "ai",
+    "au": "ao",
+    "ia": "ya",
+    "iu": "yu",
+    "io": "yo",
+    "ua": "wa",
+    "ui": "wi",
+    "ue": "we",
+    "uee": "wee",
+    "iau": "yao",
+    "uai": "wai",
+    "ere": "ere",
+    "am": "am",
+    "an": "an",
+    "ang": "ang",
+    "im": "yim",
+    "in": "yin",
+    "ing": "ying",
+    "un": "wun",
+    "ong": "ong",
+    "om": "om",
+    "erng": "erng",
+    "iam": "yam",
+    "ian": "yan",
+    "iang": "yang",
+    "iong": "yong",
+    "uan": "wan",
+    "uang": "wang",
+    "ann": "ann",
+    "inn": "ni",
+    "enn": "ne",
+    "onn": "no",
+    "oonn": "no",
+    "unn": "wunn",
+    "ainn": "nai",
+    "aunn": "aunn",
+    "iann": "nia",
+    "iunn": "niu",
+    "ionn": "nio",
+    "uann": "nua",
+    "uinn": "winn",
+    "uainn": "nuai",
+    "iaunn": "niao",
+    "m": "m",
+    "ng": "ng",
+    "ah": "ah",
+    "ih": "yih",
+    "uh": "wuh",
+    "eh": "eh",
+    "oh": "oh",
+    "ooh": "ooh",
+    "irh": "yirh",
+    "eeh": "eeh",
+    "erh": "erh",
+    "auh": "auh",
+    "iah": "yah",
+    "iuh": "yuh",
+    "ioh": "yoh",
+    "uah": "wah",
+    "uih": "wih",
+    "ueh": "weh",
+    "ueeh": "weeh",
+    "iauh": "yauh",
+    "ereh": "ereh",
+    "annh": "annh",
+    "innh": "yinnh",
+    "ennh": "ennh",
+    "onnh": "onnh",
+    "ainnh": "ainnh",
+    "aunnh": "aunnh",
+    "iannh": "yannh",
+    "iunnh": "yunnh",
+    "uannh": "wannh",
+    "uinnh": "winnh",
+    "uainnh": "wainnh",
+    "iaunnh": "yaunnh",
+    "mh": "bbnh",
+    "ngh": "ggnh",
+    "ap": "ap",
+    "at": "at",
+    "ak": "ak",
+    "ip": "yip",
+    "it": "yit",
+    "ik": "yik",
+    "ut": "wut",
+    "ok": "ok",
+    "op": "op",
+    "erk": "erk",
+    "iap": "yap",
+    "iat": "yat",
+    "iak": "yak",
+    "iok": "yok",
+    "uat": "wat",
+    "tsha": "ca",
+    "tshi": "ci",
+    "tshu": "cu",
+    "tshe": "ce",
+    "tsho": "co",
+    "tshoo": "coo",
+    "tshir": "cir",
+    "tshee": "cee",
+    "tsher": "cer",
+    "tshai": "cai",
+    "tshau": "cao",
+    "tshia": "cia",
+    "tshiu": "ciu",
+    "tshio": "cio",
+    "tshua": "cua",
+    "tshui": "cui",
+    "tshue": "cue",
+    "tshuee": "cuee",
+    "tshiau": "ciao",
+    "tshuai": "cuai",
+    "tshere": "cere",
+    "tsham": "cam",
+    "tshan": "can",
+    "tshang": "cang",
+    "tshim": "cim",
+    "tshin": "cin",
+    "tshing": "cing",
+    "tshun": "cun",
+    "tshong": "cong",
+    "tshom": "com",
+    "tsherng": "cerng",
+    "tshiam": "ciam",
+    "tshian": "cian",
+    "tshiang": "ciang",
+    "tshiong": "ciong",
+    "tshuan": "cuan",
+    "tshuang": "cuang",
+    "tshann": "cann",
+    "tshinn": "cni",
+    "tshenn": "cne",
+    "tshonn": "cno",
+    "tshoonn": "cno",
+    "tshunn": "cunn",
+    "tshainn": "cnai",
+    "tshaunn": "caunn",
+    "tshiann": "cnia",
+    "tshiunn": "cniu",
+    "tshionn": "cnio",
+    "tshuann": "cnua",
+    "tshuinn": "cuinn",
+    "tshuainn": "cnuai",
+    "tshiaunn": "cniao",
+    "tshm": "cm",
+    "tshng": "cng",
+    "tshah": "cah",
+    "tshih": "cih",
+    "tshuh": "cuh",
+    "tsheh": "ceh",
+    "tshoh": "coh",
+    "tshooh": "cooh",
+    "tshirh": "cirh",
+    "tsheeh": "ceeh",
+    "tsherh": "cerh",
+    "tshauh": "cauh",
+    "tshiah": "ciah",
+    "tshiuh": "ciuh",
+    "tshioh": "cioh",
+    "tshuah": "cuah",
+    "tshuih": "cuih",
+    "tshueh": "cueh",
+    "tshueeh": "cueeh",
+    "tshiauh": "ciauh",
+    "tshereh": "cereh",
+    "tshannh": "cannh",
+    "tshinnh": "cinnh",
+    "tshennh": "cennh",
+    "tshonnh": "connh",
+    "tshainnh": "cainnh",
+    "tshaunnh": "caunnh",
+    "tshiannh": "ciannh",
+    "tshiunnh": "ciunnh",
+    "tshuannh": "cuannh",
+    "tshuinnh": "cuinnh",
+    "tshuainnh": "cuainnh",
+    "tshiaunnh": "ciaunnh",
+    "tshmh": "cmh",
+    "tshngh": "cngh",
+    "tshap": "cap",
+    "tshat": "cat",
+    "tshak": "cak",
+    "tship": "cip",
+    "tshit": "cit",
+    "tshik": "cik",
+    "tshut": "cut",
+    "tshok": "cok",
+    "tshop": "cop",
+    "tsherk": "cerk",
+    "tshiap": "ciap",
+    "tshiat": "ciat",
+    "tshiak": "ciak",
+    "tshiok": "ciok",
+    "tshuat": "cuat",
+    "tsa": "za",
+    "tsi": "zi",
+    "tsu": "zu",
+    "tse": "ze",
+    "tso": "zo",
+    "tsoo": "zoo",
+    "tsir": "zir",
+    "tsee": "zee",
+    "tser": "zer",
+    "tsai": "zai",
+    "tsau": "zao",
+    "tsia": "zia",
+    "tsiu": "ziu",
+    "tsio": "zio",
+    "tsua": "zua",
+    "tsui": "zui",
+    "tsue": "zue",
+    "tsuee": "zuee",
+    "tsiau": "ziao",
+    "tsuai": "zuai",
+    "tsere": "zere",
+    "tsam": "zam",
+    "tsan": "zan",
+    "tsang": "zang",
+    "tsim": "zim",
+    "tsin": "zin",
+    "tsing": "zing",
+    "tsun": "zun",
+    "tsong": "zong",
+    "tsom": "zom",
+    "tserng": "zerng",
+    "tsiam": "ziam",
+    "tsian": "zian",
+    "tsiang": "ziang",
+    "tsiong": "ziong",
+    "tsuan": "zuan",
+    "tsuang": "zuang",
+    "tsann": "zann",
+    "tsinn": "zni",
+    "tsenn": "zne",
+    "tsonn": "zno",
+    "tsoonn": "zno",
+    "tsunn": "zunn",
+    "tsainn": "znai",
+    "tsaunn": "zaunn",
+    "tsiann": "znia",
+    "tsiunn": "zniu",
+    "tsionn": "znio",
+    "tsuann": "znua",
+    "tsuinn": "zuinn",
+    "tsuainn": "znuai",
+    "tsiaunn": "zniao",
+    "tsm": "zm",
+    "tsng": "zng",
+    "tsah": "zah",
+    "tsih": "zih",
+    "tsuh": "zuh",
+    "tseh": "zeh",
+    "tsoh": "zoh",
+    "tsooh": "zooh",
+    "tsirh": "zirh",
+    "tseeh": "zeeh",
+    "tserh": "zerh",
+    "tsauh": "zauh",
+    "tsiah": "ziah",
+    "tsiuh": "ziuh",
+    "tsioh": "zioh",
+    "tsuah": "zuah",
+    "tsuih": "zuih",
+    "tsueh": "zueh",
+    "tsueeh": "zueeh",
+    "tsiauh": "ziauh",
+    "tsereh": "zereh",
+    "tsannh": "zannh",
+    "tsinnh": "zinnh",
+    "tsennh": "zennh",
+    "tsonnh": "zonnh",
+    "tsainnh": "zainnh",
+    "tsaunnh": "zaunnh",
+    "tsiannh": "ziannh",
+    "tsiunnh": "ziunnh",
+    "tsuannh": "zuannh",
+    "tsuinnh": "zuinnh",
+    "tsuainnh": "zuainnh",
+    "tsiaunnh": "ziaunnh",
+    "tsmh": "zmh",
+    "tsngh": "zngh",
+    "tsap": "zap",
+    "tsat": "zat",
+    "tsak": "zak",
+    "tsip": "zip",
+    "tsit": "zit",
+    "tsik": "zik",
+    "tsut": "zut",
+    "tsok": "zok",
+    "tsop": "zop",
+    "tserk": "zerk",
+    "tsiap": "ziap",
+    "tsiat": "ziat",
+    "tsiak": "ziak",
+    "tsiok": "ziok",
+    "tsuat": "zuat",
+    "pha": "pa",
+    "phi": "pi",
+    "phu": "pu",
+    "phe": "pe",
+    "pho": "po",
+    "phoo": "poo",
+    "phir": "pir",
+    "phee": "pee",
+    "pher": "per",
+    "phai": "pai",
+    "phau": "pao",
+    "phia": "pia",
+    "phiu": "piu",
+    "phio": "pio",
+    "phua": "pua",
+    "phui": "pui",
+    "phue": "pue",
+    "phuee": "puee",
+    "phiau": "piao",
+    "phuai": "puai",
+    "phere": "pere",
+    "pham": "pam",
+    "phan": "pan",
+    "phang": "pang",
+    "phim": "pim",
+    "phin": "pin",
+    "phing": "ping",
+    "phun": "pun",
+    "phong": "pong",
+    "phom": "pom",
+    "pherng": "perng",
+    "phiam": "piam",
+    "phian": "pian",
+    "phiang": "piang",
+    "phiong": "piong",
+    "phuan": "puan",
+    "phuang": "puang",
+    "phann": "pann",
+    "phinn": "pni",
+    "phenn": "pne",
+    "phonn": "pno",
+    "phoonn": "pno",
+    "phunn": "punn",
+    "phainn": "pnai",
+    "phaunn": "paunn",
+    "phiann": "pnia",
+    "phiunn": "pniu",
+    "phionn": "pnio",
+    "phuann": "pnua",
+    "phuinn": "puinn",
+    "phuainn": "pnuai",
+    "phiaunn": "pniao",
+    "phm": "pm",
+    "phng": "png",
+    "phah": "pah",
+    "phih": "pih",
+    "phuh": "puh",
+    "pheh": "peh",
+    "phoh": "poh",
+    "phooh": "pooh",
+    "phirh": "pirh",
+    "pheeh": "peeh",
+    "pherh": "perh",
+    "phauh": "pauh",
+    "phiah": "piah",
+    "phiuh": "piuh",
+    "phioh": "pioh",
+    "phuah": "puah",
+    "phuih": "puih",
+    "phueh": "pueh",
+    "phueeh": "pueeh",
+    "phiauh": "piauh",
+    "phereh": "pereh",
+    "phannh": "pannh",
+    "phinnh": "pinnh",
+    "phennh": "pennh",
+    "phonnh": "ponnh",
+    "phainnh": "painnh",
+    "phaunnh": "paunnh",
+    "phiannh": "piannh",
+    "phiunnh": "piunnh",
+    "phuannh": "puannh",
+    "phuinnh": "puinnh",
+    "phuainnh": "puainnh",
+    "phiaunnh": "piaunnh",
+    "phmh": "pmh",
+    "phngh": "pngh",
+    "phap": "pap",
+    "phat": "pat",
+    "phak": "pak",
+    "phip": "pip",
+    "phit": "pit",
+    "phik": "pik",
+    "phut": "put",
+    "phok": "pok",
+    "phop": "pop",
+    "pherk": "perk",
+    "phiap": "piap",
+    "phiat": "piat",
+    "phiak": "piak",
+    "phiok": "piok",
+    "phuat": "puat",
+    "tha": "ta",
+    "thi": "ti",
+    "thu": "tu",
+    "the": "te",
+    "tho": "to",
+    "thoo": "too",
+    "thir": "tir",
+    "thee": "tee",
+    "ther": "ter",
+    "thai": "tai",
+    "thau": "tao",
+    "thia": "tia",
+    "thiu": "tiu",
+    "thio": "tio",
+    "thua": "tua",
+    "thui": "tui",
+    "thue": "tue",
+    "thuee": "tuee",
+    "thiau": "tiao",
+    "thuai": "tuai",
+    "there": "tere",
+    "tham": "tam",
+    "than": "tan",
+    "thang": "tang",
+    "thim": "tim",
+    "thin": "tin",
+    "thing": "ting",
+    "thun": "tun",
+    "thong": "tong",
+    "thom": "tom",
+    "therng": "terng",
+    "thiam": "tiam",
+    "thian": "tian",
+    "thiang": "tiang",
+    "thiong": "tiong",
+    "thuan": "tuan",
+    "thuang": "tuang",
+    "thann": "tann",
+    "thinn": "tni",
+    "thenn": "tne",
+    "thonn": "tno",
+    "thoonn": "tno",
+    "thunn": "tunn",
+    "thainn": "tnai",
+    "thaunn": "taunn",
+    "thiann": "tnia",
+    "thiunn": "tniu",
+    "thionn": "tnio",
+    "thuann": "tnua",
+    "thuinn": "tuinn",
+    "thuainn": "tnuai",
+    "thiaunn": "tniao",
+    "thm": "tm",
+    "thng": "tng",
+    "thah": "tah",
+    "thih": "tih",
+    "thuh": "tuh",
+    "theh": "teh",
+    "thoh": "toh",
+    "thooh": "tooh",
+    "thirh": "tirh",
+    "theeh": "teeh",
+    "therh": "terh",
+    "thauh": "tauh",
+    "thiah": "tiah",
+    "thiuh": "tiuh",
+    "thioh": "tioh",
+    "thuah": "tuah",
+    "thuih": "tuih",
+    "thueh": "tueh",
+    "thueeh": "tueeh",
+    "thiauh": "tiauh",
+    "thereh": "tereh",
+    "thannh": "tannh",
+    "thinnh": "tinnh",
+    "thennh": "tennh",
+    "thonnh": "tonnh",
+    "thainnh": "tainnh",
+    "thaunnh": "taunnh",
+    "thiannh": "tiannh",
+    "thiunnh": "tiunnh",
+    "thuannh": "tuannh",
+    "thuinnh": "tuinnh",
+    "thuainnh": "tuainnh",
+    "thiaunnh": "tiaunnh",
+    "thmh": "tmh",
+    "thngh": "tngh",
+    "thap": "tap",
+    "that": "tat",
+    "thak": "tak",
+    "thip": "tip",
+    "thit": "tit",
+    "thik": "tik",
+    "thut": "tut",
+    "thok": "tok",
+    "thop": "top",
+    "therk": "terk",
+    "thiap": "tiap",
+    "thiat": "tiat",
+    "thiak": "tiak",
+    "thiok": "tiok",
+    "thuat": "tuat",
+    "kha": "ka",
+    "khi": "ki",
+    "khu": "ku",
+    "khe": "ke",
+    "kho": "ko",
+    "khoo": "koo",
+    "khir": "kir",
+    "khee": "kee",
+    "kher": "ker",
+    "khai": "kai",
+    "khau": "kao",
+    "khia": "kia",
+    "khiu": "kiu",
+    "khio": "kio",
+    "khua": "kua",
+    "khui": "kui",
+    "khue": "kue",
+    "khuee": "kuee",
+    "khiau": "kiao",
+    "khuai": "kuai",
+    "khere": "kere",
+    "kham": "kam",
+    "khan": "kan",
+    "khang": "kang",
+    "khim": "kim",
+    "khin": "kin",
+    "khing": "king",
+    "khun": "kun",
+    "khong": "kong",
+    "khom": "kom",
+    "kherng": "kerng",
+    "khiam": "kiam",
+    "khian": "kian",
+    "khiang": "kiang",
+    "khiong": "kiong",
+    "khuan": "kuan",
+    "khuang": "kuang",
+    "khann": "kann",
+    "khinn": "kni",
+    "khenn": "kne",
+    "khonn": "kno",
+    "khoonn": "kno",
+    "khunn": "kunn",
+    "khainn": "knai",
+    "khaunn": "kaunn",
+    "khiann": "knia",
+    "khiunn": "kniu",
+    "khionn": "knio",
+    "khuann": "knua",
+    "khuinn": "kuinn",
+    "khuainn": "knuai",
+    "khiaunn": "kniao",
+    "khm": "km",
+    "khng": "kng",
+    "khah": "kah",
+    "khih": "kih",
+    "khuh": "kuh",
+    "kheh": "keh",
+    "khoh": "koh",
+    "khooh": "kooh",
+    "khirh": "kirh",
+    "kheeh": "keeh",
+    "kherh": "kerh",
+    "khauh": "kauh",
+    "khiah": "kiah",
+    "khiuh": "kiuh",
+    "khioh": "kioh",
+    "khuah": "kuah",
+    "khuih": "kuih",
+    "khueh": "kueh",
+    "khueeh": "kueeh",
+    "khiauh": "kiauh",
+    "khereh": "kereh",
+    "khannh": "kannh",
+    "khinnh": "kinnh",
+    "khennh": "kennh",
+    "khonnh": "konnh",
+    "khainnh": "kainnh",
+    "khaunnh": "kaunnh",
+    "khiannh": "kiannh",
+    "khiunnh": "kiunnh",
+    "khuannh": "kuannh",
+    "khuinnh": "kuinnh",
+    "khuainnh": "kuainnh",
+    "khiaunnh": "kiaunnh",
+    "khmh": "kmh",
+    "khngh": "kngh",
+    "khap": "kap",
+    "khat": "kat",
+    "khak": "kak",
+    "khip": "kip",
+    "khit": "kit",
+    "khik": "kik",
+    "khut": "kut",
+    "khok": "kok",
+    "khop": "kop",
+    "kherk": "kerk",
+    "khiap": "kiap",
+    "khiat": "kiat",
+    "khiak": "kiak",
+    "khiok": "kiok",
+    "khuat": "kuat",
+    "nga": "ggna",
+    "ngi": "ggni",
+    "ngu": "ggnu",
+    "nge": "ggne",
+    "ngo": "ggno",
+    "ngoo": "ggnoo",
+    "ngir": "ggnir",
+    "ngee": "ggnee",
+    "nger": "ggner",
+    "ngai": "ggnai",
+    "ngau": "ggnao",
+    "ngia": "ggnia",
+    "ngiu": "ggniu",
+    "ngio": "ggnio",
+    "ngua": "ggnua",
+    "ngui": "ggnui",
+    "ngue": "ggnue",
+    "nguee": "ggnuee",
+    "ngiau": "ggniao",
+    "nguai": "ggnuai",
+    "ngere": "ggnere",
+    "ngam": "ggnam",
+    "ngan": "ggnan",
+    "ngang": "ggnang",
+    "ngim": "ggnim",
+    "ngin": "ggnin",
+    "nging": "ggning",
+    "ngun": "ggnun",
+    "ngong": "ggnong",
+    "ngom": "ggnom",
+    "ngerng": "ggnerng",
+    "ngiam": "ggniam",
+    "ngian": "ggnian",
+    "ngiang": "ggniang",
+    "ngiong": "ggniong",
+    "nguan": "ggnuan",
+    "nguang": "ggnuang",
+    "ngann": "ggnann",
+    "nginn": "ggnni",
+    "ngenn": "ggnne",
+    "ngonn": "ggnno",
+    "ngoonn": "ggnno",
+    "ngunn": "ggnunn",
+    "ngainn": "ggnnai",
+    "ngaunn": "ggnaunn",
+    "ngiann": "ggnnia",
+    "ngiunn": "ggnniu",
+    "ngionn": "ggnnio",
+    "nguann": "ggnnua",
+    "nguinn": "ggnuinn",
+    "nguainn": "ggnnuai",
+    "ngiaunn": "ggnniao",
+    "ngm": "ggnm",
+    "ngng": "ggnng",
+    "ngah": "ggnah",
+    "ngih": "ggnih",
+    "nguh": "ggnuh",
+    "ngeh": "ggneh",
+    "ngoh": "ggnoh",
+    "ngooh": "ggnooh",
+    "ngirh": "ggnirh",
+    "ngeeh": "ggneeh",
+    "ngerh": "ggnerh",
+    "ngauh": "ggnauh",
+    "ngiah": "ggniah",
+    "ngiuh": "ggniuh",
+    "ngioh": "ggnioh",
+    "nguah": "ggnuah",
+    "nguih": "ggnuih",
+    "ngueh": "ggnueh",
+    "ngueeh": "ggnueeh",
+    "ngiauh": "ggniauh",
+    "ngereh": "ggnereh",
+    "ngannh": "ggnannh",
+    "nginnh": "ggninnh",
+    "ngennh": "ggnennh",
+    "ngonnh": "ggnonnh",
+    "ngainnh": "ggnainnh",
+    "ngaunnh": "ggnaunnh",
+    "ngiannh": "ggniannh",
+    "ngiunnh": "ggniunnh",
+    "nguannh": "ggnuannh",
+    "nguinnh": "ggnuinnh",
+    "nguainnh": "ggnuainnh",
+    "ngiaunnh": "ggniaunnh",
+    "ngmh": "ggnmh",
+    "ngngh": "ggnngh",
+    "ngap": "ggnap",
+    "ngat": "ggnat",
+    "ngak": "ggnak",
+    "ngip": "ggnip",
+    "ngit": "ggnit",
+    "ngik": "ggnik",
+    "ngut": "ggnut",
+    "ngok": "ggnok",
+    "ngop": "ggnop",
+    "ngerk": "ggnerk",
+    "ngiap": "ggniap",
+    "ngiat": "ggniat",
+    "ngiak": "ggniak",
+    "ngiok": "ggniok",
+    "nguat": "ggnuat",
+    "pa": "ba",
+    "pi": "bi",
+    "pu": "bu",
+    "pe": "be",
+    "po": "bo",
+    "poo": "boo",
+    "pir": "bir",
+    "pee": "bee",
+    "per": "ber",
+    "pai": "bai",
+    "pau": "bao",
+    "pia": "bia",
+    "piu": "biu",
+    "pio": "bio",
+    "pua": "bua",
+    "pui": "bui",
+    "pue": "bue",
+    "puee": "buee",
+    "piau": "biao",
+    "puai": "buai",
+    "pere": "bere",
+    "pam": "bam",
+    "pan": "ban",
+    "pang": "bang",
+    "pim": "bim",
+    "pin": "bin",
+    "ping": "bing",
+    "pun": "bun",
+    "pong": "bong",
+    "pom": "bom",
+    "perng": "berng",
+    "piam": "biam",
+    "pian": "bian",
+    "piang": "biang",
+    "piong": "biong",
+    "puan": "buan",
+    "puang": "buang",
+    "pann": "bann",
+    "pinn": "bni",
+    "penn": "bne",
+    "ponn": "bno",
+    "poonn": "bno",
+    "punn": "bunn",
+    "painn": "bnai",
+    "paunn": "baunn",
+    "piann": "bnia",
+    "piunn": "bniu",
+    "pionn": "bnio",
+    "puann": "bnua",
+    "puinn": "buinn",
+    "puainn": "bnuai",
+    "piaunn": "bniao",
+    "pm": "bm",
+    "png": "bng",
+    "pah": "bah",
+    "pih": "bih",
+    "puh": "buh",
+    "peh": "beh",
+    "poh": "boh",
+    "pooh": "booh",
+    "pirh": "birh",
+    "peeh": "beeh",
+    "perh": "berh",
+    "pauh": "bauh",
+    "piah": "biah",
+    "piuh": "biuh",
+    "pioh": "bioh",
+    "puah": "buah",
+    "puih": "buih",
+    "pueh": "bueh",
+    "pueeh": "bueeh",
+    "piauh": "biauh",
+    "pereh": "bereh",
+    "pannh": "bannh",
+    "pinnh": "binnh",
+    "pennh": "bennh",
+    "ponnh": "bonnh",
+    "painnh": "bainnh",
+    "paunnh": "baunnh",
+    "piannh": "biannh",
+    "piunnh": "biunnh",
+    "puannh": "buannh",
+    "puinnh": "buinnh",
+    "puainnh": "buainnh",
+    "piaunnh": "biaunnh",
+    "pmh": "bmh",
+    "pngh": "bngh",
+    "pap": "bap",
+    "pat": "bat",
+    "pak": "bak",
+    "pip": "bip",
+    "pit": "bit",
+    "pik": "bik",
+    "put": "but",
+    "pok": "bok",
+    "pop": "bop",
+    "perk": "berk",
+    "piap": "biap",
+    "piat": "biat",
+    "piak": "biak",
+    "piok": "biok",
+    "puat": "buat",
+    "ba": "bba",
+    "bi": "bbi",
+    "bu": "bbu",
+    "be": "bbe",
+    "bo": "bbo",
+    "boo": "bboo",
+    "bir": "bbir",
+    "bee": "bbee",
+    "ber": "bber",
+    "bai": "bbai",
+    "bau": "bbao",
+    "bia": "bbia",
+    "biu": "bbiu",
+    "bio": "bbio",
+    "bua": "bbua",
+    "bui": "bbui",
+    "bue": "bbue",
+    "buee": "bbuee",
+    "biau": "bbiao",
+    "buai": "bbuai",
+    "bere": "bbere",
+    "bam": "bbam",
+    "ban": "bban",
+    "bang": "bbang",
+    "bim": "bbim",
+    "bin": "bbin",
+    "bing": "bbing",
+    "bun": "bbun",
+    "bong": "bbong",
+    "bom": "bbom",
+    "berng": "bberng",
+    "biam": "bbiam",
+    "bian": "bbian",
+    "biang": "bbiang",
+    "biong": "bbiong",
+    "buan": "bbuan",
+    "buang": "bbuang",
+    "bann": "bbann",
+    "binn": "bbni",
+    "benn": "bbne",
+    "bonn": "bbno",
+    "boonn": "bbno",
+    "bunn": "bbunn",
+    "bainn": "bbnai",
+    "baunn": "bbaunn",
+    "biann": "bbnia",
+    "biunn": "bbniu",
+    "bionn": "bbnio",
+    "buann": "bbnua",
+    "buinn": "bbuinn",
+    "buainn": "bbnuai",
+    "biaunn": "bbniao",
+    "bm": "bbm",
+    "bng": "bbng",
+    "bah": "bbah",
+    "bih": "bbih",
+    "buh": "bbuh",
+    "beh": "bbeh",
+    "boh": "bboh",
+    "booh": "bbooh",
+    "birh": "bbirh",
+    "beeh": "bbeeh",
+    "berh": "bberh",
+    "bauh": "bbauh",
+    "biah": "bbiah",
+    "biuh": "bbiuh",
+    "bioh": "bbioh",
+    "buah": "bbuah",
+    "buih": "bbuih",
+    "bueh": "bbueh",
+    "bueeh": "bbueeh",
+    "biauh": "bbiauh",
+    "bereh": "bbereh",
+    "bannh": "bbannh",
+    "binnh": "bbinnh",
+    "bennh": "bbennh",
+    "bonnh": "bbonnh",
+    "bainnh": "bbainnh",
+    "baunnh": "bbaunnh",
+    "biannh": "bbiannh",
+    "biunnh": "bbiunnh",
+    "buannh": "bbuannh",
+    "buinnh": "bbuinnh",
+    "buainnh": "bbuainnh",
+    "biaunnh": "bbiaunnh",
+    "bmh": "bbmh",
+    "bngh": "bbngh",
+    "bap": "bbap",
+    "bat": "bbat",
+    "bak": "bbak",
+    "bip": "bbip",
+    "bit": "bbit",
+    "bik": "bbik",
+    "but": "bbut",
+    "bok": "bbok",
+    "bop": "bbop",
+    "berk": "bberk",
+    "biap": "bbiap",
+    "biat": "bbiat",
+    "biak": "bbiak",
+    "biok": "bbiok",
+    "buat": "bbuat",
+    "ma": "bbna",
+    "mi": "bbni",
+    "mu": "bbnu",
+    "me": "bbne",
+    "mo": "bbno",
+    "moo": "bbnoo",
+    "mir": "bbnir",
+    "mee": "bbnee",
+    "mer": "bbner",
+    "mai": "bbnai",
+    "mau": "bbnao",
+    "mia": "bbnia",
+    "miu": "bbniu",
+    "mio": "bbnio",
+    "mua": "bbnua",
+    "mui": "bbnui",
+    "mue": "bbnue",
+    "muee": "bbnuee",
+    "miau": "bbniao",
+    "muai": "bbnuai",
+    "mere": "bbnere",
+    "mam": "bbnam",
+    "man": "bbnan",
+    "mang": "bbnang",
+    "mim": "bbnim",
+    "min": "bbnin",
+    "ming": "bbning",
+    "mun": "bbnun",
+    "mong": "bbnong",
+    "mom": "bbnom",
+    "merng": "bbnerng",
+    "miam": "bbniam",
+    "mian": "bbnian",
+    "miang": "bbniang",
+    "miong": "bbniong",
+    "muan": "bbnuan",
+    "muang": "bbnuang",
+    "mann": "bbnann",
+    "minn": "bbnni",
+    "menn": "bbnne",
+    "monn": "bbnno",
+    "moonn": "bbnno",
+    "munn": "bbnunn",
+    "mainn": "bbnnai",
+    "maunn": "bbnaunn",
+    "miann": "bbnnia",
+    "miunn": "bbnniu",
+    "mionn": "bbnnio",
+    "muann": "bbnnua",
+    "muinn": "bbnuinn",
+    "muainn": "bbnnuai",
+    "miaunn": "bbnniao",
+    "mm": "bbnm",
+    "mng": "bbnng",
+    "mah": "bbnah",
+    "mih": "bbnih",
+    "muh": "bbnuh",
+    "meh": "bbneh",
+    "moh": "bbnoh",
+    "mooh": "bbnooh",
+    "mirh": "bbnirh",
+    "meeh": "bbneeh",
+    "merh": "bbnerh",
+    "mauh": "bbnauh",
+    "miah": "bbniah",
+    "miuh": "bbniuh",
+    "mioh": "bbnioh",
+    "muah": "bbnuah",
+    "muih": "bbnuih",
+    "mueh": "bbnueh",
+    "mueeh": "bbnueeh",
+    "miauh": "bbniauh",
+    "mereh": "bbnereh",
+    "mannh": "bbnannh",
+    "minnh": "bbninnh",
+    "mennh": "bbnennh",
+    "monnh": "bbnonnh",
+    "mainnh": "bbnainnh",
+    "maunnh": "bbnaunnh",
+    "miannh": "bbniannh",
+    "miunnh": "bbniunnh",
+    "muannh": "bbnuannh",
+    "muinnh": "bbnuinnh",
+    "muainnh": "bbnuainnh",
+    "miaunnh": "bbniaunnh",
+    "mmh": "bbnmh",
+    "mngh": "bbnngh",
+    "map": "bbnap",
+    "mat": "bbnat",
+    "mak": "bbnak",
+    "mip": "bbnip",
+    "mit": "bbnit",
+    "mik": "bbnik",
+    "mut": "bbnut",
+    "mok": "bbnok",
+    "mop": "bbnop",
+    "merk": "bbnerk",
+    "miap": "bbniap",
+    "miat": "bbniat",
+    "miak": "bbniak",
+    "miok": "bbniok",
+    "muat": "bbnuat",
+    "ta": "da",
+    "ti": "di",
+    "tu": "du",
+    "te": "de",
+    "to": "do",
+    "too": "doo",
+    "tir": "dir",
+    "tee": "dee",
+    "ter": "der",
+    "tai": "dai",
+    "tau": "dao",
+    "tia": "dia",
+    "tiu": "diu",
+    "tio": "dio",
+    "tua": "dua",
+    "tui": "dui",
+    "tue": "due",
+    "tuee": "duee",
+    "tiau": "diao",
+    "tuai": "duai",
+    "tere": "dere",
+    "tam": "dam",
+    "tan": "dan",
+    "tang": "dang",
+    "tim": "dim",
+    "tin": "din",
+    "ting": "ding",
+    "tun": "dun",
+    "tong": "dong",
+    "tom": "dom",
+    "terng": "derng",
+    "tiam": "diam",
+    "tian": "dian",
+    "tiang": "diang",
+    "tiong": "diong",
+    "tuan": "duan",
+    "tuang": "duang",
+    "tann": "dann",
+    "tinn": "dni",
+    "tenn": "dne",
+    "tonn": "dno",
+    "toonn": "dno",
+    "tunn": "dunn",
+    "tainn": "dnai",
+    "taunn": "daunn",
+    "tiann": "dnia",
+    "tiunn": "dniu",
+    "tionn": "dnio",
+    "tuann": "dnua",
+    "tuinn": "duinn",
+    "tuainn": "dnuai",
+    "tiaunn": "dniao",
+    "tm": "dm",
+    "tng": "dng",
+    "tah": "dah",
+    "tih": "dih",
+    "tuh": "duh",
+    "teh": "deh",
+    "toh": "doh",
+    "tooh": "dooh",
+    "tirh": "dirh",
+    "teeh": "deeh",
+    "terh": "derh",
+    "tauh": "dauh",
+    "tiah": "diah",
+    "tiuh": "diuh",
+    "tioh": "dioh",
+    "tuah": "duah",
+    "tuih": "duih",
+    "tueh": "dueh",
+    "tueeh": "dueeh",
+    "tiauh": "diauh",
+    "tereh": "dereh",
+    "tannh": "dannh",
+    "tinnh": "dinnh",
+    "tennh": "dennh",
+    "tonnh": "donnh",
+    "tainnh": "dainnh",
+    "taunnh": "daunnh",
+    "tiannh": "diannh",
+    "tiunnh": "diunnh",
+    "tuannh": "duannh",
+    "tuinnh": "duinnh",
+    "tuainnh": "duainnh",
+    "tiaunnh": "diaunnh",
+    "tmh": "dmh",
+    "tngh": "dngh",
+    "tap": "dap",
+    "tat": "dat",
+    "tak": "dak",
+    "tip": "dip",
+    "tit": "dit",
+    "tik": "dik",
+    "tut": "dut",
+    "tok": "dok",
+    "top": "dop",
+    "terk": "derk",
+    "tiap": "diap",
+    "tiat": "diat",
+    "tiak": "diak",
+    "tiok": "diok",
+    "tuat": "duat",
+    "na": "lna",
+    "ni": "lni",
+    "nu": "lnu",
+    "ne": "lne",
+    "no": "lno",
+    "noo": "lnoo",
+    "nir": "lnir",
+    "nee": "lnee",
+    "ner": "lner",
+    "nai": "lnai",
+    "nau": "lnao",
+    "nia": "lnia",
+    "niu": "lniu",
+    "nio": "lnio",
+    "nua": "lnua",
+    "nui": "lnui",
+    "nue": "lnue",
+    "nuee": "lnuee",
+    "niau": "lniao",
+    "nuai": "lnuai",
+    "nere": "lnere",
+    "nam": "lnam",
+    "nan": "lnan",
+    "nang": "lnang",
+    "nim": "lnim",
+    "nin": "lnin",
+    "ning": "lning",
+    "nun": "lnun",
+    "nong": "lnong",
+    "nom": "lnom",
+    "nerng": "lnerng",
+    "niam": "lniam",
+    "nian": "lnian",
+    "niang": "lniang",
+    "niong": "lniong",
+    "nuan": "lnuan",
+    "nuang": "lnuang",
+    "nann": "lnann",
+    "ninn": "lnni",
+    "nenn": "lnne",
+    "nonn": "lnno",
+    "noonn": "lnno",
+    "nunn": "lnunn",
+    "nainn": "lnnai",
+    "naunn": "lnaunn",
+    "niann": "lnnia",
+    "niunn": "lnniu",
+    "nionn": "lnnio",
+    "nuann": "lnnua",
+    "nuinn": "lnuinn",
+    "nuainn": "lnnuai",
+    "niaunn": "lnniao",
+    "nm": "lnm",
+    "nng": "lnng",
+    "nah": "lnah",
+    "nih": "lnih",
+    "nuh": "lnuh",
+    "neh": "lneh",
+    "noh": "lnoh",
+    "nooh": "lnooh",
+    "nirh": "lnirh",
+    "neeh": "lneeh",
+    "nerh": "lnerh",
+    "nauh": "lnauh",
+    "niah": "lniah",
+    "niuh": "lniuh",
+    "nioh": "lnioh",
+    "nuah": "lnuah",
+    "nuih": "lnuih",
+    "nueh": "lnueh",
+    "nueeh": "lnueeh",
+    "niauh": "lniauh",
+    "nereh": "lnereh",
+    "nannh": "lnannh",
+    "ninnh": "lninnh",
+    "nennh": "lnennh",
+    "nonnh": "lnonnh",
+    "nainnh": "lnainnh",
+    "naunnh": "lnaunnh",
+    "niannh": "lniannh",
+    "niunnh": "lniunnh",
+    "nuannh": "lnuannh",
+    "nuinnh": "lnuinnh",
+    "nuainnh": "lnuainnh",
+    "niaunnh": "lniaunnh",
+    "nmh": "lnmh",
+    "nngh": "lnngh",
+    "nap": "lnap",
+    "nat": "lnat",
+    "nak": "lnak",
+    "nip": "lnip",
+    "nit": "lnit",
+    "nik": "lnik",
+    "nut": "lnut",
+    "nok": "lnok",
+    "nop": "lnop",
+    "nerk": "lnerk",
+    "niap": "lniap",
+    "niat": "lniat",
+    "niak": "lniak",
+    "niok": "lniok",
+    "nuat": "lnuat",
+    "la": "la",
+    "li": "li",
+    "lu": "lu",
+    "le": "le",
+    "lo": "lo",
+    "loo": "loo",
+    "lir": "lir",
+    "lee": "lee",
+    "ler": "ler",
+    "lai": "lai",
+    "lau": "lao",
+    "lia": "lia",
+    "liu": "liu",
+    "lio": "lio",
+    "lua": "lua",
+    "lui": "lui",
+    "lue": "lue",
+    "luee": "luee",
+    "liau": "liao",
+    "luai": "luai",
+    "lere": "lere",
+    "lam": "lam",
+    "lan": "lan",
+    "lang": "lang",
+    "lim": "lim",
+    "lin": "lin",
+    "ling": "ling",
+    "lun": "lun",
+    "long": "long",
+    "lom": "lom",
+    "lerng": "lerng",
+    "liam": "liam",
+    "lian": "lian",
+    "liang": "liang",
+    "liong": "liong",
+    "luan": "luan",
+    "luang": "luang",
+    "lann": "lann",
+    "linn": "lni",
+    "lenn": "lne",
+    "lonn": "lno",
+    "loonn": "lno",
+    "lunn": "lunn",
+    "lainn": "lnai",
+    "launn": "launn",
+    "liann": "lnia",
+    "liunn": "lniu",
+    "lionn": "lnio",
+    "luann": "lnua",
+    "luinn": "luinn",
+    "luainn": "lnuai",
+    "liaunn": "lniao",
+    "lm": "lm",
+    "lng": "lng",
+    "lah": "lah",
+    "lih": "lih",
+    "luh": "luh",
+    "leh": "leh",
+    "loh": "loh",
+    "looh": "looh",
+    "lirh": "lirh",
+    "leeh": "leeh",
+    "lerh": "lerh",
+    "lauh": "lauh",
+    "liah": "liah",
+    "liuh": "liuh",
+    "lioh": "lioh",
+    "luah": "luah",
+    "luih": "luih",
+    "lueh": "lueh",
+    "lueeh": "lueeh",
+    "liauh": "liauh",
+    "lereh": "lereh",
+    "lannh": "lannh",
+    "linnh": "linnh",
+    "lennh": "lennh",
+    "lonnh": "lonnh",
+    "lainnh": "lainnh",
+    "launnh": "launnh",
+    "liannh": "liannh",
+    "liunnh": "liunnh",
+    "luannh": "luannh",
+    "luinnh": "luinnh",
+    "luainnh": "luainnh",
+    "liaunnh": "liaunnh",
+    "lmh": "lmh",
+    "lngh": "lngh",
+    "lap": "lap",
+    "lat": "lat",
+    "lak": "lak",
+    "lip": "lip",
+    "lit": "lit",
+    "lik": "lik",
+    "lut": "lut",
+    "lok": "lok",
+    "lop": "lop",
+    "lerk": "lerk",
+    "liap": "liap",
+    "liat": "liat",
+    "liak": "liak",
+    "liok": "liok",
+    "luat": "luat",
+    "za": "za",
+    "zi": "zi",
+    "zu": "zu",
+    "ze": "ze",
+    "zo": "zo",
+    "zoo": "zoo",
+    "zir": "zir",
+    "zee": "zee",
+    "zer": "zer",
+    "zai": "zai",
+    "zau": "zao",
+    "zia": "zia",
+    "ziu": "ziu",
+    "zio": "zio",
+    "zua": "zua",
+    "zui": "zui",
+    "zue": "zue",
+    "zuee": "zuee",
+    "ziau": "ziao",
+    "zuai": "zuai",
+    "zere": "zere",
+    "zam": "zam",
+    "zan": "zan",
+    "zang": "zang",
+    "zim": "zim",
+    "zin": "zin",
+    "zing": "zing",
+    "zun": "zun",
+    "zong": "zong",
+    "zom": "zom",
+    "zerng": "zerng",
+    "ziam": "ziam",
+    "zian": "zian",
+    "ziang": "ziang",
+    "ziong": "ziong",
+    "zuan": "zuan",
+    "zuang": "zuang",
+    "zann": "zann",
+    "zinn": "zni",
+    "zenn": "zne",
+    "zonn": "zno",
+    "zoonn": "zno",
+    "zunn": "zunn",
+    "zainn": "znai",
+    "zaunn": "zaunn",
+    "ziann": "znia",
+    "ziunn": "zniu",
+    "zionn": "znio",
+    "zuann": "znua",
+    "zuinn": "zuinn",
+    "zuainn": "znuai",
+    "ziaunn": "zniao",
+    "zm": "zm",
+    "zng": "zng",
+    "zah": "zah",
+    "zih": "zih",
+    "zuh": "zuh",
+    "zeh": "zeh",
+    "zoh": "zoh",
+    "zooh": "zooh",
+    "zirh": "zirh",
+    "zeeh": "zeeh",
+    "zerh": "zerh",
+    "zauh": "zauh",
+    "ziah": "ziah",
+    "ziuh": "ziuh",
+    "zioh": "zioh",
+    "zuah": "zuah",
+    "zuih": "zuih",
+    "zueh": "zueh",
+    "zueeh": "zueeh",
+    "ziauh": "ziauh",
+    "zereh": "zereh",
+    "zannh": "zannh",
+    "zinnh": "zinnh",
+    "zennh": "zennh",
+    "zonnh": "zonnh",
+    "zainnh": "zainnh",
+    "zaunnh": "zaunnh",
+    "ziannh": "ziannh",
+    "ziunnh": "ziunnh",
+    "zuannh": "zuannh",
+    "zuinnh": "zuinnh",
+    "zuainnh": "zuainnh",
+    "ziaunnh": "ziaunnh",
+    "zmh": "zmh",
+    "zngh": "zngh",
+    "zap": "zap",
+    "zat": "zat",
+    "zak": "zak",
+    "zip": "zip",
+    "zit": "zit",
+    "zik": "zik",
+    "zut": "zut",
+    "zok": "zok",
+    "zop": "zop",
+    "zerk": "zerk",
+    "ziap": "ziap",
+    "ziat": "ziat",
+    "ziak": "ziak",
+    "ziok": "ziok",
+    "zuat": "zuat",
+    "ja": "zza",
+    "ji": "zzi",
+    "ju": "zzu",
+    "je": "zze",
+    "jo": "zzo",
+    "joo": "zzoo",
+    "jir": "zzir",
+    "jee": "zzee",
+    "jer": "zzer",
+    "jai": "zzai",
+    "jau": "zzao",
+    "jia": "zzia",
+    "jiu": "zziu",
+    "jio": "zzio",
+    "jua": "zzua",
+    "jui": "zzui",
+    "jue": "zzue",
+    "juee": "zzuee",
+    "jiau": "zziao",
+    "juai": "zzuai",
+    "jere": "zzere",
+    "jam": "zzam",
+    "jan": "zzan",
+    "jang": "zzang",
+    "jim": "zzim",
+    "jin": "zzin",
+    "jing": "zzing",
+    "jun": "zzun",
+    "jong": "zzong",
+    "jom": "zzom",
+    "jerng": "zzerng",
+    "jiam": "zziam",
+    "jian": "zzian",
+    "jiang": "zziang",
+    "jiong": "zziong",
+    "juan": "zzuan",
+    "juang": "zzuang",
+    "jann": "zzann",
+    "jinn": "zzni",
+    "jenn": "zzne",
+    "jonn": "zzno",
+    "joonn": "zzno",
+    "junn": "zzunn",
+    "jainn": "zznai",
+    "jaunn": "zzaunn",
+    "jiann": "zznia",
+    "jiunn": "zzniu",
+    "jionn": "zznio",
+    "juann": "zznua",
+    "juinn": "zzuinn",
+    "juainn": "zznuai",
+    "jiaunn": "zzniao",
+    "jm": "zzm",
+    "jng": "zzng",
+    "jah": "zzah",
+    "jih": "zzih",
+    "juh": "zzuh",
+    "jeh": "zzeh",
+    "joh": "zzoh",
+    "jooh": "zzooh",
+    "jirh": "zzirh",
+    "jeeh": "zzeeh",
+    "jerh": "zzerh",
+    "jauh": "zzauh",
+    "jiah": "zziah",
+    "jiuh": "zziuh",
+    "jioh": "zzioh",
+    "juah": "zzuah",
+    "juih": "zzuih",
+    "jueh": "zzueh",
+    "jueeh": "zzueeh",
+    "jiauh": "zziauh",
+    "jereh": "zzereh",
+    "jannh": "zzannh",
+    "jinnh": "zzinnh",
+    "jennh": "zzennh",
+    "jonnh": "zzonnh",
+    "jainnh": "zzainnh",
+    "jaunnh": "zzaunnh",
+    "jiannh": "zziannh",
+    "jiunnh": "zziunnh",
+    "juannh": "zzuannh",
+    "juinnh": "zzuinnh",
+    "juainnh": "zzuainnh",
+    "jiaunnh": "zziaunnh",
+    "jmh": "zzmh",
+    "jngh": "zzngh",
+    "jap": "zzap",
+    "jat": "zzat",
+    "jak": "zzak",
+    "jip": "zzip",
+    "jit": "zzit",
+    "jik": "zzik",
+    "jut": "zzut",
+    "jok": "zzok",
+    "jop": "zzop",
+    "jerk": "zzerk",
+    "jiap": "zziap",
+    "jiat": "zziat",
+    "jiak": "zziak",
+    "jiok": "zziok",
+    "juat": "zzuat",
+    "ca": "ca",
+    "ci": "ci",
+    "cu": "cu",
+    "ce": "ce",
+    "co": "co",
+    "coo": "coo",
+    "cir": "cir",
+    "cee": "cee",
+    "cer": "cer",
+    "cai": "cai",
+    "cau": "cao",
+    "cia": "cia",
+    "ciu": "ciu",
+    "cio": "cio",
+    "cua": "cua",
+    "cui": "cui",
+    "cue": "cue",
+    "cuee": "cuee",
+    "ciau": "ciao",
+    "cuai": "cuai",
+    "cere": "cere",
+    "cam": "cam",
+    "can": "can",
+    "cang": "cang",
+    "cim": "cim",
+    "cin": "cin",
+    "cing": "cing",
+    "cun": "cun",
+    "cong": "cong",
+    "com": "com",
+    "cerng": "cerng",
+    "ciam": "ciam",
+    "cian": "cian",
+    "ciang": "ciang",
+    "ciong": "ciong",
+    "cuan": "cuan",
+    "cuang": "cuang",
+    "cann": "cann",
+    "cinn": "cni",
+    "cenn": "cne",
+    "conn": "cno",
+    "coonn": "cno",
+    "cunn": "cunn",
+    "cainn": "cnai",
+    "caunn": "caunn",
+    "ciann": "cnia",
+    "ciunn": "cniu",
+    "cionn": "cnio",
+    "cuann": "cnua",
+    "cuinn": "cuinn",
+    "cuainn": "cnuai",
+    "ciaunn": "cniao",
+    "cm": "cm",
+    "cng": "cng",
+    "cah": "cah",
+    "cih": "cih",
+    "cuh": "cuh",
+    "ceh": "ceh",
+    "coh": "coh",
+    "cooh": "cooh",
+    "cirh": "cirh",
+    "ceeh": "ceeh",
+    "cerh": "cerh",
+    "cauh": "cauh",
+    "ciah": "ciah",
+    "ciuh": "ciuh",
+    "cioh": "cioh",
+    "cuah": "cuah",
+    "cuih": "cuih",
+    "cueh": "cueh",
+    "cueeh": "cueeh",
+    "ciauh": "ciauh",
+    "cereh": "cereh",
+    "cannh": "cannh",
+    "cinnh": "cinnh",
+    "cennh": "cennh",
+    "connh": "connh",
+    "cainnh": "cainnh",
+    "caunnh": "caunnh",
+    "ciannh": "ciannh",
+    "ciunnh": "ciunnh",
+    "cuannh": "cuannh",
+    "cuinnh": "cuinnh",
+    "cuainnh": "cuainnh",
+    "ciaunnh": "ciaunnh",
+    "cmh": "cmh",
+    "cngh": "cngh",
+    "cap": "cap",
+    "cat": "cat",
+    "cak": "cak",
+    "cip": "cip",
+    "cit": "cit",
+    "cik": "cik",
+    "cut": "cut",
+    "cok": "cok",
+    "cop": "cop",
+    "cerk": "cerk",
+    "ciap": "ciap",
+    "ciat": "ciat",
+    "ciak": "ciak",
+    "ciok": "ciok",
+    "cuat": "cuat",
+    "sa": "sa",
+    "si": "si",
+    "su": "su",
+    "se": "se",
+    "so": "so",
+    "soo": "soo",
+    "sir": "sir",
+    "see": "see",
+    "ser": "ser",
+    "sai": "sai",
+    "sau": "sao",
+    "sia": "sia",
+    "siu": "siu",
+    "sio": "sio",
+    "sua": "sua",
+    "sui": "sui",
+    "sue": "sue",
+    "suee": "suee",
+    "siau": "siao",
+    "suai": "suai",
+    "sere": "sere",
+    "sam": "sam",
+    "san": "san",
+    "sang": "sang",
+    "sim": "sim",
+    "sin": "sin",
+    "sing": "sing",
+    "sun": "sun",
+    "song": "song",
+    "som": "som",
+    "serng": "serng",
+    "siam": "siam",
+    "sian": "sian",
+    "siang": "siang",
+    "siong": "siong",
+    "suan": "suan",
+    "suang": "suang",
+    "sann": "sann",
+    "sinn": "sni",
+    "senn": "sne",
+    "sonn": "sno",
+    "soonn": "sno",
+    "sunn": "sunn",
+    "sainn": "snai",
+    "saunn": "saunn",
+    "siann": "snia",
+    "siunn": "sniu",
+    "sionn": "snio",
+    "suann": "snua",
+    "suinn": "suinn",
+    "suainn": "snuai",
+    "siaunn": "sniao",
+    "sm": "sm",
+    "sng": "sng",
+    "sah": "sah",
+    "sih": "sih",
+    "suh": "suh",
+    "seh": "seh",
+    "soh": "soh",
+    "sooh": "sooh",
+    "sirh": "sirh",
+    "seeh": "seeh",
+    "serh": "serh",
+    "sauh": "sauh",
+    "siah": "siah",
+    "siuh": "siuh",
+    "sioh": "sioh",
+    "suah": "suah",
+    "suih": "suih",
+    "sueh": "sueh",
+    "sueeh": "sueeh",
+    "siauh": "siauh",
+    "sereh": "sereh",
+    "sannh": "sannh",
+    "sinnh": "sinnh",
+    "sennh": "sennh",
+    "sonnh": "sonnh",
+    "sainnh": "sainnh",
+    "saunnh": "saunnh",
+    "siannh": "siannh",
+    "siunnh": "siunnh",
+    "suannh": "suannh",
+    "suinnh": "suinnh",
+    "suainnh": "suainnh",
+    "siaunnh": "siaunnh",
+    "smh": "smh",
+    "sngh": "sngh",
+    "sap": "sap",
+    "sat": "sat",
+    "sak": "sak",
+    "sip": "sip",
+    "sit": "sit",
+    "sik": "sik",
+    "sut": "sut",
+    "sok": "sok",
+    "sop": "sop",
+    "serk": "serk",
+    "siap": "siap",
+    "siat": "siat",
+    "siak": "siak",
+    "siok": "siok",
+    "suat": "suat",
+    "ka": "ga",
+    "ki": "gi",
+    "ku": "gu",
+    "ke": "ge",
+    "ko": "go",
+    "koo": "goo",
+    "kir": "gir",
+    "kee": "gee",
+    "ker": "ger",
+    "kai": "gai",
+    "kau": "gao",
+    "kia": "gia",
+    "kiu": "giu",
+    "kio": "gio",
+    "kua": "gua",
+    "kui": "gui",
+    "kue": "gue",
+    "kuee": "guee",
+    "kiau": "giao",
+    "kuai": "guai",
+    "kere": "gere",
+    "kam": "gam",
+    "kan": "gan",
+    "kang": "gang",
+    "kim": "gim",
+    "kin": "gin",
+    "king": "ging",
+    "kun": "gun",
+    "kong": "gong",
+    "kom": "gom",
+    "kerng": "gerng",
+    "kiam": "giam",
+    "kian": "gian",
+    "kiang": "giang",
+    "kiong": "giong",
+    "kuan": "guan",
+    "kuang": "guang",
+    "kann": "gann",
+    "kinn": "gni",
+    "kenn": "gne",
+    "konn": "gno",
+    "koonn": "gno",
+    "kunn": "gunn",
+    "kainn": "gnai",
+    "kaunn": "gaunn",
+    "kiann": "gnia",
+    "kiunn": "gniu",
+    "kionn": "gnio",
+    "kuann": "gnua",
+    "kuinn": "guinn",
+    "kuainn": "gnuai",
+    "kiaunn": "gniao",
+    "km": "gm",
+    "kng": "gng",
+    "kah": "gah",
+    "kih": "gih",
+    "kuh": "guh",
+    "keh": "geh",
+    "koh": "goh",
+    "kooh": "gooh",
+    "kirh": "girh",
+    "keeh": "geeh",
+    "kerh": "gerh",
+    "kauh": "gauh",
+    "kiah": "giah",
+    "kiuh": "giuh",
+    "kioh": "gioh",
+    "kuah": "guah",
+    "kuih": "guih",
+    "kueh": "gueh",
+    "kueeh": "gueeh",
+    "kiauh": "giauh",
+    "kereh": "gereh",
+    "kannh": "gannh",
+    "kinnh": "ginnh",
+    "kennh": "gennh",
+    "konnh": "gonnh",
+    "kainnh": "gainnh",
+    "kaunnh": "gaunnh",
+    "kiannh": "giannh",
+    "kiunnh": "giunnh",
+    "kuannh": "guannh",
+    "kuinnh": "guinnh",
+    "kuainnh": "guainnh",
+    "kiaunnh": "giaunnh",
+    "kmh": "gmh",
+    "kngh": "gngh",
+    "kap": "gap",
+    "kat": "gat",
+    "kak": "gak",
+    "kip": "gip",
+    "kit": "git",
+    "kik": "gik",
+    "kut": "gut",
+    "kok": "gok",
+    "kop": "gop",
+    "kerk": "gerk",
+    "kiap": "giap",
+    "kiat": "giat",
+    "kiak": "giak",
+    "kiok": "giok",
+    "kuat": "guat",
+    "ga": "gga",
+    "gi": "ggi",
+    "gu": "ggu",
+    "ge": "gge",
+    "go": "ggo",
+    "goo": "ggoo",
+    "gir": "ggir",
+    "gee": "ggee",
+    "ger": "gger",
+    "gai": "ggai",
+    "gau": "ggao",
+    "gia": "ggia",
+    "giu": "ggiu",
+    "gio": "ggio",
+    "gua": "ggua",
+    "gui": "ggui",
+    "gue": "ggue",
+    "guee": "gguee",
+    "giau": "ggiao",
+    "guai": "gguai",
+    "gere": "ggere",
+    "gam": "ggam",
+    "gan": "ggan",
+    "gang": "ggang",
+    "gim": "ggim",
+    "gin": "ggin",
+    "ging": "gging",
+    "gun": "ggun",
+    "gong": "ggong",
+    "gom": "ggom",
+    "gerng": "ggerng",
+    "giam": "ggiam",
+    "gian": "ggian",
+    "giang": "ggiang",
+    "giong": "ggiong",
+    "guan": "gguan",
+    "guang": "gguang",
+    "gann": "ggann",
+    "ginn": "ggni",
+    "genn": "ggne",
+    "gonn": "ggno",
+    "goonn": "ggno",
+    "gunn": "ggunn",
+    "gainn": "ggnai",
+    "gaunn": "ggaunn",
+    "giann": "ggnia",
+    "giunn": "ggniu",
+    "gionn": "ggnio",
+    "guann": "ggnua",
+    "guinn": "gguinn",
+    "guainn": "ggnuai",
+    "giaunn": "ggniao",
+    "gm": "ggm",
+    "gng": "ggng",
+    "gah": "ggah",
+    "gih": "ggih",
+    "guh": "gguh",
+    "geh": "ggeh",
+    "goh": "ggoh",
+    "gooh": "ggooh",
+    "girh": "ggirh",
+    "geeh": "ggeeh",
+    "gerh": "ggerh",
+    "gauh": "ggauh",
+    "giah": "ggiah",
+    "giuh": "ggiuh",
+    "gioh": "ggioh",
+    "guah": "gguah",
+    "guih": "gguih",
+    "gueh": "ggueh",
+    "gueeh": "ggueeh",
+    "giauh": "ggiauh",
+    "gereh": "ggereh",
+    "gannh": "ggannh",
+    "ginnh": "gginnh",
+    "gennh": "ggennh",
+    "gonnh": "ggonnh",
+    "gainnh": "ggainnh",
+    "gaunnh": "ggaunnh",
+    "giannh": "ggiannh",
+    "giunnh": "ggiunnh",
+    "guannh": "gguannh",
+    "guinnh": "gguinnh",
+    "guainnh": "gguainnh",
+    "giaunnh": "ggiaunnh",
+    "gmh": "ggmh",
+    "gngh": "ggngh",
+    "gap": "ggap",
+    "gat": "ggat",
+    "gak": "ggak",
+    "gip": "ggip",
+    "git": "ggit",
+    "gik": "ggik",
+    "gut": "ggut",
+    "gok": "ggok",
+    "gop": "ggop",
+    "gerk": "ggerk",
+    "giap": "ggiap",
+    "giat": "ggiat",
+    "giak": "ggiak",
+    "giok": "ggiok",
+    "guat": "gguat",
+    "ha": "ha",
+    "hi": "hi",
+    "hu": "hu",
+    "he": "he",
+    "ho": "ho",
+    "hoo": "hoo",
+    "hir": "hir",
+    "hee": "hee",
+    "her": "her",
+    "hai": "hai",
+    "hau": "hao",
+    "hia": "hia",
+    "hiu": "hiu",
+    "hio": "hio",
+    "hua": "hua",
+    "hui": "hui",
+    "hue": "hue",
+    "huee": "huee",
+    "hiau": "hiao",
+    "huai": "huai",
+    "here": "here",
+    "ham": "ham",
+    "han": "han",
+    "hang": "hang",
+    "him": "him",
+    "hin": "hin",
+    "hing": "hing",
+    "hun": "hun",
+    "hong": "hong",
+    "hom": "hom",
+    "herng": "herng",
+    "hiam": "hiam",
+    "hian": "hian",
+    "hiang": "hiang",
+    "hiong": "hiong",
+    "huan": "huan",
+    "huang": "huang",
+    "hann": "hann",
+    "hinn": "hni",
+    "henn": "hne",
+    "honn": "hno",
+    "hoonn": "hno",
+    "hunn": "hunn",
+    "hainn": "hnai",
+    "haunn": "haunn",
+    "hiann": "hnia",
+    "hiunn": "hniu",
+    "hionn": "hnio",
+    "huann": "hnua",
+    "huinn": "huinn",
+    "huainn": "hnuai",
+    "hiaunn": "hniao",
+    "hm": "hm",
+    "hng": "hng",
+    "hah": "hah",
+    "hih": "hih",
+    "huh": "huh",
+    "heh": "heh",
+    "hoh": "hoh",
+    "hooh": "hooh",
+    "hirh": "hirh",
+    "heeh": "heeh",
+    "herh": "herh",
+    "hauh": "hauh",
+    "hiah": "hiah",
+    "hiuh": "hiuh",
+    "hioh": "hioh",
+    "huah": "huah",
+    "huih": "huih",
+    "hueh": "hueh",
+    "hueeh": "hueeh",
+    "hiauh": "hiauh",
+    "hereh": "hereh",
+    "hannh": "hannh",
+    "hinnh": "hinnh",
+    "hennh": "hennh",
+    "honnh": "honnh",
+    "hainnh": "hainnh",
+    "haunnh": "haunnh",
+    "hiannh": "hiannh",
+    "hiunnh": "hiunnh",
+    "huannh": "huannh",
+    "huinnh": "huinnh",
+    "huainnh": "huainnh",
+    "hiaunnh": "hiaunnh",
+    "hmh": "hmh",
+    "hngh": "hngh",
+    "hap": "hap",
+    "hat": "hat",
+    "hak": "hak",
+    "hip": "hip",
+    "hit": "hit",
+    "hik": "hik",
+    "hut": "hut",
+    "hok": "hok",
+    "hop": "hop",
+    "herk": "herk",
+    "hiap": "hiap",
+    "hiat": "hiat",
+    "hiak": "hiak",
+    "hiok": "hiok",
+    "huat": "huat",
+}
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+zu_im_transducer.py
+
+將注音按鍵方案（預設 bp_hong_im.schema.yaml）的按鍵規則編譯成單一個確定性的轉換器（transducer），
+批次進行「按鍵 ↔ BP 編碼」的轉換，並顯示各音節的方音符號。
+
+方案以 speller/alphabet、initials/finals 定義鍵盤，以 speller/algebra 將 BP 音節轉為按鍵，
+再以 translator/preedit_format 的 xlit/xform 將按鍵顯示為方音符號。逐字執行這些規則太慢，
+故編譯時只對字典音節表的每個音節執行一次：
+    - 按鍵：音節的正式拼寫（rime_algebra.main_spellings，只套用 xform、xlit，不含衍生拼寫）
+    - 方音符號：以 preedit_format 作用於該音節的按鍵
+    - 只收錄按鍵皆在 alphabet 中、最後一鍵為 finals（聲調鍵）、其餘各鍵皆不是 finals 的音節，
+      如此各音節的按鍵互不為前綴，按鍵可逐鍵確定地切分，不需回溯
+轉換器為一棵以按鍵為邊的字首樹，到達終點即輸出 (BP 音節, 方音符號) 並回到起點，耗時與按鍵數成正比。
+不同音節的按鍵相同時（如 lnai2 與 nai2），取字典頻率較高者；
+轉換結果中含這類按鍵的行會另加一欄標示，按鍵練習則略過這類詞條。
+
+音節之間有分隔符號（'）時，各音節方音符號的組合與 preedit_format 作用於整串按鍵的結果相同
+（編譯後以隨機多音節編碼比對）；沒有分隔符號時，preedit_format 的規則可能跨音節作用。
+
+用法：
+    python zu_im_transducer.py [schema_file] [--dict DICT] [--keys FILE | --codes FILE] [--output FILE]
+                               [--replay FILE] [--drill N] [--samples N]
+
+參數：
+    schema_file (可選): 方案檔路徑，預設值：專案根目錄下的 bp_hong_im.schema.yaml
+    --dict            : 字典檔，預設值：專案根目錄下的 bp_ji_khoo.dict.yaml
+    --keys            : 按鍵記錄檔（每行一筆），轉為「BP 編碼<tab>方音符號」
+    --codes           : BP 編碼檔（每行一筆），轉為「按鍵<tab>方音符號」
+                        （有無法轉換的部分，或按鍵對應多個音節時，另加一欄標示）
+    --output          : 轉換結果或練習題的輸出檔，預設輸出至螢幕
+    --replay          : 將按鍵記錄檔逐行交給候選字查詢引擎（rime_engine.py），統計查詢耗時
+    --drill           : 產生 N 題 bp_kb_zu_im 的按鍵練習（依字典 weight 由高至低取詞條）：
+                        「漢字<tab>BP 編碼<tab>方音符號<tab>按鍵」
+    --samples         : 編譯後比對的隨機多音節編碼筆數（預設：5000）
+
+範例：
+    python zu_im_transducer.py --keys typing.log --output typing.codes.tsv
+    python zu_im_transducer.py --drill 200 --output drill.tsv
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from rime_algebra import AlgebraError, Projection, build_prism, im_chat_piau, load_schema_rules, main_spellings
+from rime_config import ConfigError, get_node, resolve_config
+from rime_engine import CandidateEngine, latency_summary, read_entries
+from segment_im_chat import im_chat_frequency
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCHEMA = os.path.join(PROJECT_ROOT, "bp_hong_im.schema.yaml")
+DEFAULT_DICT = os.path.join(PROJECT_ROOT, "bp_ji_khoo.dict.yaml")
+
+# 字首樹節點中存放輸出的鍵
+_BOO = None
+
+
+class KeyTransducer:
+    """
+    按鍵 ↔ BP 音節的確定性轉換器。
+    keys_of 為 {音節: 按鍵}，display 為 {音節: 方音符號}；freq 為音節頻率，用於按鍵相同時的取捨。
+    """
+
+    def __init__(
+        self,
+        keys_of: dict[str, str],
+        display: dict[str, str],
+        alphabet: str,
+        finals: str,
+        delimiter: str = "'",
+        freq: dict[str, float] | None = None,
+    ):
+        self.delimiter = delimiter
+        self.kan_keh = set(delimiter) | {" "}
+        alphabet_set, finals_set = set(alphabet), set(finals)
+        freq = freq or {}
+
+        self.keys_of: dict[str, str] = {}
+        self.display = display
+        self.skipped: list[tuple[str, str]] = []  # (音節, 按鍵)：無法確定切分的按鍵
+        self.ambiguous: dict[str, list[str]] = {}  # 按鍵: [音節, ...]
+        by_keys: dict[str, list[str]] = {}
+        for s, keys in sorted(keys_of.items()):
+            if (
+                not keys
+                or not set(keys) <= alphabet_set
+                or keys[-1] not in finals_set
+                or any(ch in finals_set for ch in keys[:-1])
+            ):
+                self.skipped.append((s, keys))
+                continue
+            self.keys_of[s] = keys
+            by_keys.setdefault(keys, []).append(s)
+
+        self.trie: dict = {}
+        self.states = 1
+        for keys, im_chat in by_keys.items():
+            if len(im_chat) > 1:
+                self.ambiguous[keys] = im_chat
+            s = max(im_chat, key=lambda x: (freq.get(x, 0.0), x))
+            node = self.trie
+            for ch in keys:
+                if ch not in node:
+                    node[ch] = {}
+                    self.states += 1
+                node = node[ch]
+            node[_BOO] = (s, display.get(s, keys))
+
+    @classmethod
+    def from_files(cls, schema_path: str, dict_path: str) -> tuple["KeyTransducer", dict]:
+        """編譯方案的按鍵規則，回傳 (轉換器, {"algebra", "preedit_format", "delimiter", "im_chat"})。"""
+        rules = load_schema_rules(schema_path)
+        speller = get_node(resolve_config(schema_path), "speller") or {}
+        algebra, preedit = Projection(rules["algebra"]), Projection(rules["preedit_format"])
+        delimiter = str(speller.get("delimiter") or "'")
+        im_chat = im_chat_piau(dict_path)
+        keys_of = main_spellings(algebra, im_chat)
+        display = {s: preedit.apply(keys) for s, keys in keys_of.items()}
+        transducer = cls(
+            keys_of,
+            display,
+            str(speller.get("alphabet", "")),
+            str(speller.get("finals", "")),
+            delimiter,
+            im_chat_frequency(dict_path),
+        )
+        return transducer, {"algebra": algebra, "preedit_format": preedit, "delimiter": delimiter, "im_chat": im_chat}
+
+    def code_to_keys(self, code: str, delimiter: str | None = None) -> tuple[str, list[str]]:
+        """BP 編碼 → 按鍵（以 delimiter 分隔，預設為方案的分隔符號），回傳 (按鍵, [無法轉換的音節])。"""
+        delimiter = self.delimiter if delimiter is None else delimiter
+        keys, unknown = [], []
+        for s in code.replace("'", " ").split():
+            k = self.keys_of.get(s)
+            if k is None:
+                unknown.append(s)
+            else:
+                keys.append(k)
+        return delimiter.join(keys), unknown
+
+    def keys_to_code(self, keys: str) -> tuple[list[tuple[str, str]], list[int]]:
+        """
+        按鍵 → [(BP 音節, 方音符號), ...]，回傳 (音節, [無法轉換的按鍵位置])。
+        逐鍵沿字首樹前進，到達終點即輸出音節並回到起點；走不下去時略過一鍵後重新開始，
+        連續無法轉換的按鍵只記下第一個位置。
+        """
+        result: list[tuple[str, str]] = []
+        errors: list[int] = []
+        error_end = -1
+        trie = self.trie
+        node = trie
+        start = 0
+        i = 0
+        n = len(keys)
+        while i < n:
+            ch = keys[i]
+            if node is trie and ch in self.kan_keh:
+                i += 1
+                start = i
+                continue
+            child = node.get(ch)
+            if child is None:
+                if start != error_end:
+                    errors.append(start)
+                error_end = start + 1
+                i = start + 1
+                start = i
+                node = trie
+                continue
+            out = child.get(_BOO)
+            i += 1
+            if out is not None:
+                result.append(out)
+                node = trie
+                start = i
+            else:
+                node = child
+        if node is not trie and start != error_end:
+            errors.append(start)
+        return result, errors
+
+    def ambiguity(self, im_chat) -> list[str]:
+        """im_chat 中按鍵對應多個音節者，回傳 ["按鍵（音節/音節）", ...]（依出現順序，不重複）。"""
+        result = []
+        for s in im_chat:
+            keys = self.keys_of.get(s)
+            if keys in self.ambiguous:
+                item = f"{keys}（{'/'.join(self.ambiguous[keys])}）"
+                if item not in result:
+                    result.append(item)
+        return result
+
+    def keys_to_zu_im(self, keys: str, separator: str = " ") -> str:
+        """按鍵 → 方音符號（各音節以 separator 連接）。"""
+        return separator.join(display for _, display in self.keys_to_code(keys)[0])
+
+
+def verify(transducer: KeyTransducer, preedit: Projection, samples: int, seed: int = 0) -> tuple[int, list[str]]:
+    """
+    以隨機多音節編碼比對：轉換器的按鍵切回原音節，且各音節方音符號的組合
+    與 preedit_format 作用於整串按鍵（以分隔符號連接）的結果相同。回傳 (比對筆數, 結果不同的編碼)。
+    """
+    rng = random.Random(seed)
+    im_chat = sorted(s for s in transducer.keys_of if transducer.keys_of[s] not in transducer.ambiguous)
+    d = transducer.delimiter
+    codes = list(im_chat)
+    for _ in range(samples if im_chat else 0):
+        codes.append(" ".join(rng.choices(im_chat, k=rng.randint(2, 4))))
+    mismatched = []
+    for code in codes:
+        keys, _ = transducer.code_to_keys(code)
+        parsed, errors = transducer.keys_to_code(keys)
+        expected = preedit.apply(keys)
+        if errors or [s for s, _ in parsed] != code.split() or d.join(z for _, z in parsed) != expected:
+            mismatched.append(code)
+    return len(codes), mismatched
+
+
+def convert_lines(lines, func) -> tuple[list[str], int, int]:
+    """逐行轉換，回傳 (輸出行, 有無法轉換部分的行數, 含對應多個音節之按鍵的行數)。"""
+    out, failed, ambiguous = [], 0, 0
+    for line in lines:
+        line = line.rstrip("\r\n")
+        converted, bad, unsure = func(line)
+        failed += bool(bad)
+        ambiguous += bool(unsure)
+        out.append(converted)
+    return out, failed, ambiguous
+
+
+def _ambiguity_column(ambiguity: list[str]) -> str:
+    return f"\t按鍵對應多個音節：{' '.join(ambiguity)}" if ambiguity else ""
+
+
+def keys_line(transducer: KeyTransducer, line: str) -> tuple[str, bool, bool]:
+    parsed, errors = transducer.keys_to_code(line)
+    code = " ".join(s for s, _ in parsed)
+    zu_im = " ".join(z for _, z in parsed)
+    ambiguity = transducer.ambiguity(s for s, _ in parsed)
+    out = f"{code}\t{zu_im}" + (f"\t無法轉換的位置：{errors}" if errors else "") + _ambiguity_column(ambiguity)
+    return out, bool(errors), bool(ambiguity)
+
+
+def code_line(transducer: KeyTransducer, line: str) -> tuple[str, bool, bool]:
+    keys, unknown = transducer.code_to_keys(line)
+    im_chat = line.replace("'", " ").split()
+    zu_im = " ".join(transducer.display[s] for s in im_chat if s in transducer.keys_of)
+    ambiguity = transducer.ambiguity(im_chat)
+    out = f"{keys}\t{zu_im}" + (f"\t無法轉換的音節：{' '.join(unknown)}" if unknown else "") + _ambiguity_column(ambiguity)
+    return out, bool(unknown), bool(ambiguity)
+
+
+def drills(transducer: KeyTransducer, entries, n: int) -> list[str]:
+    """
+    bp_kb_zu_im 的按鍵練習：依 weight 由高至低取 n 筆所有音節皆可轉換的詞條；
+    含對應多個音節之按鍵的詞條（按鍵無法確定對應回該詞條的編碼）略過。
+    """
+    lines, seen = [], set()
+    for text, code, _ in sorted(entries, key=lambda e: -e[2]):
+        if len(lines) >= n:
+            break
+        keys, unknown = transducer.code_to_keys(code, delimiter=" ")
+        if unknown or (text, code) in seen or transducer.ambiguity(code.split()):
+            continue
+        seen.add((text, code))
+        zu_im = " ".join(transducer.display[s] for s in code.split())
+        lines.append(f"{text}\t{code}\t{zu_im}\t{keys}")
+    return lines
+
+
+def write_lines(path: str | None, lines: list[str]):
+    if path:
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.writelines(line + "\n" for line in lines)
+        print(f"已寫入 {path}（{len(lines)} 行）")
+    else:
+        for line in lines:
+            print(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="注音按鍵規則編譯成轉換器，批次轉換按鍵與 BP 編碼")
+    parser.add_argument("schema_file", nargs="?", default=DEFAULT_SCHEMA, help="方案檔路徑")
+    parser.add_argument("--dict", default=DEFAULT_DICT, help="字典檔路徑")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--keys", help="按鍵記錄檔，轉為 BP 編碼")
+    group.add_argument("--codes", help="BP 編碼檔，轉為按鍵")
+    parser.add_argument("--output", help="輸出檔路徑")
+    parser.add_argument("--replay", help="將按鍵記錄檔逐行交給候選字查詢引擎")
+    parser.add_argument("--drill", type=int, default=0, help="產生 N 題按鍵練習")
+    parser.add_argument("--samples", type=int, default=5000, help="編譯後比對的隨機多音節編碼筆數（預設：5000）")
+    args = parser.parse_args(argv)
+
+    for path in (args.schema_file, args.dict, args.keys, args.codes, args.replay):
+        if path and not os.path.exists(path):
+            print(f"錯誤：輸入檔案不存在 - {path}")
+            return 1
+
+    t0 = time.perf_counter()
+    try:
+        transducer, compiled = KeyTransducer.from_files(args.schema_file, args.dict)
+    except (AlgebraError, ConfigError) as e:
+        print(f"錯誤：{e}")
+        return 1
+    t1 = time.perf_counter()
+    # 轉換結果輸出至螢幕時，統計訊息改寫到 stderr，不混入輸出
+    log = sys.stderr if (args.keys or args.codes or args.drill) and not args.output else sys.stdout
+
+    print(
+        f"編譯：音節 {len(compiled['im_chat'])} 個 → 轉換器 {transducer.states} 個狀態"
+        f"（algebra {len(compiled['algebra'])} 條、preedit_format {len(compiled['preedit_format'])} 條規則，"
+        f"{t1 - t0:.3f} 秒）",
+        file=log,
+    )
+    if transducer.skipped:
+        listed = "、".join(f"{s}（{k}）" for s, k in transducer.skipped[:8])
+        print(f"    {len(transducer.skipped)} 個音節的按鍵無法確定切分，未收錄：{listed}", file=log)
+    if transducer.ambiguous:
+        listed = "、".join(f"{k}：{'/'.join(v)}" for k, v in list(transducer.ambiguous.items())[:5])
+        print(f"    {len(transducer.ambiguous)} 組按鍵對應多個音節，取字典頻率較高者：{listed}", file=log)
+
+    checked, mismatched = verify(transducer, compiled["preedit_format"], args.samples)
+    skipped = sum(len(v) for v in transducer.ambiguous.values())
+    print(
+        f"    比對 {checked} 個編碼（略過按鍵對應多個音節的 {skipped} 個音節），"
+        f"結果不同 {len(mismatched)} 個（{time.perf_counter() - t1:.3f} 秒）",
+        file=log,
+    )
+    for code in mismatched[:10]:
+        print(f"    {code!r}", file=log)
+
+    if args.keys or args.codes:
+        with open(args.keys or args.codes, encoding="utf-8") as f:
+            lines = f.readlines()
+        t2 = time.perf_counter()
+        if args.keys:
+            out, failed, ambiguous = convert_lines(lines, lambda line: keys_line(transducer, line))
+        else:
+            out, failed, ambiguous = convert_lines(lines, lambda line: code_line(transducer, line))
+        elapsed = time.perf_counter() - t2
+        print(
+            f"轉換 {len(lines)} 行（{elapsed:.3f} 秒），其中 {failed} 行有無法轉換的部分、"
+            f"{ambiguous} 行含對應多個音節的按鍵",
+            file=log,
+        )
+        write_lines(args.output, out)
+
+    if args.drill:
+        write_lines(args.output, drills(transducer, read_entries(args.dict), args.drill))
+
+    if args.replay:
+        prism = build_prism(compiled["algebra"], compiled["im_chat"])
+        engine = CandidateEngine(prism, read_entries(args.dict), compiled["delimiter"], transducer.keys_of)
+        with open(args.replay, encoding="utf-8") as f:
+            queries = [line.strip() for line in f if line.strip()]
+        seconds, empty = [], 0
+        t2 = time.perf_counter()
+        for query in queries:
+            t = time.perf_counter()
+            candidates = engine.lookup(query, 10)
+            seconds.append(time.perf_counter() - t)
+            empty += not candidates
+        summary = latency_summary(seconds)
+        print(f"重播 {len(queries)} 行（{time.perf_counter() - t2:.3f} 秒），查無候選字 {empty} 行")
+        if summary["count"]:
+            print(
+                f"    平均 {summary['mean_us']:.0f} µs、中位數 {summary['p50_us']:.0f} µs、"
+                f"p95 {summary['p95_us']:.0f} µs、最大 {summary['max_us']:.0f} µs"
+            )
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())